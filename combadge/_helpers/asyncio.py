@@ -0,0 +1,16 @@
+from asyncio import Task, create_task
+from collections.abc import Coroutine
+from typing import Any
+
+from combadge.core.typevars import AnyT
+
+_background_tasks: set[Task[Any]] = set()
+"""Strong references to the background tasks, otherwise they may get garbage-collected mid-execution."""
+
+
+def spawn(coroutine: Coroutine[Any, Any, AnyT]) -> Task[AnyT]:
+    """Run the coroutine in a background task, keeping the reference until it is done."""
+    task = create_task(coroutine)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
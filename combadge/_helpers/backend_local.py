@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Generic, TypeVar
+from weakref import WeakKeyDictionary
+
+_T = TypeVar("_T")
+
+
+class BackendLocal(Generic[_T]):
+    """
+    Marker state which is shared by all the methods bound to the same backend.
+
+    The backends are referenced weakly, so that the state goes away along with its backend.
+    """
+
+    __slots__ = ("_values", "_lock")
+
+    def __init__(self) -> None:  # noqa: D107
+        self._values: WeakKeyDictionary[Any, _T] = WeakKeyDictionary()
+        self._lock = Lock()
+
+    def get(self, service: Any, default: _T) -> _T:
+        """
+        Get the state of the service's backend.
+
+        Args:
+            service: bound service instance
+            default: state which gets stored if the backend does not have one yet,
+                and which is returned as is if the service is not bound to a backend
+        """
+        backend = getattr(service, "__combadge_backend__", None)
+        if backend is None:
+            return default
+        with self._lock:
+            value = self._values.get(backend)
+            if value is None:
+                value = self._values[backend] = default
+        return value
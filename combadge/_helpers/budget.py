@@ -0,0 +1,39 @@
+from threading import Lock
+
+
+class Budget:
+    """
+    Budget of the extra requests (such as retries or hedges) proportional to the regular traffic.
+
+    Each regular request deposits a fraction of a token, and each extra request withdraws a whole token.
+    Thus, the extra requests may never exceed the ratio of the regular ones (plus the initial burst),
+    which prevents them from multiplying the load during an outage.
+    """
+
+    __slots__ = ("_ratio", "_burst", "_tokens", "_lock")
+
+    def __init__(self, ratio: float, *, burst: float = 10.0) -> None:
+        """
+        Instantiate the budget.
+
+        Args:
+            ratio: allowed ratio of the extra requests to the regular ones
+            burst: maximum number of the accumulated tokens, the budget starts full
+        """
+        self._ratio = ratio
+        self._burst = burst
+        self._tokens = burst
+        self._lock = Lock()
+
+    def deposit(self) -> None:
+        """Account for a regular request."""
+        with self._lock:
+            self._tokens = min(self._tokens + self._ratio, self._burst)
+
+    def withdraw(self) -> bool:
+        """Try to spend a token on an extra request, return `False` if the budget is exhausted."""
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
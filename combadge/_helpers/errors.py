@@ -0,0 +1,79 @@
+"""
+Backend-agnostic classification of the backend client exceptions.
+
+The optional client libraries are only looked up in `sys.modules`: if a library has not been imported,
+then none of its exceptions may have been raised.
+"""
+
+from __future__ import annotations
+
+import sys
+from asyncio import TimeoutError as AsyncTimeoutError
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+_OVERLOAD_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def get_status_code(exception: BaseException) -> int | None:
+    """Get the HTTP status code of the failed response, if any."""
+    # HTTPX and `requests` attach the response, whereas Zeep only keeps the status code:
+    status_code = getattr(getattr(exception, "response", None), "status_code", None)
+    if status_code is None:
+        status_code = getattr(exception, "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def get_retry_after(exception: BaseException) -> float | None:
+    """Get the `Retry-After` delay (in seconds) of the failed response, if any."""
+    headers = getattr(getattr(exception, "response", None), "headers", None)
+    if headers is None or (value := headers.get("Retry-After")) is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def is_transport_error(exception: BaseException) -> bool:
+    """Check whether the request has failed on the transport level: connection, timeout, or protocol error."""
+    return isinstance(exception, (ConnectionError, TimeoutError, AsyncTimeoutError, *_get_transport_error_types()))
+
+
+def is_overload_error(exception: BaseException) -> bool:
+    """Check whether the failure indicates that the server is overloaded."""
+    return is_overload_status(get_status_code(exception)) or is_transport_error(exception)
+
+
+def is_overload_status(status_code: int | None) -> bool:
+    """Check whether the response status indicates that the server is overloaded."""
+    return status_code in _OVERLOAD_STATUS_CODES
+
+
+def is_connect_error(exception: BaseException) -> bool:
+    """Check whether the connection has failed to establish – meaning that the request has certainly not been sent."""
+    return isinstance(exception, (ConnectionRefusedError, *_get_connect_error_types()))
+
+
+def _get_transport_error_types() -> tuple[type[BaseException], ...]:
+    types: list[Any] = []
+    if (httpx := sys.modules.get("httpx")) is not None:
+        types.extend((httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError, httpx.ProxyError))
+    if (requests := sys.modules.get("requests")) is not None:
+        types.extend((requests.ConnectionError, requests.Timeout))
+    return tuple(types)
+
+
+def _get_connect_error_types() -> tuple[type[BaseException], ...]:
+    types: list[Any] = []
+    if (httpx := sys.modules.get("httpx")) is not None:
+        types.extend((httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+    if (requests := sys.modules.get("requests")) is not None:
+        types.append(requests.ConnectTimeout)
+    return tuple(types)
@@ -0,0 +1,82 @@
+from collections.abc import Callable, Mapping
+from hashlib import blake2b
+from inspect import signature as get_signature
+from json import dumps
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+
+Fingerprinter = Callable[[Any, tuple[Any, ...], Mapping[str, Any]], str]
+"""Computes a fingerprint of a service call from the service instance and the call arguments."""
+
+
+def make_fingerprinter(
+    method: Callable[..., Any],
+    *,
+    key: Callable[..., Any] | None = None,
+    portable: bool = False,
+) -> Fingerprinter:
+    """
+    Make a function which computes a canonical fingerprint of the method call.
+
+    The request is a deterministic function of the call arguments, so the fingerprint is computed
+    over the bound arguments (with defaults applied) rather than the request itself,
+    which allows skipping the request building altogether when the fingerprint is all that is needed.
+
+    Args:
+        method: bound method
+        key: function which receives the call arguments and returns the value to fingerprint instead of them
+        portable: whether the fingerprint must be stable across processes, see `get_fingerprint()`
+
+    Notes:
+        - Bound methods are inspected through `__wrapped__`, which leads to the protocol method.
+        - Lazily evaluated (callable) argument values are **not** called, and so they are fingerprinted by `repr()`
+          unless the fingerprint must be portable.
+    """
+    qualname = f"{method.__module__}.{method.__qualname__}"
+
+    if key is not None:
+
+        def fingerprint_key(service: Any, args: tuple[Any, ...], kwargs: Mapping[str, Any]) -> str:
+            return get_fingerprint(qualname, key(*args, **kwargs), portable=portable)
+
+        return fingerprint_key
+
+    bind = get_signature(method).bind
+
+    def fingerprint(service: Any, args: tuple[Any, ...], kwargs: Mapping[str, Any]) -> str:
+        bound_arguments = bind(service, *args, **kwargs)
+        bound_arguments.apply_defaults()
+        arguments = bound_arguments.arguments.copy()
+        arguments.pop("self", None)
+        return get_fingerprint(qualname, arguments, portable=portable)
+
+    return fingerprint
+
+
+def get_fingerprint(*values: Any, portable: bool = False) -> str:
+    """
+    Compute a canonical fingerprint of the values.
+
+    Args:
+        values: values to fingerprint
+        portable: whether the fingerprint must be stable across processes: values which are not JSON-serializable
+            get rejected, otherwise they are fingerprinted by `repr()`, which usually contains the memory address
+
+    Raises:
+        TypeError: a value is not JSON-serializable, while the fingerprint must be portable
+    """
+    canonical = dumps(
+        to_jsonable_python(values, fallback=_reject if portable else repr),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def _reject(value: Any) -> Any:
+    raise TypeError(
+        f"`{type(value).__name__}` value cannot be fingerprinted consistently across processes,"
+        " specify the key function",
+    )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import cast
+
+import httpcore
+from httpx import URL, AsyncClient, Client, Timeout
+
+
+def limit_timeout(timeout: Timeout, limit: float) -> Timeout:
+    """Cap each of the timeouts by the limit (in seconds), including the disabled ones."""
+    return Timeout(
+        connect=_min(timeout.connect, limit),
+        read=_min(timeout.read, limit),
+        write=_min(timeout.write, limit),
+        pool=_min(timeout.pool, limit),
+    )
+
+
+def max_timeout(timeouts: Iterable[Timeout]) -> Timeout:
+    """Take the longest of each of the timeouts, a disabled one being the longest."""
+    timeouts = list(timeouts)
+    return Timeout(
+        connect=_max(timeout.connect for timeout in timeouts),
+        read=_max(timeout.read for timeout in timeouts),
+        write=_max(timeout.write for timeout in timeouts),
+        pool=_max(timeout.pool for timeout in timeouts),
+    )
+
+
+@contextmanager
+def hold_connection(client: Client, url: URL | str) -> Iterator[None]:
+    """Take a connection from the pool by sending a `HEAD` request, and return it to the pool on exit."""
+    with client.stream("HEAD", url) as response:
+        yield
+        # An unread response gets its connection closed rather than returned to the pool:
+        response.read()
+
+
+@asynccontextmanager
+async def hold_connection_async(client: AsyncClient, url: URL | str) -> AsyncIterator[None]:
+    """Take a connection from the pool by sending a `HEAD` request, and return it to the pool on exit."""
+    async with client.stream("HEAD", url) as response:
+        yield
+        # An unread response gets its connection closed rather than returned to the pool:
+        await response.aread()
+
+
+def count_idle_connections(client: Client | AsyncClient, url: URL | str) -> int:
+    """
+    Count the idle pooled connections to the URL's origin.
+
+    Returns:
+        Number of the idle connections, or zero if the client's transport does not expose its pool.
+    """
+    url = URL(url)
+    # HTTPX does not expose the transport's connection pool, hence the private attributes:
+    pool = getattr(client._transport_for_url(url), "_pool", None)
+    if not isinstance(pool, (httpcore.ConnectionPool, httpcore.AsyncConnectionPool)):
+        return 0
+    origin = httpcore.URL(str(url)).origin
+    return sum(
+        connection.is_idle() and not connection.has_expired() and connection.can_handle_request(origin)
+        for connection in pool.connections
+    )
+
+
+def _min(timeout: float | None, limit: float) -> float:
+    return min(timeout, limit) if timeout is not None else limit
+
+
+def _max(timeouts: Iterable[float | None]) -> float | None:
+    timeouts = list(timeouts)
+    return None if None in timeouts else max(cast(list[float], timeouts))
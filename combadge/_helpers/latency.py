@@ -0,0 +1,44 @@
+from collections import deque
+from math import ceil
+from threading import Lock
+
+
+class LatencyWindow:
+    """Sliding window of the recent call latencies, which estimates their percentiles."""
+
+    __slots__ = ("_latencies", "_lock", "_min_samples", "_sorted", "_stale")
+
+    def __init__(self, size: int = 1000, *, min_samples: int = 20) -> None:
+        self._latencies: deque[float] = deque(maxlen=size)
+        self._lock = Lock()
+        self._min_samples = min_samples
+        self._sorted: list[float] = []
+        self._stale = 0
+        """Number of samples added since the last sort."""
+
+    def add(self, latency: float) -> None:
+        """Record the latency (in seconds)."""
+        with self._lock:
+            self._latencies.append(latency)
+            self._stale += 1
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Estimate the latency percentile.
+
+        The samples get re-sorted once a tenth of the window has been updated,
+        which keeps the estimation cheap enough to call it on every request.
+
+        Args:
+            q: percentile in the range `(0.0, 1.0]`
+
+        Returns:
+            The estimated latency, or `#!python None` if there are not enough samples yet.
+        """
+        with self._lock:
+            if len(self._latencies) < self._min_samples:
+                return None
+            if not self._sorted or self._stale * 10 >= len(self._latencies):
+                self._sorted = sorted(self._latencies)
+                self._stale = 0
+            return self._sorted[max(ceil(q * len(self._sorted)) - 1, 0)]
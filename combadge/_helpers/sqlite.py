@@ -0,0 +1,53 @@
+from os import PathLike, getpid
+from sqlite3 import Connection, connect
+
+_inherited_connections: list[Connection] = []
+"""
+Connections inherited from a parent process.
+
+They are kept referenced, so that they are never used nor closed in the child process.
+"""
+
+
+def connect_shared(path: str | PathLike[str], *, schema: str) -> Connection:
+    """
+    Open an SQLite database which is shared between threads and processes.
+
+    The database is switched to the write-ahead log mode, so that readers do not block the writer,
+    and the schema script is applied.
+    """
+    connection = connect(path, timeout=30.0, check_same_thread=False, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(schema)
+    return connection
+
+
+class SharedDatabase:
+    """
+    SQLite database which is shared between threads and processes.
+
+    The connection is opened lazily, once per process: an SQLite connection must not be carried over `fork()`,
+    so that a pre-forked worker opens its own connection instead of using the inherited one.
+
+    Note:
+        The connection is shared between threads, the callers must serialize the access to it.
+    """
+
+    __slots__ = ("_path", "_schema", "_pid", "_connection")
+
+    def __init__(self, path: str | PathLike[str], *, schema: str) -> None:
+        self._path = path
+        self._schema = schema
+        self._pid: int | None = None
+        self._connection: Connection | None = None
+
+    def connect(self) -> Connection:
+        """Get the connection of the current process, opening it if needed."""
+        pid = getpid()
+        if self._connection is None or self._pid != pid:
+            if self._connection is not None:
+                _inherited_connections.append(self._connection)
+            self._connection = connect_shared(self._path, schema=self._schema)
+            self._pid = pid
+        return self._connection
@@ -0,0 +1 @@
+"""Offline code generators which produce Combadge service protocols and models."""
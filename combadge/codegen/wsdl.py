@@ -0,0 +1,337 @@
+"""
+Generate Combadge service protocols and models from a WSDL document – requires `combadge[zeep]` extra.
+
+The WSDL gets parsed by Zeep only once, during the generation. The generated module depends solely
+on Combadge and Pydantic, so it may be imported without any schema parsing and type-checked with Mypy.
+
+Examples:
+    ```shell
+    python -m combadge.codegen.wsdl tests/integration/wsdl/NumberConversion.wsdl -o number_conversion.py
+    ```
+"""
+
+from __future__ import annotations
+
+import keyword
+import re
+from argparse import ArgumentParser
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from annotated_types import SLOTS
+from zeep import Client
+from zeep.xsd import ComplexType
+from zeep.xsd.types import builtins
+
+_BUILTIN_TYPES: tuple[tuple[type[Any], str, str | None], ...] = (
+    # Order matters: integer types are derived from `Decimal` in Zeep.
+    (builtins.Boolean, "bool", None),
+    (builtins.Integer, "int", None),
+    (builtins.Float, "float", None),
+    (builtins.Double, "float", None),
+    (builtins.Decimal, "Decimal", "decimal"),
+    (builtins.DateTime, "datetime", "datetime"),
+    (builtins.Date, "date", "datetime"),
+    (builtins.Time, "time", "datetime"),
+    (builtins.String, "str", None),
+    (builtins.AnyURI, "str", None),
+    (builtins.QName, "str", None),
+    (builtins.Base64Binary, "str", None),
+    (builtins.HexBinary, "str", None),
+)
+"""Mapping of the built-in XSD types onto Python types and their standard library modules."""
+
+_IMPORTS: dict[str, tuple[str, str]] = {
+    "abstractmethod": ("stdlib", "abc"),
+    "Callable": ("stdlib", "collections.abc"),
+    "Annotated": ("stdlib", "typing"),
+    "Any": ("stdlib", "typing"),
+    "Protocol": ("stdlib", "typing"),
+    "AfterValidator": ("third_party", "pydantic"),
+    "BaseModel": ("third_party", "pydantic"),
+    "Field": ("third_party", "pydantic"),
+    "RootModel": ("third_party", "pydantic"),
+    "SuccessfulResponse": ("first_party", "combadge.core.response"),
+    "Payload": ("first_party", "combadge.support.http.markers"),
+    "operation_name": ("first_party", "combadge.support.soap.markers"),
+    "BaseSoapFault": ("first_party", "combadge.support.soap.response"),
+}
+"""Names which may be used by the generated code, and their import sections and modules."""
+
+_MAX_LINE_LENGTH = 120
+
+_HAS_DETAIL_HELPER = '''
+def _has_detail(tag: str) -> Callable[[Any], Any]:
+    """Match a SOAP fault by the tag of its detail element."""
+
+    def validate(detail: Any) -> Any:
+        if detail is None or all(child.tag != tag for child in detail):
+            raise ValueError(f"`{tag}` is missing in the fault detail")
+        return detail
+
+    return validate
+'''
+
+
+def generate(
+    wsdl_path: str | Path,
+    *,
+    service_name: str | None = None,
+    port_name: str | None = None,
+    is_async: bool = False,
+) -> str:
+    """
+    Generate the module source code for the WSDL service.
+
+    Args:
+        wsdl_path: WSDL document path or URL
+        service_name: WSDL service name, the first service is used by default
+        port_name: WSDL port name, the first port is used by default
+        is_async: generate `async` protocol methods
+
+    Returns:
+        Source code of the generated module.
+    """
+    client = Client(str(wsdl_path))
+    service = client.wsdl.services[service_name] if service_name else next(iter(client.wsdl.services.values()))
+    port = service.ports[port_name] if port_name else next(iter(service.ports.values()))
+
+    generator = _Generator()
+    methods = [
+        generator.add_operation(operation_name, operation, is_async=is_async)
+        for operation_name, operation in port.binding._operations.items()
+    ]
+    return generator.render(
+        source=Path(str(wsdl_path)).name,
+        protocol_name=f"Supports{_to_class_name(service.name)}",
+        methods=methods,
+    )
+
+
+@dataclass(**SLOTS)
+class _Generator:
+    """Accumulates the generated models."""
+
+    models: list[str] = field(default_factory=list)
+    """Rendered model classes in the dependency order."""
+
+    imports: dict[str, str] = field(default_factory=lambda: {"Protocol": "typing", "abstractmethod": "abc"})
+    """Imported names and their modules."""
+
+    type_names: dict[int, str] = field(default_factory=dict)
+    """Generated model names by the XSD type object IDs."""
+
+    emitted_names: set[str] = field(default_factory=set)
+    """Model names that are already rendered."""
+
+    taken_names: set[str] = field(default_factory=set)
+    """All the reserved model names."""
+
+    needs_has_detail: bool = False
+    """Whether any fault model needs the detail matching helper."""
+
+    def add_operation(self, name: str, operation: Any, *, is_async: bool) -> str:
+        """Generate the operation models and return the rendered protocol method."""
+        request_model = self._add_request_model(name, operation.input.body)
+        response_model = self._add_response_model(name, operation.output.body)
+        fault_models = [
+            self._add_fault_model(fault_name, message)
+            for fault_name, message in operation.abstract.fault_messages.items()
+        ]
+
+        self._use("operation_name", "BaseSoapFault")
+        if request_model is None:
+            parameters = "self"
+        else:
+            self._use("Annotated", "Payload")
+            parameters = f"\n        self,\n        request: Annotated[{request_model}, Payload(by_alias=True)],\n    "
+        return_type = " | ".join((response_model, *fault_models, "BaseSoapFault"))
+        definition = f"    {'async ' if is_async else ''}def {_to_field_name(name)}({parameters}) -> {return_type}:"
+        if len(definition) > _MAX_LINE_LENGTH and request_model is None:
+            definition = definition.replace("(self)", "(\n        self,\n    )", 1)
+        return f'    @operation_name("{name}")\n    @abstractmethod\n{definition}\n        raise NotImplementedError\n'
+
+    def render(self, *, source: str, protocol_name: str, methods: Iterable[str]) -> str:
+        """Render the entire module."""
+        lines = [
+            '"""',
+            f"Combadge service protocol and models generated from `{source}`.",
+            "",
+            "Generated by `python -m combadge.codegen.wsdl`, do not edit manually.",
+            '"""',
+            "",
+            *self._render_imports(),
+        ]
+        if self.needs_has_detail:
+            lines.append(_HAS_DETAIL_HELPER)
+        for model in self.models:
+            lines.extend(("", model))
+        lines.extend(("", f"class {protocol_name}(Protocol):"))
+        lines.append("\n".join(methods))
+        return "\n".join(lines).rstrip() + "\n"
+
+    def _render_imports(self) -> Iterable[str]:
+        sections: dict[str, dict[str, list[str]]] = {"stdlib": {}, "third_party": {}, "first_party": {}}
+        for name, module in self.imports.items():
+            section = _IMPORTS[name][0] if name in _IMPORTS else "stdlib"
+            sections[section].setdefault(module, []).append(name)
+        for modules in sections.values():
+            if not modules:
+                continue
+            for module, names in sorted(modules.items()):
+                yield f"from {module} import {', '.join(sorted(names, key=lambda name: (name.lower(), name)))}"
+            yield ""
+
+    def _use(self, *names: str) -> None:
+        for name in names:
+            self.imports[name] = _IMPORTS[name][1]
+
+    def _add_request_model(self, operation_name: str, body: Any) -> str | None:
+        if body is None or not isinstance(body.type, ComplexType) or not body.type.elements:
+            return None
+        return self._add_fields_model(self._reserve_name(f"{operation_name}Request"), body.type, base="BaseModel")
+
+    def _add_response_model(self, operation_name: str, body: Any) -> str:
+        model_name = self._reserve_name(f"{operation_name}Response")
+        if body is None or not isinstance(body.type, ComplexType):
+            return self._add_root_model(model_name, "None")
+        elements = body.type.elements
+        if not elements:
+            return self._add_root_model(model_name, "None")
+        if len(elements) > 1:
+            return self._add_fields_model(model_name, body.type, base="SuccessfulResponse")
+
+        # Zeep unwraps a single-element response, and then a single-element complex type:
+        _, element = elements[0]
+        if isinstance(element.type, ComplexType) and len(element.type.elements) == 1 and not element.type.attributes:
+            _, element = element.type.elements[0]
+        return self._add_root_model(model_name, self._annotate_element(element, root=True)[0])
+
+    def _add_fault_model(self, fault_name: str, message: Any) -> str:
+        model_name = _to_class_name(fault_name)
+        model_name = self._reserve_name(model_name if model_name.endswith("Fault") else f"{model_name}Fault")
+        parts = list(message.parts.values())
+        element = parts[0].element if parts else None
+        lines = [f"class {model_name}(BaseSoapFault):", f'    """`{fault_name}` SOAP fault."""']
+        if element is not None:
+            self.needs_has_detail = True
+            self._use("Annotated", "Any", "AfterValidator", "Callable")
+            lines.extend(("", f'    detail: Annotated[Any, AfterValidator(_has_detail("{element.qname.text}"))]'))
+        self._emit(model_name, "\n".join(lines))
+        return model_name
+
+    def _add_root_model(self, model_name: str, annotation: str) -> str:
+        self._use("RootModel", "SuccessfulResponse")
+        self._emit(model_name, f"class {model_name}(RootModel, SuccessfulResponse):\n    root: {annotation}")
+        return model_name
+
+    def _add_fields_model(self, model_name: str, xsd_type: Any, *, base: str) -> str:
+        self._use(base)
+        lines = [f"class {model_name}({base}, populate_by_name=True):"]
+        qname = getattr(xsd_type, "qname", None)
+        if qname is not None:
+            lines.extend((f'    """`{qname.text}`."""', ""))
+        field_names: set[str] = set()
+        for name, element in (*xsd_type.elements, *xsd_type.attributes):
+            field_name = _to_field_name(name)
+            while field_name in field_names:
+                field_name += "_"
+            field_names.add(field_name)
+            annotation, default = self._annotate_element(element, root=False)
+            if field_name != name:
+                self._use("Annotated", "Field")
+                annotation = f'Annotated[{annotation}, Field(alias="{name}")]'
+            lines.append(f"    {field_name}: {annotation}{default}")
+        if len(lines) == 1 or lines[-1] == "":
+            lines.append("    pass")
+        self._emit(model_name, "\n".join(lines))
+        return model_name
+
+    def _annotate_element(self, element: Any, *, root: bool) -> tuple[str, str]:
+        """Annotate an element or attribute, and return the annotation and the default value (if any)."""
+        annotation = self._annotate_type(element.type) if hasattr(element, "type") else self._any()
+        max_occurs = getattr(element, "max_occurs", 1)
+        if max_occurs == "unbounded" or (isinstance(max_occurs, int) and max_occurs > 1):
+            # Zeep always returns a list for repeated elements, even if they are missing.
+            optional = not root and getattr(element, "min_occurs", 1) == 0
+            return f"list[{annotation}]", (" = []" if optional else "")
+        if getattr(element, "min_occurs", 1) == 0 or getattr(element, "nillable", False) or _is_optional(element):
+            return f"{annotation} | None", ("" if root else " = None")
+        return annotation, ""
+
+    def _any(self) -> str:
+        self._use("Any")
+        return "Any"
+
+    def _annotate_type(self, xsd_type: Any) -> str:
+        for builtin_type, annotation, import_ in _BUILTIN_TYPES:
+            if isinstance(xsd_type, builtin_type):
+                if import_ is not None:
+                    self.imports[annotation] = import_
+                return annotation
+        if isinstance(xsd_type, ComplexType) and (xsd_type.elements or xsd_type.attributes):
+            type_name = self.type_names.get(id(xsd_type))
+            if type_name is None:
+                type_name = self.type_names[id(xsd_type)] = self._reserve_name(_to_class_name(xsd_type.name or "Type"))
+                self._add_fields_model(type_name, xsd_type, base="BaseModel")
+            return type_name if type_name in self.emitted_names else f'"{type_name}"'
+        return self._any()
+
+    def _reserve_name(self, candidate: str) -> str:
+        name = candidate
+        suffix = 1
+        while name in self.taken_names:
+            suffix += 1
+            name = f"{candidate}{suffix}"
+        self.taken_names.add(name)
+        return name
+
+    def _emit(self, model_name: str, source: str) -> None:
+        self.models.append(source + "\n")
+        self.emitted_names.add(model_name)
+
+
+def _is_optional(element: Any) -> bool:
+    """Check if the attribute is optional."""
+    return getattr(element, "required", True) is False and not hasattr(element, "max_occurs")
+
+
+def _to_class_name(name: str) -> str:
+    name = re.sub(r"\W", "_", name)
+    name = "".join(part[:1].upper() + part[1:] for part in name.split("_") if part)
+    return name if name and not name[0].isdigit() else f"T{name}"
+
+
+def _to_field_name(name: str) -> str:
+    name = re.sub(r"\W", "_", name)
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    name = re.sub(r"([a-z\d])([A-Z])", r"\1_\2", name)
+    name = name.lower().strip("_") or "value"
+    if name[0].isdigit() or keyword.iskeyword(name):
+        name = f"{name}_"
+    return name
+
+
+def main(args: Sequence[str] | None = None) -> None:  # noqa: D103
+    parser = ArgumentParser(
+        prog="python -m combadge.codegen.wsdl",
+        description="Generate Combadge service protocol and models from a WSDL document.",
+    )
+    parser.add_argument("wsdl", help="WSDL document path or URL")
+    parser.add_argument("--service", help="WSDL service name, defaults to the first service")
+    parser.add_argument("--port", help="WSDL port name, defaults to the first port")
+    parser.add_argument("--async", dest="is_async", action="store_true", help="generate asynchronous methods")
+    parser.add_argument("-o", "--output", type=Path, help="output file, defaults to the standard output")
+    options = parser.parse_args(args)
+
+    source = generate(options.wsdl, service_name=options.service, port_name=options.port, is_async=options.is_async)
+    if options.output is None:
+        print(source, end="")  # noqa: T201
+    else:
+        options.output.write_text(source)
+
+
+if __name__ == "__main__":
+    main()
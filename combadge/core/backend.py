@@ -17,7 +17,8 @@ class BaseBackend(ABC):
     - It also caches all the service instances bound to the backend via the item protocol.
     """
 
-    __slots__ = ("_service_cache",)
+    # Weak references allow markers to keep a per-backend state (such as the retry budget):
+    __slots__ = ("_service_cache", "__weakref__")
 
     def __init__(self) -> None:  # noqa: D107
         self._service_cache: dict[type, object] = {}
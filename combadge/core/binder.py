@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any
 
 from typing_extensions import override
 
+from combadge.core.bound_method import MethodDescriptor
 from combadge.core.markers.method import MethodMarker
 from combadge.core.service import BaseBoundService
 from combadge.core.typevars import BackendT, FunctionT, ServiceProtocolT
@@ -56,7 +57,7 @@ def bind_class(
         update_wrapper(bound_method, method)
         bound_method = _wrap(bound_method, signature.method_markers)
         bound_method = override(bound_method)  # no functional change, just possibly setting `__override__`
-        setattr(BoundService, name, bound_method)
+        setattr(BoundService, name, MethodDescriptor(bound_method))
 
     del BoundService.__abstractmethods__
     update_wrapper(BoundService, from_protocol, updated=())
@@ -67,13 +68,13 @@ def _wrap(method: FunctionT, with_markers: Iterable[MethodMarker]) -> FunctionT:
     """
     Apply method markers.
 
-    Method markers may wrap or modify the bound method.
+    Method markers may wrap or modify the bound method. The outermost markers are applied last.
 
     Args:
         method: bound method in the protocol implementation
         with_markers: method markers to apply
     """
-    for marker in with_markers:
+    for marker in sorted(with_markers, key=lambda marker: marker.outermost):
         method = marker.wrap(method)
     return method
 
@@ -0,0 +1,462 @@
+"""Service methods bound to a service instance, along with the concurrent fan-out API."""
+
+from __future__ import annotations
+
+from asyncio import FIRST_COMPLETED as ASYNC_FIRST_COMPLETED
+from asyncio import Task, create_task
+from asyncio import wait as async_wait
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass
+from inspect import Parameter, Signature, isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
+from inspect import signature as get_signature
+from typing import Any, Generic, overload
+
+from annotated_types import SLOTS
+from pydantic import BaseModel
+from typing_extensions import Never, Self
+
+from combadge.core.typevars import AnyT, ResponseT
+
+_POSITIONAL_KINDS = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+
+
+class MethodDescriptor:
+    """
+    Descriptor which binds the service method implementation to a service instance.
+
+    Just like for an ordinary method, each lookup creates a new bound method, which is not stored on the instance:
+    otherwise, the instance and its bound methods would reference each other.
+    Everything which does not depend on the instance, such as the bound method signature,
+    is computed once, when the service class gets bound.
+    """
+
+    __slots__ = ("function", "signature")
+
+    def __init__(self, function: Callable[..., Any]) -> None:  # noqa: D107
+        self.function = function
+        signature = get_signature(function)
+        self.signature = signature.replace(parameters=list(signature.parameters.values())[1:])
+
+    def __get__(self, instance: Any, owner: type[Any] | None = None) -> Any:
+        if instance is None:
+            return self.function
+        return BoundMethod(self.function, instance, self.signature)
+
+
+class BoundMethod:
+    """
+    Service method bound to a service instance.
+
+    It is called just like an ordinary method, and additionally provides
+    the [`map()`][combadge.core.bound_method.BoundMethod.map] fan-out.
+
+    Tip: Type checking
+        Type checkers see a service method as it is declared in the protocol, so `map()` is untyped.
+        Use [`map_calls()`][combadge.core.bound_method.map_calls] and
+        [`map_columns()`][combadge.core.bound_method.map_columns] to get the typed results.
+    """
+
+    __slots__ = ("__func__", "__self__", "__signature__")
+
+    def __init__(self, function: Callable[..., Any], service: Any, signature: Signature) -> None:  # noqa: D107
+        self.__func__ = function
+        self.__self__ = service
+        self.__signature__ = signature  # without `self`, as of an ordinary bound method
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Call the service method."""
+        return self.__func__(self.__self__, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the method's name, wrapped function, and so on, just like `types.MethodType` does.
+        return getattr(self.__func__, name)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BoundMethod):
+            return NotImplemented
+        return self.__func__ is other.__func__ and self.__self__ is other.__self__
+
+    def __hash__(self) -> int:
+        return hash((self.__func__, id(self.__self__)))
+
+    def __repr__(self) -> str:
+        return f"<bound method {self.__func__.__qualname__} of {self.__self__!r}>"
+
+    def map(
+        self,
+        arguments: Iterable[Any],
+        *,
+        concurrency: int = 10,
+        ordered: bool = False,
+    ) -> Iterator[MapResult[Any]] | AsyncIterator[MapResult[Any]]:
+        """
+        Call the method for each of the argument sets concurrently.
+
+        Sync methods are called in a thread pool, which shares the backend (and so its client).
+        Async methods are called in a bounded number of tasks. In both cases, the argument sets are consumed lazily,
+        so the iterable may be arbitrarily long. A call of a paginated method results in the list of all its items.
+
+        Args:
+            arguments: argument sets: a `#!python tuple` is unpacked as positional arguments,
+                a mapping is unpacked as keyword arguments, anything else is passed as a single positional argument
+            concurrency: maximum number of the concurrent calls
+            ordered: yield the results in the order of the argument sets, rather than as the calls complete
+
+        Returns:
+            Iterator (or async iterator, for an async method) of the results,
+            which also capture the exceptions – so that a single failure does not abort the others.
+
+        Examples:
+            >>> for result in service.get_country_info.map(["NL", "BE", "LU"], concurrency=2):
+            >>>     print(result.index, result.unwrap())
+
+            >>> async for result in service.get_country_info.map(["NL", "BE", "LU"], concurrency=2):
+            >>>     print(result.index, result.unwrap())
+        """
+        return map_calls(self, arguments, concurrency=concurrency, ordered=ordered)
+
+    def map_columns(
+        self,
+        columns: Any,
+        *,
+        concurrency: int = 10,
+    ) -> ColumnarResults[Any] | Awaitable[ColumnarResults[Any]]:
+        """
+        Call the method for each row of the columnar arguments concurrently.
+
+        The columns are matched with the method parameters by their names. When the columns cover
+        the leading positional parameters, the rows are passed positionally, without building
+        a keyword dictionary per row.
+
+        Args:
+            columns: mapping of a parameter name to a sequence or an array (for example, a NumPy array),
+                or a table which provides `to_pydict()` (PyArrow) or `to_dict("list")` (Pandas)
+            concurrency: maximum number of the concurrent calls
+
+        Returns:
+            Results aligned with the input rows (or an awaitable of them, for an async method).
+
+        Examples:
+            >>> results = service.get_country_info.map_columns({"country_code": frame["code"]}, concurrency=8)
+            >>> frame = frame.assign(**results.to_columns())
+        """
+        return map_columns(self, columns, concurrency=concurrency)
+
+
+@overload
+def map_calls(  # type: ignore[overload-overlap]
+    method: Callable[..., Awaitable[ResponseT]],
+    arguments: Iterable[Any],
+    *,
+    concurrency: int = 10,
+    ordered: bool = False,
+) -> AsyncIterator[MapResult[ResponseT]]: ...
+
+
+@overload
+def map_calls(  # type: ignore[overload-overlap]
+    method: Callable[..., AsyncIterator[AnyT]],
+    arguments: Iterable[Any],
+    *,
+    concurrency: int = 10,
+    ordered: bool = False,
+) -> AsyncIterator[MapResult[list[AnyT]]]: ...
+
+
+@overload
+def map_calls(
+    method: Callable[..., Iterator[AnyT]],
+    arguments: Iterable[Any],
+    *,
+    concurrency: int = 10,
+    ordered: bool = False,
+) -> Iterator[MapResult[list[AnyT]]]: ...
+
+
+@overload
+def map_calls(
+    method: Callable[..., ResponseT],
+    arguments: Iterable[Any],
+    *,
+    concurrency: int = 10,
+    ordered: bool = False,
+) -> Iterator[MapResult[ResponseT]]: ...
+
+
+def map_calls(
+    method: Callable[..., Any],
+    arguments: Iterable[Any],
+    *,
+    concurrency: int = 10,
+    ordered: bool = False,
+) -> Iterator[MapResult[Any]] | AsyncIterator[MapResult[Any]]:
+    """
+    Typed equivalent of [`BoundMethod.map()`][combadge.core.bound_method.BoundMethod.map].
+
+    Examples:
+        >>> for result in map_calls(service.get_country_info, ["NL", "BE", "LU"], concurrency=2):
+        >>>     print(result.index, result.unwrap())
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be positive")
+    function = getattr(method, "__func__", method)
+    if isgeneratorfunction(function):
+        method = _collect(method)
+    elif isasyncgenfunction(function):
+        method = _collect_async(method)
+    calls = (_bind_call(method, index, arguments) for index, arguments in enumerate(arguments))
+    if iscoroutinefunction(method) or iscoroutinefunction(function):
+        return _map_async(calls, concurrency, ordered)
+    return _map_sync(calls, concurrency, ordered)
+
+
+@overload
+def map_columns(
+    method: Callable[..., Awaitable[ResponseT]],
+    columns: Any,
+    *,
+    concurrency: int = 10,
+) -> Awaitable[ColumnarResults[ResponseT]]: ...
+
+
+@overload
+def map_columns(
+    method: Callable[..., AsyncIterator[AnyT]],
+    columns: Any,
+    *,
+    concurrency: int = 10,
+) -> Awaitable[ColumnarResults[list[AnyT]]]: ...
+
+
+@overload
+def map_columns(
+    method: Callable[..., Iterator[AnyT]],
+    columns: Any,
+    *,
+    concurrency: int = 10,
+) -> ColumnarResults[list[AnyT]]: ...
+
+
+@overload
+def map_columns(
+    method: Callable[..., ResponseT],
+    columns: Any,
+    *,
+    concurrency: int = 10,
+) -> ColumnarResults[ResponseT]: ...
+
+
+def map_columns(
+    method: Callable[..., Any],
+    columns: Any,
+    *,
+    concurrency: int = 10,
+) -> ColumnarResults[Any] | Awaitable[ColumnarResults[Any]]:
+    """
+    Typed equivalent of [`BoundMethod.map_columns()`][combadge.core.bound_method.BoundMethod.map_columns].
+
+    Examples:
+        >>> results = map_columns(service.get_country_info, {"country_code": frame["code"]}, concurrency=8)
+    """
+    names, values = _normalize_columns(columns)
+    positional = [
+        name
+        for name, parameter in get_signature(getattr(method, "__func__", method)).parameters.items()
+        if name != "self" and parameter.kind in _POSITIONAL_KINDS
+    ]
+    ordered_names = sorted(names, key=_index_in(positional))
+    if positional[: len(names)] == ordered_names:
+        # Fast path: reorder the columns according to the parameters, and pass the rows positionally.
+        by_name = dict(zip(names, values, strict=True))
+        rows: Iterable[Any] = zip(*(by_name[name] for name in ordered_names), strict=True)
+    else:
+        rows = (dict(zip(names, row, strict=True)) for row in zip(*values, strict=True))
+    n_rows = len(values[0]) if values else 0
+
+    results: Iterator[MapResult[Any]] | AsyncIterator[MapResult[Any]] = map_calls(
+        method,
+        rows,
+        concurrency=concurrency,
+    )
+    if isinstance(results, Iterator):
+        return ColumnarResults.from_results(results, n_rows)
+
+    async def collect() -> ColumnarResults[Any]:
+        return ColumnarResults.from_results([result async for result in results], n_rows)
+
+    return collect()
+
+
+@dataclass(**SLOTS)
+class MapResult(Generic[ResponseT]):
+    """Outcome of a single call made by [`map()`][combadge.core.bound_method.BoundMethod.map]."""
+
+    index: int
+    """Index of the argument set."""
+
+    arguments: Any
+    """The argument set, as it was passed to `map()`."""
+
+    result: ResponseT | None = None
+    """Method response, if the call has succeeded."""
+
+    exception: BaseException | None = None
+    """Raised exception, if the call has failed."""
+
+    def unwrap(self) -> ResponseT | Never:
+        """Return the response, or re-raise the captured exception."""
+        if self.exception is not None:
+            raise self.exception
+        return self.result  # type: ignore[return-value]
+
+    @classmethod
+    def _from_call(cls, index: int, arguments: Any, call: Callable[[], Any]) -> Self:
+        try:
+            return cls(index, arguments, result=call())
+        except Exception as e:
+            return cls(index, arguments, exception=e)
+
+    @classmethod
+    async def _from_async_call(cls, index: int, arguments: Any, call: Callable[[], Awaitable[Any]]) -> Self:
+        try:
+            return cls(index, arguments, result=await call())
+        except Exception as e:
+            return cls(index, arguments, exception=e)
+
+
+@dataclass(**SLOTS)
+class ColumnarResults(Generic[ResponseT]):
+    """Results of [`map_columns()`][combadge.core.bound_method.BoundMethod.map_columns], aligned with the input rows."""
+
+    results: list[ResponseT | None]
+    """Method responses, `#!python None` for the failed calls."""
+
+    exceptions: list[BaseException | None]
+    """Raised exceptions, `#!python None` for the successful calls."""
+
+    @classmethod
+    def from_results(cls, results: Iterable[MapResult[ResponseT]], n_rows: int) -> ColumnarResults[ResponseT]:
+        """Place the results by their indices."""
+        self = cls([None] * n_rows, [None] * n_rows)
+        for result in results:
+            self.results[result.index] = result.result
+            self.exceptions[result.index] = result.exception
+        return self
+
+    def to_columns(self, *, by_alias: bool = False) -> dict[str, list[Any]]:
+        """
+        Transpose the response models into a mapping of a field name to the column of values.
+
+        Failed calls get `#!python None` in every column.
+        """
+        rows = [
+            result.model_dump(by_alias=by_alias) if isinstance(result, BaseModel) else None for result in self.results
+        ]
+        names = dict.fromkeys(name for row in rows if row is not None for name in row)
+        return {name: [row.get(name) if row is not None else None for row in rows] for name in names}
+
+
+def _normalize_columns(columns: Any) -> tuple[list[str], list[Sequence[Any]]]:
+    """Convert the columnar input into the column names and the lists of plain Python values."""
+    if hasattr(columns, "to_pydict"):
+        columns = columns.to_pydict()  # PyArrow table
+    elif hasattr(columns, "to_dict") and hasattr(columns, "columns"):
+        columns = columns.to_dict("list")  # Pandas data frame
+    elif not isinstance(columns, Mapping):
+        raise TypeError(f"expected a mapping of columns or a table, got `{type(columns)}`")
+
+    names = list(columns)
+    # NumPy arrays and Pandas series convert themselves to lists of plain Python values:
+    values = [column.tolist() if hasattr(column, "tolist") else list(column) for column in columns.values()]
+    if len({len(column) for column in values}) > 1:
+        raise ValueError("all the columns must have the same length")
+    return names, values
+
+
+def _index_in(parameters: list[str]) -> Callable[[str], int]:
+    return lambda name: parameters.index(name) if name in parameters else len(parameters)
+
+
+def _collect(method: Callable[..., Iterator[Any]]) -> Callable[..., list[Any]]:
+    """Make the paginated method return all the items at once."""
+    return lambda *args, **kwargs: list(method(*args, **kwargs))
+
+
+def _collect_async(method: Callable[..., AsyncIterator[Any]]) -> Callable[..., Awaitable[list[Any]]]:
+    """Make the async paginated method return all the items at once."""
+
+    async def collect(*args: Any, **kwargs: Any) -> list[Any]:
+        return [item async for item in method(*args, **kwargs)]
+
+    return collect
+
+
+def _bind_call(method: Callable[..., Any], index: int, arguments: Any) -> tuple[int, Any, Callable[[], Any]]:
+    if isinstance(arguments, tuple):
+        return index, arguments, lambda: method(*arguments)
+    if isinstance(arguments, Mapping):
+        return index, arguments, lambda: method(**arguments)
+    return index, arguments, lambda: method(arguments)
+
+
+def _map_sync(
+    calls: Iterator[tuple[int, Any, Callable[[], Any]]],
+    concurrency: int,
+    ordered: bool,
+) -> Iterator[MapResult[Any]]:
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="combadge-map") as executor:
+        pending: deque[Future[MapResult[Any]]] = deque()
+        try:
+            for index, arguments, call in calls:
+                if len(pending) >= concurrency:
+                    yield from _pop_completed(pending, ordered)
+                # Each call runs in its own copy of the caller's context to carry the deadline over:
+                pending.append(executor.submit(copy_context().run, MapResult._from_call, index, arguments, call))
+            while pending:
+                yield from _pop_completed(pending, ordered)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _pop_completed(pending: deque[Future[MapResult[Any]]], ordered: bool) -> Iterator[MapResult[Any]]:
+    if ordered:
+        yield pending.popleft().result()
+        return
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield future.result()
+
+
+async def _map_async(
+    calls: Iterator[tuple[int, Any, Callable[[], Awaitable[Any]]]],
+    concurrency: int,
+    ordered: bool,
+) -> AsyncIterator[MapResult[Any]]:
+    pending: deque[Task[MapResult[Any]]] = deque()
+    try:
+        for index, arguments, call in calls:
+            if len(pending) >= concurrency:
+                async for result in _pop_completed_async(pending, ordered):
+                    yield result
+            pending.append(create_task(MapResult._from_async_call(index, arguments, call)))
+        while pending:
+            async for result in _pop_completed_async(pending, ordered):
+                yield result
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _pop_completed_async(pending: deque[Task[MapResult[Any]]], ordered: bool) -> AsyncIterator[MapResult[Any]]:
+    if ordered:
+        yield await pending.popleft()
+        return
+    done, _ = await async_wait(pending, return_when=ASYNC_FIRST_COMPLETED)
+    for task in done:
+        pending.remove(task)
+        yield task.result()
@@ -0,0 +1,197 @@
+"""Response cache storages used by the [`@cached`][combadge.core.markers.caching.cached] marker."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from os import PathLike
+from threading import Lock
+from time import time
+from typing import Any, ClassVar
+
+from annotated_types import SLOTS
+from pydantic import TypeAdapter, ValidationError
+
+from combadge._helpers.sqlite import SharedDatabase
+
+
+@dataclass(frozen=True, **SLOTS)
+class CacheEntry:
+    """Cached response along with its expiration timestamps."""
+
+    value: Any
+    """Cached response."""
+
+    fresh_until: float
+    """Until this UNIX timestamp the entry is served without a refresh."""
+
+    stale_until: float
+    """Until this UNIX timestamp the entry is still served, but gets refreshed in the background."""
+
+    def is_fresh(self, now: float) -> bool:  # noqa: D102
+        return now < self.fresh_until
+
+    def is_usable(self, now: float) -> bool:  # noqa: D102
+        return now < self.stale_until
+
+
+class BaseCache(ABC):
+    """
+    Abstract response cache storage.
+
+    Storages receive the response type adapter, so that the out-of-process storages
+    could serialize responses and validate them on read.
+    """
+
+    __slots__ = ()
+
+    shared: ClassVar[bool] = False
+    """Whether the storage is shared between processes, and so needs the keys which are stable across processes."""
+
+    @abstractmethod
+    def get(self, key: str, type_adapter: TypeAdapter[Any]) -> CacheEntry | None:
+        """
+        Get the usable entry by its key.
+
+        Returns:
+            Cache entry, or `#!python None` if the entry is missing or expired.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry, type_adapter: TypeAdapter[Any]) -> None:
+        """Store the entry."""
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    """
+    In-process response cache with LRU eviction.
+
+    Responses are stored «as is», so a cache hit costs neither deserialization nor validation.
+
+    Tip: This storage is thread-safe
+        It may be shared between the methods and services. Note that the cache keys do not include
+        a backend, so the storage should not be shared between backends that target different servers.
+    """
+
+    __slots__ = ("_entries", "_lock", "_maxsize")
+
+    def __init__(self, maxsize: int | None = 1024) -> None:
+        """
+        Instantiate the storage.
+
+        Args:
+            maxsize: maximum number of entries, the least recently used ones get evicted first;
+                `#!python None` means no limit
+        """
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = maxsize
+
+    def get(self, key: str, type_adapter: TypeAdapter[Any]) -> CacheEntry | None:  # noqa: D102
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not entry.is_usable(time()):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry, type_adapter: TypeAdapter[Any]) -> None:  # noqa: D102
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if self._maxsize is not None:
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteCache(BaseCache):
+    """
+    Response cache in a local SQLite database, which is shared between processes.
+
+    This is meant for pre-fork deployments (for example, Gunicorn workers): a response fetched by one worker
+    is served to all the others. The database is used in the write-ahead log mode, so that the readers
+    do not block each other. The storage may be instantiated before forking: each process opens
+    its own connection on the first access.
+
+    Responses are serialized to JSON and validated on read. An entry which does not pass the validation anymore
+    (for example, after a response model change) is treated as missing.
+
+    Notes:
+        - The database is accessed synchronously, which is normally fast enough for a local file,
+          but still blocks an event loop for a moment.
+        - The call arguments must be JSON-serializable, so that the keys are the same in all the processes.
+          Otherwise, specify the `key` function of [`@cached`][combadge.core.markers.caching.cached].
+    """
+
+    __slots__ = ("_database", "_lock", "_maxsize")
+
+    shared = True
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            fresh_until REAL NOT NULL,
+            stale_until REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS cache_entries_accessed_at ON cache_entries (accessed_at);
+        CREATE INDEX IF NOT EXISTS cache_entries_stale_until ON cache_entries (stale_until);
+    """
+
+    def __init__(self, path: str | PathLike[str], *, maxsize: int | None = 10_000) -> None:
+        """
+        Instantiate the storage.
+
+        Args:
+            path: database file path, the database gets created if missing
+            maxsize: maximum number of entries, the least recently used ones get evicted first;
+                `#!python None` means no limit
+        """
+        self._database = SharedDatabase(path, schema=self._SCHEMA)
+        self._lock = Lock()
+        self._maxsize = maxsize
+
+    def get(self, key: str, type_adapter: TypeAdapter[Any]) -> CacheEntry | None:  # noqa: D102
+        now = time()
+        with self._lock:
+            connection = self._database.connect()
+            row = connection.execute(
+                "SELECT value, fresh_until, stale_until FROM cache_entries WHERE key = ? AND stale_until > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+        value, fresh_until, stale_until = row
+        try:
+            return CacheEntry(type_adapter.validate_json(value), fresh_until, stale_until)
+        except ValidationError:
+            return None
+
+    def set(self, key: str, entry: CacheEntry, type_adapter: TypeAdapter[Any]) -> None:  # noqa: D102
+        value = type_adapter.dump_json(entry.value, by_alias=True)
+        now = time()
+        with self._lock:
+            connection = self._database.connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?, ?)",
+                (key, value, entry.fresh_until, entry.stale_until, now),
+            )
+            connection.execute("DELETE FROM cache_entries WHERE stale_until <= ?", (now,))
+            if self._maxsize is not None:
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE key IN ("
+                    " SELECT key FROM cache_entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?"
+                    ")",
+                    (self._maxsize,),
+                )
@@ -0,0 +1,168 @@
+"""Circuit breaker used by the [`@circuit_breaker`][combadge.core.markers.circuit_breaking.circuit_breaker] marker."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import Enum
+from threading import Lock
+from time import monotonic
+
+from combadge._helpers.errors import get_status_code, is_transport_error
+from combadge.core.errors import BackendError, CircuitOpenError
+
+
+class CircuitState(Enum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    """The calls are let through."""
+
+    OPEN = "open"
+    """The calls fail fast."""
+
+    HALF_OPEN = "half-open"
+    """A limited number of probe calls is let through to check whether the server has recovered."""
+
+
+class CircuitBreaker:
+    """
+    Fails the calls fast while a server is down.
+
+    The breaker opens after a number of consecutive failures, and rejects the calls with
+    [`CircuitOpenError`][combadge.core.errors.CircuitOpenError]. After the recovery timeout,
+    it lets a limited number of probe calls through: a successful probe closes the breaker,
+    and a failed one opens it again.
+
+    Only a [`BackendError`][combadge.core.errors.BackendError] caused by a transport error or
+    a server error (`5xx`) counts as a failure – a client error is not a sign of a failing server.
+
+    Tip: This breaker is thread-safe
+        Share an instance between methods (or services) to trip them together.
+    """
+
+    __slots__ = (
+        "_failure_threshold",
+        "_recovery_timeout",
+        "_half_open_probes",
+        "_on_state_change",
+        "_lock",
+        "_state",
+        "_failures",
+        "_opened_at",
+        "_probes",
+        "_generation",
+    )
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        *,
+        recovery_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        on_state_change: Callable[[CircuitState, CircuitState], None] | None = None,
+    ) -> None:
+        """
+        Instantiate the breaker.
+
+        Args:
+            failure_threshold: number of the consecutive failures which opens the breaker
+            recovery_timeout: time (in seconds) after which the open breaker lets the probe calls through
+            half_open_probes: maximum number of the concurrent probe calls
+            on_state_change: callback which receives the old and the new state, for example to export the metrics
+                – it is called under the breaker's lock, and so must be quick
+        """
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_probes = half_open_probes
+        self._on_state_change = on_state_change
+        self._lock = Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._generation = 0
+        """Incremented on each state change, so that the outcome of a call admitted in another state is ignored."""
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state."""
+        with self._lock:
+            self._check_recovery()
+            return self._state
+
+    @property
+    def failures(self) -> int:
+        """Number of the consecutive failures."""
+        return self._failures
+
+    def before_call(self) -> int:
+        """
+        Admit a call.
+
+        Returns:
+            Token which must be passed to [`after_call()`][combadge.core.circuit_breaker.CircuitBreaker.after_call].
+
+        Raises:
+            CircuitOpenError: the breaker is open, or all the probe calls are in flight
+        """
+        with self._lock:
+            self._check_recovery()
+            if self._state is CircuitState.CLOSED:
+                return self._generation
+            if self._state is CircuitState.HALF_OPEN and self._probes < self._half_open_probes:
+                self._probes += 1
+                return self._generation
+        raise CircuitOpenError("the circuit breaker is open")
+
+    def after_call(self, token: int, exception: BaseException | None) -> None:
+        """
+        Account for the outcome of an admitted call.
+
+        The outcome of a call admitted before the latest state change is ignored: for example,
+        a call let through while the breaker was closed must not close the half-open breaker.
+
+        A call interrupted by a non-`Exception` (for example, a cancelled one) tells nothing about the server,
+        so it only frees its probe slot.
+
+        Args:
+            token: token returned by [`before_call()`][combadge.core.circuit_breaker.CircuitBreaker.before_call]
+            exception: exception raised by the call, or `#!python None` if it has succeeded
+        """
+        with self._lock:
+            if token != self._generation:
+                return
+            is_probe = self._state is CircuitState.HALF_OPEN
+            if is_probe:
+                self._probes -= 1
+            if exception is not None and not isinstance(exception, Exception):
+                return
+            if exception is None or not self._is_failure(exception):
+                self._failures = 0
+                if is_probe and exception is None:
+                    self._set_state(CircuitState.CLOSED)
+                return
+            self._failures += 1
+            if is_probe or self._failures >= self._failure_threshold:
+                self._opened_at = monotonic()
+                self._set_state(CircuitState.OPEN)
+
+    def _check_recovery(self) -> None:
+        if self._state is CircuitState.OPEN and monotonic() - self._opened_at >= self._recovery_timeout:
+            self._probes = 0
+            self._set_state(CircuitState.HALF_OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        old_state, self._state = self._state, state
+        if old_state is not state:
+            self._generation += 1
+            if self._on_state_change is not None:
+                self._on_state_change(old_state, state)
+
+    @staticmethod
+    def _is_failure(exception: BaseException) -> bool:
+        if not isinstance(exception, BackendError):
+            return False
+        status_code = get_status_code(exception.inner)
+        if status_code is not None:
+            return status_code >= 500
+        return is_transport_error(exception.inner)
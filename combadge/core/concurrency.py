@@ -0,0 +1,454 @@
+"""Concurrency limiting: adaptive limits for the async backends, and per-method bulkheads."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from asyncio import Future, get_running_loop, wait_for
+from asyncio import TimeoutError as AsyncTimeoutError
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from heapq import heapify, heappop, heappush
+from itertools import count
+from math import sqrt
+from threading import Lock, Semaphore
+from time import monotonic
+
+from annotated_types import SLOTS
+
+from combadge._helpers.errors import is_overload_error
+from combadge.core.deadline import get_remaining_time
+from combadge.core.errors import BackendError, LimitExceededError
+
+_priority: ContextVar[int | None] = ContextVar("combadge_priority", default=None)
+
+
+def get_priority(default: int = 0) -> int:
+    """Get the priority of the calls made in the current context, or the default one if it is not set."""
+    priority = _priority.get()
+    return priority if priority is not None else default
+
+
+@contextmanager
+def use_priority(priority: int) -> Iterator[None]:
+    """
+    Set the priority of the calls made in the context, including the nested service calls.
+
+    Queued calls with a higher priority are admitted first by a
+    [`ConcurrencyLimiter`][combadge.core.concurrency.ConcurrencyLimiter] (and, thus, by the async bulkheads).
+    The priority set per call overrides the one of the [`@priority`][combadge.core.markers.prioritizing.priority]
+    method marker.
+
+    Examples:
+        >>> with use_priority(10):
+        >>>     await service.get_country_info("NL")
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class BaseLimit(ABC):
+    """Algorithm which adjusts the concurrency limit based on the observed calls."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:
+        """
+        Account for a completed call.
+
+        Args:
+            latency: call latency (in seconds)
+            in_flight: number of the calls which were in flight when the call completed (including itself)
+            dropped: whether the call has failed because of an overloaded server
+        """
+        raise NotImplementedError
+
+
+class FixedLimit(BaseLimit):
+    """Constant concurrency limit."""
+
+    __slots__ = ("_limit",)
+
+    def __init__(self, limit: int) -> None:
+        """
+        Instantiate the limit.
+
+        Args:
+            limit: concurrency limit
+        """
+        self._limit = limit
+
+    @property
+    def limit(self) -> int:  # noqa: D102
+        return self._limit
+
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:  # noqa: D102
+        pass
+
+
+class AimdLimit(BaseLimit):
+    """
+    Additive increase, multiplicative decrease.
+
+    The limit grows by one with each successful call, and gets multiplied by the backoff ratio
+    with each dropped call (or a call slower than the latency threshold).
+    """
+
+    __slots__ = ("_limit", "_min_limit", "_max_limit", "_backoff_ratio", "_latency_threshold")
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        backoff_ratio: float = 0.9,
+        latency_threshold: float | None = None,
+    ) -> None:
+        """
+        Instantiate the algorithm.
+
+        Args:
+            initial_limit: initial concurrency limit
+            min_limit: minimum concurrency limit
+            max_limit: maximum concurrency limit
+            backoff_ratio: limit multiplier on a dropped call
+            latency_threshold: calls slower than this (in seconds) are treated as dropped
+        """
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff_ratio = backoff_ratio
+        self._latency_threshold = latency_threshold
+
+    @property
+    def limit(self) -> int:  # noqa: D102
+        return int(self._limit)
+
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:  # noqa: D102
+        if dropped or (self._latency_threshold is not None and latency > self._latency_threshold):
+            self._limit = max(self._limit * self._backoff_ratio, self._min_limit)
+        elif in_flight * 2 >= self._limit:
+            # Only grow when the limit is actually used, otherwise it would grow unbounded under a low load.
+            self._limit = min(self._limit + 1.0, self._max_limit)
+
+
+class GradientLimit(BaseLimit):
+    """
+    Latency gradient.
+
+    The limit follows the ratio of the long-term average latency to the current one: it shrinks as soon as
+    a server starts queueing the requests (and so the latency grows), and grows otherwise,
+    leaving some headroom for the queue.
+    """
+
+    __slots__ = ("_limit", "_min_limit", "_max_limit", "_smoothing", "_tolerance", "_long_latency", "_long_factor")
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        smoothing: float = 0.2,
+        tolerance: float = 1.5,
+        long_window: int = 600,
+    ) -> None:
+        """
+        Instantiate the algorithm.
+
+        Args:
+            initial_limit: initial concurrency limit
+            min_limit: minimum concurrency limit
+            max_limit: maximum concurrency limit
+            smoothing: how fast the limit follows its new estimate, between `0.0` and `1.0`
+            tolerance: latency growth which is tolerated before the limit starts to shrink
+            long_window: number of the calls which the long-term average latency effectively spans
+        """
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._smoothing = smoothing
+        self._tolerance = tolerance
+        self._long_latency: float | None = None
+        self._long_factor = 2.0 / (long_window + 1)
+
+    @property
+    def limit(self) -> int:  # noqa: D102
+        return int(self._limit)
+
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:  # noqa: D102
+        if dropped:
+            gradient = 0.5
+        else:
+            if self._long_latency is None:
+                self._long_latency = latency
+            else:
+                self._long_latency += (latency - self._long_latency) * self._long_factor
+            if in_flight * 2 < self._limit:
+                return  # the limit is not used, so the latency says nothing about it
+            gradient = max(0.5, min(1.0, self._tolerance * self._long_latency / latency)) if latency > 0.0 else 1.0
+        new_limit = self._limit * gradient + sqrt(self._limit)
+        new_limit = self._limit * (1.0 - self._smoothing) + new_limit * self._smoothing
+        self._limit = max(self._min_limit, min(self._max_limit, new_limit))
+
+
+@dataclass(**SLOTS)
+class Permit:
+    """Admission of a single call."""
+
+    dropped: bool = False
+    """
+    Whether the call has failed because of an overloaded server.
+
+    It is set automatically on an exception, and may be set by a backend on a response status.
+    """
+
+
+class ConcurrencyLimiter:
+    """
+    Limits the number of the in-flight calls, queueing the excess ones.
+
+    Tip: Metrics
+        [`limit`][combadge.core.concurrency.ConcurrencyLimiter.limit],
+        [`in_flight`][combadge.core.concurrency.ConcurrencyLimiter.in_flight], and
+        [`queue_depth`][combadge.core.concurrency.ConcurrencyLimiter.queue_depth] may be exported
+        to the monitoring as gauges.
+
+    Examples:
+        >>> backend = HttpxBackend(AsyncClient(), concurrency_limiter=ConcurrencyLimiter(GradientLimit()))
+    """
+
+    __slots__ = (
+        "_limit",
+        "_max_queue_size",
+        "_max_wait",
+        "_priority_aging",
+        "_in_flight",
+        "_waiters",
+        "_sequence",
+        "_latency",
+    )
+
+    def __init__(
+        self,
+        limit: BaseLimit | None = None,
+        *,
+        max_queue_size: int | None = None,
+        max_wait: float | None = None,
+        priority_aging: float = 1.0,
+    ) -> None:
+        """
+        Instantiate the limiter.
+
+        Args:
+            limit: limit algorithm, [`AimdLimit`][combadge.core.concurrency.AimdLimit] by default
+            max_queue_size: calls beyond the queue size are rejected immediately
+            max_wait: maximum queueing time (in seconds), calls which would wait longer are rejected;
+                the queueing time is also limited by the current [deadline][combadge.core.deadline.deadline]
+            priority_aging: queueing time (in seconds) which is worth a single priority level:
+                a queued call is admitted no later than any call queued this much later per level of difference,
+                so that the low-priority calls do not starve
+        """
+        self._limit = limit if limit is not None else AimdLimit()
+        self._max_queue_size = max_queue_size
+        self._max_wait = max_wait
+        self._priority_aging = priority_aging
+        self._in_flight = 0
+        # Heap of the waiters ordered by their virtual arrival time, which is earlier for the higher priorities:
+        self._waiters: list[tuple[float, int, Future[None]]] = []
+        self._sequence = count()
+        self._latency: float | None = None
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return self._limit.limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of the calls in flight."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of the queued calls."""
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Permit]:
+        """
+        Wait for a free slot, and hold it for the duration of the context.
+
+        Raises:
+            LimitExceededError: the queue is full, or the call would wait for longer than allowed
+        """
+        await self._admit()
+        permit = Permit()
+        start_time = monotonic()
+        try:
+            yield permit
+        except Exception as e:
+            permit.dropped = is_overload_error(e.inner if isinstance(e, BackendError) else e)
+            self._release(monotonic() - start_time, permit.dropped)
+            raise
+        except BaseException:
+            # The call has been cancelled, its truncated latency says nothing about the server:
+            self._free_slot()
+            raise
+        self._release(monotonic() - start_time, permit.dropped)
+
+    async def _admit(self) -> None:
+        if not self._waiters and self._in_flight < self._limit.limit:
+            self._in_flight += 1
+            return
+        if self._max_queue_size is not None and len(self._waiters) >= self._max_queue_size:
+            raise LimitExceededError("the concurrency limiter queue is full")
+        max_wait = self._max_wait
+        if (remaining := get_remaining_time()) is not None:
+            max_wait = min(max_wait, remaining) if max_wait is not None else remaining
+        if (
+            max_wait is not None
+            and self._latency is not None
+            and (len(self._waiters) + 1) / max(self._limit.limit, 1) * self._latency > max_wait
+        ):
+            # Shedding right away, rather than letting the call time out in the queue:
+            raise LimitExceededError("the call would exceed the maximum queueing time")
+
+        waiter: Future[None] = get_running_loop().create_future()
+        entry = (monotonic() - get_priority() * self._priority_aging, next(self._sequence), waiter)
+        heappush(self._waiters, entry)
+        try:
+            await wait_for(waiter, max_wait)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot has been handed over right before the cancellation, pass it on:
+                self._in_flight -= 1
+                self._wake_up()
+            elif entry in self._waiters:  # the cancelled waiter may have been already skipped
+                self._waiters.remove(entry)
+                heapify(self._waiters)
+            if isinstance(e, AsyncTimeoutError):
+                raise LimitExceededError("the call has exceeded the maximum queueing time") from e
+            raise
+
+    def _release(self, latency: float, dropped: bool) -> None:
+        self._limit.update(latency, self._in_flight, dropped)
+        if not dropped:
+            self._latency = latency if self._latency is None else self._latency + (latency - self._latency) * 0.1
+        self._free_slot()
+
+    def _free_slot(self) -> None:
+        self._in_flight -= 1
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        """Hand the free slots over to the waiters."""
+        while self._waiters and self._in_flight < self._limit.limit:
+            _, _, waiter = heappop(self._waiters)
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
+class Bulkhead:
+    """
+    Caps the number of the concurrent calls of a method or a group of methods.
+
+    Unlike the [`ConcurrencyLimiter`][combadge.core.concurrency.ConcurrencyLimiter], a bulkhead has a fixed
+    capacity and a separate wait queue, so that a degraded endpoint cannot take over the shared connection pool.
+    Share an instance between methods to cap them as a group.
+
+    Note: Sync and async calls are counted separately
+        A bulkhead is meant to be shared between the methods of the same kind.
+    """
+
+    __slots__ = ("_max_queue_size", "_max_wait", "_semaphore", "_lock", "_in_flight", "_waiting", "_limiter")
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        *,
+        max_queue_size: int | None = None,
+        max_wait: float | None = None,
+    ) -> None:
+        """
+        Instantiate the bulkhead.
+
+        Args:
+            max_concurrency: maximum number of the concurrent calls
+            max_queue_size: calls beyond the queue size are rejected immediately
+            max_wait: maximum queueing time (in seconds), calls which would wait longer are rejected
+        """
+        self._max_queue_size = max_queue_size
+        self._max_wait = max_wait
+        self._semaphore = Semaphore(max_concurrency)
+        self._lock = Lock()
+        self._in_flight = 0
+        self._waiting = 0
+        self._limiter = ConcurrencyLimiter(
+            FixedLimit(max_concurrency),
+            max_queue_size=max_queue_size,
+            max_wait=max_wait,
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Number of the calls in flight."""
+        return self._in_flight + self._limiter.in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of the queued calls."""
+        return self._waiting + self._limiter.queue_depth
+
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        """
+        Wait for a free slot in the current thread, and hold it for the duration of the context.
+
+        Raises:
+            LimitExceededError: the queue is full, or the call has waited for longer than allowed
+        """
+        if not self._semaphore.acquire(blocking=False):
+            with self._lock:
+                if self._max_queue_size is not None and self._waiting >= self._max_queue_size:
+                    raise LimitExceededError("the bulkhead queue is full")
+                self._waiting += 1
+            try:
+                acquired = self._semaphore.acquire(timeout=self._max_wait)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+            if not acquired:
+                raise LimitExceededError("the call has exceeded the maximum queueing time")
+        with self._lock:
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def acquire_async(self) -> AsyncIterator[None]:
+        """
+        Wait for a free slot in the event loop, and hold it for the duration of the context.
+
+        Raises:
+            LimitExceededError: the queue is full, or the call would wait for longer than allowed
+        """
+        async with self._limiter.acquire():
+            yield
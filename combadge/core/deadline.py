@@ -0,0 +1,58 @@
+"""Deadline propagation through the nested service calls."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+
+from combadge.core.errors import DeadlineExceededError
+
+_deadline: ContextVar[float | None] = ContextVar("combadge_deadline", default=None)
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[None]:
+    """
+    Limit the total time of the calls made in the context, including the nested service calls.
+
+    The bound methods convert the remaining time into their transport timeouts, and fail right away
+    with [`DeadlineExceededError`][combadge.core.errors.DeadlineExceededError] once the deadline has passed.
+    A nested deadline may only shorten the outer one.
+
+    Args:
+        timeout: time budget (in seconds)
+
+    Examples:
+        >>> async def handle_inbound_request(...) -> ...:
+        >>>     with deadline(0.5):
+        >>>         country = await service.get_country_info("NL")
+        >>>         currency = await service.get_currency(country.currency_code)
+    """
+    new_deadline = monotonic() + timeout
+    if (outer_deadline := _deadline.get()) is not None:
+        new_deadline = min(new_deadline, outer_deadline)
+    token = _deadline.set(new_deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def get_remaining_time() -> float | None:
+    """
+    Get the time (in seconds) which is left until the current deadline.
+
+    Returns:
+        Remaining time, or `#!python None` if there is no deadline.
+
+    Raises:
+        DeadlineExceededError: the deadline has already passed
+    """
+    if (current_deadline := _deadline.get()) is None:
+        return None
+    remaining = current_deadline - monotonic()
+    if remaining <= 0.0:
+        raise DeadlineExceededError("the deadline has passed")
+    return remaining
@@ -20,7 +20,8 @@ class _BackendErrorMeta(type, AbstractContextManager):
         /,
     ) -> None:
         # Wrapping `CancelledError` breaks `asyncio.TaskGroup`.
-        if exc_value is not None and not isinstance(exc_value, CancelledError):
+        # Combadge's own errors (for example, a rejection by a client-side limiter) are raised as they are.
+        if exc_value is not None and not isinstance(exc_value, (CancelledError, CombadgeError)):
             raise cls(exc_value) from exc_value
 
 
@@ -59,3 +60,19 @@ class BackendError(CombadgeError, metaclass=_BackendErrorMeta):
     def inner(self) -> BaseException:
         """Get the wrapped backend client exception."""
         return self.args[0]
+
+
+class LimitExceededError(CombadgeError):
+    """
+    Call is rejected by a client-side limiter without being sent.
+
+    It is raised instead of waiting indefinitely when the client is overloaded itself.
+    """
+
+
+class CircuitOpenError(LimitExceededError):
+    """Call is rejected right away, because the circuit breaker is open."""
+
+
+class DeadlineExceededError(CombadgeError):
+    """Call is rejected right away, because the [deadline][combadge.core.deadline.deadline] has already passed."""
@@ -1,3 +1,14 @@
+from .batching import *  # noqa: F403
+from .bulkheading import *  # noqa: F403
+from .caching import *  # noqa: F403
+from .circuit_breaking import *  # noqa: F403
+from .coalescing import *  # noqa: F403
+from .hedging import *  # noqa: F403
 from .method import *  # noqa: F403
+from .pagination import *  # noqa: F403
 from .parameter import *  # noqa: F403
+from .prioritizing import *  # noqa: F403
+from .rate_limiting import *  # noqa: F403
 from .response import *  # noqa: F403
+from .retrying import *  # noqa: F403
+from .timeouts import *  # noqa: F403
@@ -0,0 +1,157 @@
+"""Automatic batching method marker."""
+
+from __future__ import annotations
+
+from asyncio import Future, TimerHandle, get_running_loop
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from inspect import signature as get_signature
+from typing import Any, Generic, cast
+
+from annotated_types import SLOTS
+from typing_extensions import override
+
+from combadge._helpers.asyncio import spawn
+from combadge.core.markers.method import MethodMarker
+from combadge.core.typevars import FunctionT
+
+__all__ = ("Batched", "batched")
+
+
+@dataclass(**SLOTS)
+class Batched(Generic[FunctionT], MethodMarker[Any, FunctionT]):  # noqa: D101
+    bulk_method: str
+    key: Callable[[Any], Hashable] | None = None
+    unpack: Callable[[Any], Iterable[Any]] | None = None
+    window: float = 0.0
+    max_batch_size: int = 100
+
+    @override
+    def wrap(self, what: FunctionT) -> FunctionT:  # noqa: D102
+        if not iscoroutinefunction(what):
+            raise TypeError(f"`@batched` requires an async backend, but `{what.__qualname__}` is synchronous")
+        return _Batcher(self, what).wrap()
+
+
+class _Batcher(Generic[FunctionT]):
+    """Collects the calls of the bound method into batches, which is created once per binding."""
+
+    __slots__ = ("marker", "method", "bind_arguments", "batch", "batch_service", "timer")
+
+    def __init__(self, marker: Batched[FunctionT], method: FunctionT) -> None:
+        self.marker = marker
+        self.method = method
+        parameters = [name for name in get_signature(method).parameters if name != "self"]
+        if len(parameters) != 1:
+            raise TypeError(f"`@batched` requires `{method.__qualname__}` to accept exactly one argument")
+        self.bind_arguments = get_signature(method).bind
+
+        self.batch: dict[Hashable, list[Future[Any]]] = {}
+        """Pending futures by the requested keys."""
+
+        self.batch_service: Any = None
+        """Service instance on which the bulk method gets called."""
+
+        self.timer: TimerHandle | None = None
+
+    def wrap(self) -> FunctionT:
+        @wraps(self.method)
+        async def wrapper(service: Any, *args: Any, **kwargs: Any) -> Any:
+            bound_arguments = self.bind_arguments(service, *args, **kwargs)
+            bound_arguments.apply_defaults()
+            (key,) = (value for name, value in bound_arguments.arguments.items() if name != "self")
+
+            loop = get_running_loop()
+            future: Future[Any] = loop.create_future()
+            if not self.batch:
+                self.batch_service = service
+                self.timer = loop.call_later(self.marker.window, self._flush)
+            self.batch.setdefault(key, []).append(future)
+            if len(self.batch) >= self.marker.max_batch_size:
+                self._flush()
+            return await future
+
+        return cast(FunctionT, wrapper)
+
+    def _flush(self) -> None:
+        """Send the pending batch and start a new one."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.batch:
+            spawn(self._dispatch(self.batch_service, self.batch))
+            self.batch = {}
+            self.batch_service = None
+
+    async def _dispatch(self, service: Any, batch: dict[Hashable, list[Future[Any]]]) -> None:
+        """Call the bulk method, and route the results back to the callers."""
+        try:
+            response = await getattr(service, self.marker.bulk_method)(list(batch))
+            items = self.marker.unpack(response) if self.marker.unpack is not None else response
+            if self.marker.key is not None:
+                results = {self.marker.key(item): item for item in items}
+            else:
+                results = dict(zip(batch, items, strict=True))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        except BaseException:
+            # The dispatch has been cancelled, for example, on the event loop shutdown, so should be the callers:
+            for futures in batch.values():
+                for future in futures:
+                    future.cancel()
+            raise
+
+        for key, futures in batch.items():
+            for future in futures:
+                if future.done():
+                    continue  # the caller has been cancelled
+                try:
+                    future.set_result(results[key])
+                except KeyError:
+                    future.set_exception(KeyError(key))
+
+
+def batched(
+    bulk_method: str,
+    *,
+    key: Callable[[Any], Hashable] | None = None,
+    unpack: Callable[[Any], Iterable[Any]] | None = None,
+    window: float = 0.0,
+    max_batch_size: int = 100,
+) -> Callable[[FunctionT], FunctionT]:
+    """
+    Collect the concurrent calls of the async single-item method, and send them as one bulk request.
+
+    The marked method must accept exactly one argument, which is the item key.
+    The bulk method of the same protocol receives the list of the unique keys.
+
+    Args:
+        bulk_method: name of the bulk method in the same protocol
+        key: extracts the key from a bulk result item, so that the item is routed back to its caller;
+            by default, the result items are matched with the requested keys by their positions
+        unpack: extracts the result items from the bulk method response;
+            by default, the response itself should be iterable
+        window: time (in seconds) during which the calls are collected, `0.0` means the same event loop tick
+        max_batch_size: the batch is sent immediately once it reaches the size
+
+    Raises:
+        KeyError: raised for a caller, whose key is missing in the bulk response
+
+    Examples:
+        >>> class SupportsItems(Protocol):
+        >>>     @batched("get_items", key=lambda item: item.id, unpack=lambda response: response.root)
+        >>>     async def get_item(self, item_id: int) -> Item:
+        >>>         ...
+        >>>
+        >>>     @http_method("GET")
+        >>>     @path("/items")
+        >>>     async def get_items(self, item_ids: Annotated[list[int], QueryArrayParam("id")]) -> Items:
+        >>>         ...
+    """
+    return Batched[Any](bulk_method, key, unpack, window, max_batch_size).mark
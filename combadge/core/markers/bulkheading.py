@@ -0,0 +1,87 @@
+"""Bulkhead method marker."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Generic, cast
+
+from annotated_types import SLOTS
+from typing_extensions import override
+
+from combadge.core.concurrency import Bulkhead
+from combadge.core.markers.method import MethodMarker
+from combadge.core.typevars import FunctionT
+
+__all__ = ("Bulkheaded", "bulkhead")
+
+
+@dataclass(**SLOTS)
+class Bulkheaded(Generic[FunctionT], MethodMarker[Any, FunctionT]):  # noqa: D101
+    bulkhead: Callable[[], Bulkhead] | Bulkhead
+
+    @override
+    def wrap(self, what: FunctionT) -> FunctionT:  # noqa: D102
+        bulkhead = self.bulkhead if isinstance(self.bulkhead, Bulkhead) else self.bulkhead()
+
+        if iscoroutinefunction(what):
+
+            @wraps(what)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                async with bulkhead.acquire_async():
+                    return await what(*args, **kwargs)
+
+            return cast(FunctionT, async_wrapper)
+
+        @wraps(what)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with bulkhead.acquire():
+                return what(*args, **kwargs)
+
+        return cast(FunctionT, wrapper)
+
+
+def bulkhead(
+    max_concurrency: int | Bulkhead,
+    *,
+    max_queue_size: int | None = None,
+    max_wait: float | None = None,
+) -> Callable[[FunctionT], FunctionT]:
+    """
+    Cap the number of the concurrent calls, so that a slow method cannot starve the rest of a backend.
+
+    The excess calls wait in the bulkhead's own queue, and get rejected with
+    [`LimitExceededError`][combadge.core.errors.LimitExceededError] when the queue is full
+    or the wait is too long.
+
+    Tip: Reserving a capacity
+        Capping the non-critical methods of a backend below its connection pool size
+        effectively reserves the rest of the pool for the critical ones.
+
+    Args:
+        max_concurrency: maximum number of the concurrent calls of this method,
+            or a [`Bulkhead`][combadge.core.concurrency.Bulkhead] instance which may be shared by a group of methods
+        max_queue_size: calls beyond the queue size are rejected immediately
+        max_wait: maximum queueing time (in seconds)
+
+    Examples:
+        >>> reports = Bulkhead(2, max_wait=10.0)
+        >>>
+        >>> class SupportsReports(Protocol):
+        >>>     @bulkhead(reports)
+        >>>     @http_method("GET")
+        >>>     @path("/reports/daily")
+        >>>     async def get_daily_report(self) -> ...:
+        >>>         ...
+        >>>
+        >>>     @bulkhead(reports)
+        >>>     @http_method("GET")
+        >>>     @path("/reports/monthly")
+        >>>     async def get_monthly_report(self) -> ...:
+        >>>         ...
+    """
+    if isinstance(max_concurrency, Bulkhead):
+        return Bulkheaded[Any](max_concurrency).mark
+    return Bulkheaded[Any](lambda: Bulkhead(max_concurrency, max_queue_size=max_queue_size, max_wait=max_wait)).mark
@@ -0,0 +1,169 @@
+"""Response caching method marker."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from logging import getLogger
+from threading import Lock, Thread
+from time import time
+from typing import Any, Generic, cast
+
+from annotated_types import SLOTS
+from pydantic import TypeAdapter
+from typing_extensions import override
+
+from combadge._helpers.asyncio import spawn
+from combadge._helpers.fingerprint import make_fingerprinter
+from combadge._helpers.pydantic import get_type_adapter
+from combadge.core.cache import BaseCache, CacheEntry, MemoryCache
+from combadge.core.markers.method import MethodMarker
+from combadge.core.response import ErrorResponse
+from combadge.core.typevars import FunctionT
+
+__all__ = ("Cached", "cached")
+
+logger = getLogger(__name__)
+
+
+@dataclass(**SLOTS)
+class Cached(Generic[FunctionT], MethodMarker[Any, FunctionT]):  # noqa: D101
+    ttl: float
+    error_ttl: float | None = None
+    stale_while_revalidate: float = 0.0
+    maxsize: int | None = 1024
+    storage: BaseCache | None = None
+    key: Callable[..., Any] | None = None
+
+    @override
+    def wrap(self, what: FunctionT) -> FunctionT:  # noqa: D102
+        return _CachedCall(self, what).wrap()
+
+
+class _CachedCall(Generic[FunctionT]):
+    """State of the cached bound method, which is created once per binding."""
+
+    __slots__ = ("marker", "method", "storage", "fingerprint", "response_type", "refreshing", "lock")
+
+    def __init__(self, marker: Cached[FunctionT], method: FunctionT) -> None:
+        from combadge.core.signature import Signature  # avoid the circular import
+
+        self.marker = marker
+        self.method = method
+        self.storage = marker.storage if marker.storage is not None else MemoryCache(marker.maxsize)
+        self.fingerprint = make_fingerprinter(method, key=marker.key, portable=self.storage.shared)
+        self.response_type: TypeAdapter[Any] = get_type_adapter(
+            cast(Hashable, Signature.from_method(method).return_type),
+        )
+        self.refreshing: set[str] = set()
+        """Keys which are being refreshed in the background at the moment."""
+        self.lock = Lock()
+
+    def wrap(self) -> FunctionT:
+        method = self.method
+        storage = self.storage
+        fingerprint = self.fingerprint
+        response_type = self.response_type
+
+        if iscoroutinefunction(method):
+
+            @wraps(method)
+            async def async_wrapper(service: Any, *args: Any, **kwargs: Any) -> Any:
+                key = fingerprint(service, args, kwargs)
+                entry = storage.get(key, response_type)
+                if entry is not None:
+                    if not entry.is_fresh(time()) and self._start_refresh(key):
+                        spawn(self._refresh_async(key, service, args, kwargs))
+                    return entry.value
+                return self._store(key, await method(service, *args, **kwargs))
+
+            return cast(FunctionT, async_wrapper)
+
+        @wraps(method)
+        def wrapper(service: Any, *args: Any, **kwargs: Any) -> Any:
+            key = fingerprint(service, args, kwargs)
+            entry = storage.get(key, response_type)
+            if entry is not None:
+                if not entry.is_fresh(time()) and self._start_refresh(key):
+                    Thread(target=self._refresh, args=(key, service, args, kwargs), daemon=True).start()
+                return entry.value
+            return self._store(key, method(service, *args, **kwargs))
+
+        return cast(FunctionT, wrapper)
+
+    def _store(self, key: str, response: Any) -> Any:
+        """Store the response in the cache, if it is cacheable, and return it back."""
+        ttl = self.marker.error_ttl if isinstance(response, ErrorResponse) else self.marker.ttl
+        if ttl is not None:
+            fresh_until = time() + ttl
+            entry = CacheEntry(response, fresh_until, fresh_until + self.marker.stale_while_revalidate)
+            self.storage.set(key, entry, self.response_type)
+        return response
+
+    def _start_refresh(self, key: str) -> bool:
+        """Mark the key as being refreshed, return `False` if it is already being refreshed."""
+        with self.lock:
+            if key in self.refreshing:
+                return False
+            self.refreshing.add(key)
+            return True
+
+    def _refresh(self, key: str, service: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        try:
+            self._store(key, self.method(service, *args, **kwargs))
+        except Exception:
+            logger.exception("Failed to refresh the cached response, the stale one is kept.")
+        finally:
+            self.refreshing.discard(key)
+
+    async def _refresh_async(self, key: str, service: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        try:
+            self._store(key, await self.method(service, *args, **kwargs))
+        except Exception:
+            logger.exception("Failed to refresh the cached response, the stale one is kept.")
+        finally:
+            self.refreshing.discard(key)
+
+
+def cached(
+    ttl: float,
+    *,
+    error_ttl: float | None = None,
+    stale_while_revalidate: float = 0.0,
+    maxsize: int | None = 1024,
+    storage: BaseCache | None = None,
+    key: Callable[..., Any] | None = None,
+) -> Callable[[FunctionT], FunctionT]:
+    """
+    Cache the bound service method responses.
+
+    The cache key is a canonical fingerprint of the method and its call arguments
+    (with the defaults applied), so the equal calls share the cached response.
+    Raised exceptions are never cached.
+
+    Works with both sync and async backends.
+
+    Args:
+        ttl: time (in seconds) during which a successful response is served from the cache
+        error_ttl: time (in seconds) during which an `ErrorResponse` is served from the cache,
+            `#!python None` disables caching of the error responses
+        stale_while_revalidate: time (in seconds) after the expiration, during which the stale response
+            is still served, while it is being refreshed in the background
+        maxsize: maximum number of cached responses of the default in-memory storage
+        storage: custom cache storage, by default each bound method gets its own
+            [`MemoryCache`][combadge.core.cache.MemoryCache]; use
+            [`SqliteCache`][combadge.core.cache.SqliteCache] to share the cache between processes
+        key: function which receives the call arguments (without `self`), and returns a JSON-serializable cache key
+            instead of them; this is needed for the arguments which are not JSON-serializable,
+            when the storage is shared between processes
+
+    Examples:
+        >>> class SupportsCountryInfo(Protocol):
+        >>>     @cached(ttl=3600.0, error_ttl=60.0, stale_while_revalidate=600.0)
+        >>>     @operation_name("FullCountryInfo")
+        >>>     def get_country_info(self, ...) -> ...:
+        >>>         ...
+    """
+    return Cached[Any](ttl, error_ttl, stale_while_revalidate, maxsize, storage, key).mark
@@ -0,0 +1,115 @@
+"""Circuit breaker method marker."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Generic, cast
+
+from annotated_types import SLOTS
+from typing_extensions import override
+
+from combadge._helpers.backend_local import BackendLocal
+from combadge.core.circuit_breaker import CircuitBreaker
+from combadge.core.markers.method import MethodMarker
+from combadge.core.typevars import FunctionT
+
+__all__ = ("CircuitBroken", "circuit_breaker")
+
+_backend_breakers: dict[Hashable, BackendLocal[CircuitBreaker]] = {}
+"""Backend breakers, keyed by the breaker configuration – so that only the equally configured methods share one."""
+
+
+@dataclass(frozen=True, **SLOTS)
+class _CircuitBreakerFactory:
+    failure_threshold: int
+    recovery_timeout: float
+    half_open_probes: int
+
+    def __call__(self) -> CircuitBreaker:
+        return CircuitBreaker(
+            self.failure_threshold,
+            recovery_timeout=self.recovery_timeout,
+            half_open_probes=self.half_open_probes,
+        )
+
+
+@dataclass(**SLOTS)
+class CircuitBroken(Generic[FunctionT], MethodMarker[Any, FunctionT]):  # noqa: D101
+    breaker: Callable[[], CircuitBreaker] | CircuitBreaker
+    per_backend: bool = False
+
+    @override
+    def wrap(self, what: FunctionT) -> FunctionT:  # noqa: D102
+        method_breaker = self.breaker if isinstance(self.breaker, CircuitBreaker) else self.breaker()
+        backend_breakers = _backend_breakers.setdefault(self.breaker, BackendLocal())
+
+        def get_breaker(service: Any) -> CircuitBreaker:
+            return backend_breakers.get(service, method_breaker) if self.per_backend else method_breaker
+
+        if iscoroutinefunction(what):
+
+            @wraps(what)
+            async def async_wrapper(service: Any, *args: Any, **kwargs: Any) -> Any:
+                breaker = get_breaker(service)
+                token = breaker.before_call()
+                try:
+                    response = await what(service, *args, **kwargs)
+                except BaseException as e:
+                    breaker.after_call(token, e)
+                    raise
+                breaker.after_call(token, None)
+                return response
+
+            return cast(FunctionT, async_wrapper)
+
+        @wraps(what)
+        def wrapper(service: Any, *args: Any, **kwargs: Any) -> Any:
+            breaker = get_breaker(service)
+            token = breaker.before_call()
+            try:
+                response = what(service, *args, **kwargs)
+            except BaseException as e:
+                breaker.after_call(token, e)
+                raise
+            breaker.after_call(token, None)
+            return response
+
+        return cast(FunctionT, wrapper)
+
+
+def circuit_breaker(
+    failure_threshold: int | CircuitBreaker = 5,
+    *,
+    recovery_timeout: float = 30.0,
+    half_open_probes: int = 1,
+    per_backend: bool = False,
+) -> Callable[[FunctionT], FunctionT]:
+    """
+    Fail the calls fast while a server is down, instead of waiting for the timeouts.
+
+    See [`CircuitBreaker`][combadge.core.circuit_breaker.CircuitBreaker] for the details.
+
+    Args:
+        failure_threshold: number of the consecutive failures which opens the breaker of this method,
+            or a breaker instance – which may be shared between methods and services, and allows observing its state
+        recovery_timeout: time (in seconds) after which the open breaker lets the probe calls through
+        half_open_probes: maximum number of the concurrent probe calls
+        per_backend: share the breaker between all the methods of a backend which are marked with `per_backend`
+            and the same breaker settings (or the same breaker instance)
+
+    Examples:
+        >>> class SupportsCountryInfo(Protocol):
+        >>>     @circuit_breaker(5, recovery_timeout=10.0)
+        >>>     @operation_name("FullCountryInfo")
+        >>>     def get_country_info(self, ...) -> ...:
+        >>>         ...
+    """
+    if isinstance(failure_threshold, CircuitBreaker):
+        return CircuitBroken[Any](failure_threshold, per_backend).mark
+    return CircuitBroken[Any](
+        _CircuitBreakerFactory(failure_threshold, recovery_timeout, half_open_probes),
+        per_backend,
+    ).mark
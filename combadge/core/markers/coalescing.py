@@ -0,0 +1,64 @@
+"""Request coalescing method marker."""
+
+from __future__ import annotations
+
+from asyncio import Task, shield
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Generic, cast
+
+from annotated_types import SLOTS
+from typing_extensions import override
+
+from combadge._helpers.asyncio import spawn
+from combadge._helpers.fingerprint import make_fingerprinter
+from combadge.core.markers.method import MethodMarker
+from combadge.core.typevars import FunctionT
+
+__all__ = ("SingleFlight", "single_flight")
+
+
+@dataclass(**SLOTS)
+class SingleFlight(Generic[FunctionT], MethodMarker[Any, FunctionT]):  # noqa: D101
+    @override
+    def wrap(self, what: FunctionT) -> FunctionT:  # noqa: D102
+        if not iscoroutinefunction(what):
+            raise TypeError(f"`@single_flight` requires an async backend, but `{what.__qualname__}` is synchronous")
+
+        fingerprint = make_fingerprinter(what)
+        in_flight: dict[str, Task[Any]] = {}
+
+        @wraps(what)
+        async def wrapper(service: Any, *args: Any, **kwargs: Any) -> Any:
+            key = fingerprint(service, args, kwargs)
+            task = in_flight.get(key)
+            if task is None:
+                task = in_flight[key] = spawn(what(service, *args, **kwargs))
+                task.add_done_callback(lambda _: in_flight.pop(key, None))
+            # Shielding, so that a cancelled waiter does not cancel the shared call:
+            return await shield(task)
+
+        return cast(FunctionT, wrapper)
+
+
+def single_flight() -> Callable[[FunctionT], FunctionT]:
+    """
+    Coalesce the identical concurrent calls of the async bound method.
+
+    While a call is in flight, the identical calls (with respect to a canonical fingerprint of the call arguments)
+    do not hit the server, but instead await the in-flight call and share its result or exception.
+    Cancelling one of the waiters does not cancel the shared call.
+
+    Examples:
+        >>> class SupportsCountryInfo(Protocol):
+        >>>     @single_flight()
+        >>>     @operation_name("FullCountryInfo")
+        >>>     async def get_country_info(self, ...) -> ...:
+        >>>         ...
+
+    Tip: Combine with [`@cached`][combadge.core.markers.caching.cached]
+        Put `@cached` **above** `@single_flight` to coalesce the calls that miss the cache.
+    """
+    return SingleFlight[Any]().mark
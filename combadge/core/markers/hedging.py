@@ -0,0 +1,113 @@
+"""Hedged requests method marker."""
+
+from __future__ import annotations
+
+from asyncio import FIRST_COMPLETED, CancelledError, Task, create_task, wait
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from time import monotonic
+from typing import Any, Generic, cast
+
+from annotated_types import SLOTS
+from typing_extensions import override
+
+from combadge._helpers.budget import Budget
+from combadge._helpers.latency import LatencyWindow
+from combadge.core.markers.method import MethodMarker
+from combadge.core.typevars import FunctionT
+
+__all__ = ("Hedged", "hedged")
+
+
+@dataclass(**SLOTS)
+class Hedged(Generic[FunctionT], MethodMarker[Any, FunctionT]):  # noqa: D101
+    delay: float | None = None
+    percentile: float = 0.95
+    budget: float = 0.1
+
+    @override
+    def wrap(self, what: FunctionT) -> FunctionT:  # noqa: D102
+        if not iscoroutinefunction(what):
+            raise TypeError(f"`@hedged` requires an async backend, but `{what.__qualname__}` is synchronous")
+
+        latencies = LatencyWindow()
+        budget = Budget(self.budget)
+
+        async def call_primary(service: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+            # Only the primary calls are recorded: a hedge only completes when it wins, so its latency is biased low.
+            start_time = monotonic()
+            try:
+                response = await what(service, *args, **kwargs)
+            except CancelledError:
+                # The call has lost to the hedge (or timed out), so its latency is at least the time spent:
+                latencies.add(monotonic() - start_time)
+                raise
+            latencies.add(monotonic() - start_time)
+            return response
+
+        @wraps(what)
+        async def wrapper(service: Any, *args: Any, **kwargs: Any) -> Any:
+            budget.deposit()
+            delay = self.delay if self.delay is not None else latencies.percentile(self.percentile)
+
+            tasks: set[Task[Any]] = {create_task(call_primary(service, args, kwargs))}
+            try:
+                if delay is not None:
+                    done, _ = await wait(tasks, timeout=delay)
+                    if not done and budget.withdraw():
+                        # The primary request is late, hedging it with a duplicate:
+                        tasks.add(create_task(what(service, *args, **kwargs)))
+                return await _first_successful(tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        return cast(FunctionT, wrapper)
+
+
+async def _first_successful(tasks: set[Task[Any]]) -> Any:
+    """Wait for the first successful task, or raise the earliest exception if all of them have failed."""
+    pending = set(tasks)
+    exception: BaseException | None = None
+    while pending:
+        done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+        for task in done:
+            if (task_exception := task.exception()) is None:
+                return task.result()
+            if exception is None:
+                exception = task_exception
+    raise cast(BaseException, exception)
+
+
+def hedged(
+    delay: float | None = None,
+    *,
+    percentile: float = 0.95,
+    budget: float = 0.1,
+) -> Callable[[FunctionT], FunctionT]:
+    """
+    Hedge the slow calls of the async idempotent method with duplicate requests.
+
+    If no response arrives within the delay, a duplicate request is sent,
+    the first successful response is taken, and the other request is cancelled.
+
+    Warning: Only use it with idempotent methods
+        Both requests may reach the server.
+
+    Args:
+        delay: hedging delay (in seconds), by default the observed latency percentile of the primary requests
+            is used (the method is not hedged until enough latencies are observed); a primary request which
+            has lost to its hedge counts with the time it has taken until the cancellation
+        percentile: latency percentile used as the hedging delay, when the delay is not specified
+        budget: maximum ratio of the hedged requests to the calls, so that a slow server is not overloaded
+
+    Examples:
+        >>> class SupportsCountryInfo(Protocol):
+        >>>     @hedged(percentile=0.95, budget=0.05)
+        >>>     @operation_name("FullCountryInfo")
+        >>>     async def get_country_info(self, ...) -> ...:
+        >>>         ...
+    """
+    return Hedged[Any](delay, percentile, budget).mark
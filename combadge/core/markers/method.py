@@ -4,7 +4,7 @@ from abc import ABC
 from collections.abc import Callable
 from dataclasses import dataclass
 from inspect import BoundArguments
-from typing import Any, Generic
+from typing import Any, ClassVar, Generic
 
 from annotated_types import SLOTS
 from typing_extensions import override
@@ -16,6 +16,9 @@ from combadge.core.typevars import BackendRequestT, FunctionT
 class MethodMarker(ABC, Generic[BackendRequestT, FunctionT]):
     """Method marker that modifies an entire request based on all the call arguments."""
 
+    outermost: ClassVar[bool] = False
+    """Whether the marker wraps the method after all the other markers, regardless of the decorator order."""
+
     def mark(self, what: FunctionT) -> FunctionT:
         """
         Mark the function with itself.
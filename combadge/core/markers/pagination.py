@@ -0,0 +1,419 @@
+"""Pagination method markers."""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from asyncio import Task, create_task
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from functools import partial, wraps
+from inspect import iscoroutinefunction
+from inspect import signature as get_signature
+from typing import Any, ClassVar, Generic, Protocol, cast, overload
+from urllib.parse import parse_qsl, urlsplit
+
+from annotated_types import SLOTS
+from typing_extensions import ParamSpec, override
+
+from combadge.core.markers.method import MethodMarker
+from combadge.core.response import BaseResponse
+from combadge.core.typevars import FunctionT
+
+__all__ = (
+    "PaginationStrategy",
+    "CursorPagination",
+    "OffsetPagination",
+    "LinkPagination",
+    "Paginated",
+    "paginate_by_cursor",
+    "paginate_by_offset",
+    "paginate_by_link",
+)
+
+_LINK_RE = re.compile(r"<(?P<url>[^>]*)>(?P<parameters>[^,]*)")
+_REL_RE = re.compile(r""";\s*rel\s*=\s*"?(?P<rel>[^";]+)"?""")
+
+_P = ParamSpec("_P")
+
+
+class _Paginate(Protocol):
+    """Pagination decorator, which turns the page method into an iterator over the items."""
+
+    @overload
+    def __call__(self, method: Callable[_P, Awaitable[Any]], /) -> Callable[_P, AsyncIterator[Any]]: ...
+
+    @overload
+    def __call__(self, method: Callable[_P, Any], /) -> Callable[_P, Iterator[Any]]: ...
+
+
+@dataclass(kw_only=True, **SLOTS)
+class PaginationStrategy(ABC):
+    """Derives the arguments of the next page call."""
+
+    page_size_parameter: str | None = None
+    """Method parameter which accepts the page size."""
+
+    page_size: int | None = None
+    """Page size hint, which is passed unless a caller has specified the page size explicitly."""
+
+    def first(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Get the first page call arguments."""
+        if (
+            self.page_size_parameter is not None
+            and self.page_size is not None
+            and arguments.get(self.page_size_parameter) is None
+        ):
+            arguments = {**arguments, self.page_size_parameter: self.page_size}
+        return arguments
+
+    @abstractmethod
+    def next(self, arguments: dict[str, Any], page: Any, items: list[Any]) -> dict[str, Any] | None:
+        """
+        Get the next page call arguments.
+
+        Args:
+            arguments: the current page call arguments
+            page: the current page response
+            items: the current page items
+
+        Returns:
+            The next page call arguments, or `#!python None` if the current page is the last one.
+        """
+        raise NotImplementedError
+
+    def predict(self, arguments: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Get the next page call arguments without waiting for the current page.
+
+        Returns:
+            `#!python None` when the next page depends on the current page response.
+        """
+        return None
+
+
+@dataclass(kw_only=True, **SLOTS)
+class CursorPagination(PaginationStrategy):
+    """Pass the next page cursor from the current page response."""
+
+    parameter: str
+    """Method parameter which accepts the cursor."""
+
+    next_cursor: str
+    """Response attribute which contains the next page cursor, empty on the last page."""
+
+    @override
+    def next(self, arguments: dict[str, Any], page: Any, items: list[Any]) -> dict[str, Any] | None:  # noqa: D102
+        if not (cursor := getattr(page, self.next_cursor)):
+            return None
+        return {**arguments, self.parameter: cursor}
+
+
+@dataclass(kw_only=True, **SLOTS)
+class OffsetPagination(PaginationStrategy):
+    """
+    Advance the offset by the page size.
+
+    The next pages are predictable, so the prefetching requests them concurrently.
+    """
+
+    offset_parameter: str = "offset"
+    """Method parameter which accepts the offset."""
+
+    page_size_parameter: str | None = "limit"
+
+    @override
+    def next(self, arguments: dict[str, Any], page: Any, items: list[Any]) -> dict[str, Any] | None:  # noqa: D102
+        limit = arguments.get(self.page_size_parameter) if self.page_size_parameter is not None else None
+        if not items or (limit is not None and len(items) < limit):
+            return None
+        return {**arguments, self.offset_parameter: (arguments.get(self.offset_parameter) or 0) + len(items)}
+
+    @override
+    def predict(self, arguments: dict[str, Any]) -> dict[str, Any] | None:  # noqa: D102
+        limit = arguments.get(self.page_size_parameter) if self.page_size_parameter is not None else None
+        if limit is None:
+            return None
+        return {**arguments, self.offset_parameter: (arguments.get(self.offset_parameter) or 0) + limit}
+
+
+@dataclass(kw_only=True, **SLOTS)
+class LinkPagination(PaginationStrategy):
+    """
+    Follow the `rel="next"` link of the [RFC 5988](https://datatracker.ietf.org/doc/html/rfc5988) `Link` header.
+
+    The query parameters of the next page link are passed to the method parameters.
+    Use the [`Header`][combadge.support.http.markers.Header] response marker to put the header into the response.
+    """
+
+    link: str = "link"
+    """Response attribute which contains the `Link` header value."""
+
+    parameters: Mapping[str, str] | None = None
+    """
+    Mapping of the link query parameter names to the method parameter names.
+
+    By default, the query parameters are passed to the method parameters with the same names.
+    """
+
+    @override
+    def next(self, arguments: dict[str, Any], page: Any, items: list[Any]) -> dict[str, Any] | None:  # noqa: D102
+        if not (header := getattr(page, self.link)) or (url := _find_next_link(header)) is None:
+            return None
+        next_arguments = dict(arguments)
+        for name, value in parse_qsl(urlsplit(url).query):
+            parameter = self.parameters.get(name) if self.parameters is not None else name
+            if parameter is not None and parameter in arguments:
+                next_arguments[parameter] = value
+        return next_arguments
+
+
+def _find_next_link(header: str) -> str | None:
+    for match in _LINK_RE.finditer(header):
+        for rel_match in _REL_RE.finditer(match["parameters"]):
+            if "next" in rel_match["rel"].lower().split():
+                return match["url"]
+    return None
+
+
+@dataclass(**SLOTS)
+class Paginated(Generic[FunctionT], MethodMarker[Any, FunctionT]):  # noqa: D101
+    strategy: PaginationStrategy
+    items: str = "items"
+    prefetch: int = 1
+
+    outermost: ClassVar[bool] = True
+
+    @override
+    def wrap(self, what: FunctionT) -> FunctionT:  # noqa: D102
+        bind_arguments = get_signature(what).bind
+
+        def bind(service: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+            bound_arguments = bind_arguments(service, *args, **kwargs)
+            bound_arguments.apply_defaults()
+            arguments = dict(bound_arguments.arguments)
+            del arguments["self"]
+            return self.strategy.first(arguments)
+
+        if iscoroutinefunction(what):
+
+            @wraps(what)
+            async def async_wrapper(service: Any, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                async for item in self._iterate_async(what, service, bind(service, args, kwargs)):
+                    yield item
+
+            return cast(FunctionT, async_wrapper)
+
+        @wraps(what)
+        def wrapper(service: Any, *args: Any, **kwargs: Any) -> Iterator[Any]:
+            yield from self._iterate(what, service, bind(service, args, kwargs))
+
+        return cast(FunctionT, wrapper)
+
+    def _iterate(self, method: Callable[..., Any], service: Any, arguments: dict[str, Any]) -> Iterator[Any]:
+        strategy = self.strategy
+        with ThreadPoolExecutor(max_workers=max(self.prefetch, 1), thread_name_prefix="combadge-page") as executor:
+            pending: deque[tuple[dict[str, Any], Future[Any]]] = deque()
+
+            def request(arguments: dict[str, Any]) -> None:
+                # Run in a copy of the caller's context to carry the deadline over to the worker thread:
+                pending.append((arguments, executor.submit(copy_context().run, partial(method, service, **arguments))))
+
+            request(arguments)
+            try:
+                while pending:
+                    self._request_predicted(pending, request)
+                    arguments, future = pending.popleft()
+                    page = future.result()
+                    if isinstance(page, BaseResponse):
+                        page.raise_for_result()
+                    items = list(getattr(page, self.items))
+                    next_arguments = strategy.next(arguments, page, items)
+                    if next_arguments is None:
+                        self._cancel(pending)
+                    elif not pending and self.prefetch:
+                        request(next_arguments)  # prefetch while the items are being consumed
+                    yield from items
+                    if next_arguments is not None and not pending:
+                        request(next_arguments)
+            finally:
+                self._cancel(pending)
+
+    async def _iterate_async(
+        self,
+        method: Callable[..., Any],
+        service: Any,
+        arguments: dict[str, Any],
+    ) -> AsyncIterator[Any]:
+        strategy = self.strategy
+        pending: deque[tuple[dict[str, Any], Task[Any]]] = deque()
+
+        def request(arguments: dict[str, Any]) -> None:
+            pending.append((arguments, create_task(method(service, **arguments))))
+
+        request(arguments)
+        try:
+            while pending:
+                self._request_predicted(pending, request)
+                arguments, task = pending.popleft()
+                page = await task
+                if isinstance(page, BaseResponse):
+                    page.raise_for_result()
+                items = list(getattr(page, self.items))
+                next_arguments = strategy.next(arguments, page, items)
+                if next_arguments is None:
+                    self._cancel(pending)
+                elif not pending and self.prefetch:
+                    request(next_arguments)  # prefetch while the items are being consumed
+                for item in items:
+                    yield item
+                if next_arguments is not None and not pending:
+                    request(next_arguments)
+        finally:
+            self._cancel(pending)
+
+    def _request_predicted(self, pending: deque[Any], request: Callable[[dict[str, Any]], None]) -> None:
+        """Request the predictable pages ahead, up to the prefetch depth."""
+        while len(pending) <= self.prefetch and (arguments := self.strategy.predict(pending[-1][0])) is not None:
+            request(arguments)
+
+    @staticmethod
+    def _cancel(pending: deque[Any]) -> None:
+        for _, future in pending:
+            future.cancel()
+        pending.clear()
+
+
+def paginate_by_cursor(
+    parameter: str,
+    next_cursor: str,
+    *,
+    items: str = "items",
+    page_size_parameter: str | None = None,
+    page_size: int | None = None,
+    prefetch: int = 1,
+) -> _Paginate:
+    """
+    Turn the method into a lazy iterator over the items of all the pages, which are chained by cursors.
+
+    A call returns `Iterator` (or `AsyncIterator`, for an async method) over the page items, and the decorated
+    method is annotated accordingly. An error response page raises its error.
+
+    The pagination wraps the method after all the other markers, regardless of the decorator order,
+    so that retries, timeouts, and so on apply to each page request.
+
+    Args:
+        parameter: method parameter which accepts the cursor
+        next_cursor: page response attribute with the next page cursor, empty on the last page
+        items: page response attribute with the items
+        page_size_parameter: method parameter which accepts the page size
+        page_size: page size hint
+        prefetch: number of pages requested ahead while the current page is being consumed; a cursor-chained
+            page is only known after the previous page, so any positive value means the next page
+
+    Examples:
+        >>> class SupportsUsers(Protocol):
+        >>>     @paginate_by_cursor("cursor", "next_cursor")
+        >>>     @http_method("GET")
+        >>>     @path("/users")
+        >>>     def list_users(self, cursor: Annotated[str | None, QueryParam("cursor")] = None) -> UsersPage:
+        >>>         ...
+        >>>
+        >>> for user in service.list_users():
+        >>>     ...
+    """
+    strategy = CursorPagination(
+        parameter=parameter,
+        next_cursor=next_cursor,
+        page_size_parameter=page_size_parameter,
+        page_size=page_size,
+    )
+    return cast(_Paginate, Paginated[Any](strategy, items, prefetch).mark)
+
+
+def paginate_by_offset(
+    *,
+    offset_parameter: str = "offset",
+    limit_parameter: str = "limit",
+    page_size: int | None = None,
+    items: str = "items",
+    prefetch: int = 1,
+) -> _Paginate:
+    """
+    Turn the method into a lazy iterator over the items of all the pages, which are addressed by offset and limit.
+
+    The iteration stops on an empty page, or on a page shorter than the limit.
+
+    Args:
+        offset_parameter: method parameter which accepts the offset
+        limit_parameter: method parameter which accepts the limit (page size)
+        page_size: page size hint; once the limit is known, the prefetched pages are requested concurrently
+        items: page response attribute with the items
+        prefetch: number of pages requested ahead while the current page is being consumed
+
+    Examples:
+        >>> class SupportsUsers(Protocol):
+        >>>     @paginate_by_offset(page_size=100, prefetch=2)
+        >>>     @http_method("GET")
+        >>>     @path("/users")
+        >>>     def list_users(
+        >>>         self,
+        >>>         offset: Annotated[int, QueryParam("offset")] = 0,
+        >>>         limit: Annotated[int | None, QueryParam("limit")] = None,
+        >>>     ) -> UsersPage:
+        >>>         ...
+    """
+    strategy = OffsetPagination(
+        offset_parameter=offset_parameter,
+        page_size_parameter=limit_parameter,
+        page_size=page_size,
+    )
+    return cast(_Paginate, Paginated[Any](strategy, items, prefetch).mark)
+
+
+def paginate_by_link(
+    *,
+    link: str = "link",
+    parameters: Mapping[str, str] | None = None,
+    items: str = "items",
+    page_size_parameter: str | None = None,
+    page_size: int | None = None,
+    prefetch: int = 1,
+) -> _Paginate:
+    """
+    Turn the method into a lazy iterator over the items of all the pages, which are linked by the `Link` header.
+
+    Args:
+        link: page response attribute with the `Link` header value
+        parameters: mapping of the next page link query parameters to the method parameters,
+            by default the parameters with the same names are used
+        items: page response attribute with the items
+        page_size_parameter: method parameter which accepts the page size
+        page_size: page size hint
+        prefetch: number of pages requested ahead while the current page is being consumed
+
+    Examples:
+        >>> class UsersPage(BaseModel):
+        >>>     items: list[User]
+        >>>     link: str | None = None
+        >>>
+        >>> class SupportsUsers(Protocol):
+        >>>     @paginate_by_link()
+        >>>     @http_method("GET")
+        >>>     @path("/users")
+        >>>     def list_users(
+        >>>         self,
+        >>>         page: Annotated[int, QueryParam("page")] = 1,
+        >>>     ) -> Annotated[UsersPage, Mixin(Header("Link", "link"))]:
+        >>>         ...
+    """
+    strategy = LinkPagination(
+        link=link,
+        parameters=parameters,
+        page_size_parameter=page_size_parameter,
+        page_size=page_size,
+    )
+    return cast(_Paginate, Paginated[Any](strategy, items, prefetch).mark)
@@ -0,0 +1,67 @@
+"""Priority method marker."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Generic, cast
+
+from annotated_types import SLOTS
+from typing_extensions import override
+
+from combadge.core.concurrency import get_priority, use_priority
+from combadge.core.markers.method import MethodMarker
+from combadge.core.typevars import FunctionT
+
+__all__ = ("Prioritized", "priority")
+
+
+@dataclass(**SLOTS)
+class Prioritized(Generic[FunctionT], MethodMarker[Any, FunctionT]):  # noqa: D101
+    priority: int
+
+    @override
+    def wrap(self, what: FunctionT) -> FunctionT:  # noqa: D102
+        def use_default_priority() -> Any:
+            # The priority set per call takes precedence:
+            return use_priority(get_priority(default=self.priority))
+
+        if iscoroutinefunction(what):
+
+            @wraps(what)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with use_default_priority():
+                    return await what(*args, **kwargs)
+
+            return cast(FunctionT, async_wrapper)
+
+        @wraps(what)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with use_default_priority():
+                return what(*args, **kwargs)
+
+        return cast(FunctionT, wrapper)
+
+
+def priority(priority: int) -> Callable[[FunctionT], FunctionT]:
+    """
+    Set the default priority of the method calls.
+
+    Queued calls with a higher priority are admitted first by the backend's
+    [`ConcurrencyLimiter`][combadge.core.concurrency.ConcurrencyLimiter] (and by the async bulkheads).
+    The default priority is `0`, and it may be overridden per call with
+    [`use_priority()`][combadge.core.concurrency.use_priority].
+
+    Args:
+        priority: call priority, higher is more important
+
+    Examples:
+        >>> class SupportsCountryInfo(Protocol):
+        >>>     @priority(10)
+        >>>     @operation_name("FullCountryInfo")
+        >>>     async def get_country_info(self, ...) -> ...:
+        >>>         ...
+    """
+    return Prioritized[Any](priority).mark
@@ -0,0 +1,107 @@
+"""Rate limiting method marker."""
+
+from __future__ import annotations
+
+from asyncio import sleep as async_sleep
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from time import sleep
+from typing import Any, Generic, cast
+
+from annotated_types import SLOTS
+from typing_extensions import override
+
+from combadge._helpers.backend_local import BackendLocal
+from combadge.core.markers.method import MethodMarker
+from combadge.core.rate_limit import BaseRateLimiter, TokenBucket
+from combadge.core.typevars import FunctionT
+
+__all__ = ("RateLimited", "rate_limit")
+
+_backend_limiters: dict[Hashable, BackendLocal[BaseRateLimiter]] = {}
+"""Backend limiters, keyed by the limiter configuration – so that only the equally configured methods share one."""
+
+
+@dataclass(frozen=True, **SLOTS)
+class _TokenBucketFactory:
+    rate: float
+    burst: float | None
+
+    def __call__(self) -> TokenBucket:
+        return TokenBucket(self.rate, burst=self.burst)
+
+
+@dataclass(**SLOTS)
+class RateLimited(Generic[FunctionT], MethodMarker[Any, FunctionT]):  # noqa: D101
+    limiter: Callable[[], BaseRateLimiter] | BaseRateLimiter
+    per_backend: bool = False
+
+    @override
+    def wrap(self, what: FunctionT) -> FunctionT:  # noqa: D102
+        method_limiter = self.limiter if isinstance(self.limiter, BaseRateLimiter) else self.limiter()
+        backend_limiters = _backend_limiters.setdefault(self.limiter, BackendLocal())
+
+        def get_limiter(service: Any) -> BaseRateLimiter:
+            return backend_limiters.get(service, method_limiter) if self.per_backend else method_limiter
+
+        if iscoroutinefunction(what):
+
+            @wraps(what)
+            async def async_wrapper(service: Any, *args: Any, **kwargs: Any) -> Any:
+                if (delay := get_limiter(service).reserve()) > 0.0:
+                    await async_sleep(delay)
+                return await what(service, *args, **kwargs)
+
+            return cast(FunctionT, async_wrapper)
+
+        @wraps(what)
+        def wrapper(service: Any, *args: Any, **kwargs: Any) -> Any:
+            if (delay := get_limiter(service).reserve()) > 0.0:
+                sleep(delay)
+            return what(service, *args, **kwargs)
+
+        return cast(FunctionT, wrapper)
+
+
+def rate_limit(
+    rate: float | BaseRateLimiter,
+    *,
+    burst: float | None = None,
+    per_backend: bool = False,
+) -> Callable[[FunctionT], FunctionT]:
+    """
+    Pace the method calls with a token bucket.
+
+    Sync calls sleep until their turn, and async calls wait without blocking the event loop.
+    The callers are served in order.
+
+    Args:
+        rate: sustained rate (in calls per second) of this method, or a limiter instance –
+            which may be shared between methods, services, or (see `SharedTokenBucket`) processes
+        burst: maximum number of calls which may be made at once, defaults to the rate
+        per_backend: share the limiter between all the methods of a backend which are marked with `per_backend`
+            and the same rate and burst (or the same limiter instance)
+
+    Examples:
+        Limit a single method:
+
+        >>> class SupportsHttpbin(Protocol):
+        >>>     @rate_limit(10.0)
+        >>>     @http_method("GET")
+        >>>     @path("/get")
+        >>>     def get(self) -> ...:
+        >>>         ...
+
+        Limit all the worker processes on a host:
+
+        >>> limiter = SharedTokenBucket("/run/my-service/httpbin.rate", rate=100.0)
+        >>>
+        >>> class SupportsHttpbin(Protocol):
+        >>>     @rate_limit(limiter)
+        >>>     ...
+    """
+    if isinstance(rate, BaseRateLimiter):
+        return RateLimited[Any](rate, per_backend).mark
+    return RateLimited[Any](_TokenBucketFactory(rate, burst), per_backend).mark
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping, MutableMapping
+from collections.abc import Iterable, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
-from typing import Any, TypeVar
+from functools import cache
+from typing import Annotated, Any, ClassVar, TypeVar
 
 from annotated_types import SLOTS
+from pydantic import BaseModel, TypeAdapter
 from typing_extensions import override
 
 from combadge.core.markers.base import AnnotatedMarker
@@ -18,6 +20,9 @@ _OutputPayloadT = TypeVar("_OutputPayloadT")
 class ResponseMarker(AnnotatedMarker, ABC):
     """Response marker: it transforms or contructs a response."""
 
+    validates: ClassVar[bool] = False
+    """Whether the marker validates its output itself, so that it should not be validated against the return type."""
+
     @abstractmethod
     def __call__(self, response: Any, payload: Any) -> Any:
         """Transform the response."""
@@ -72,3 +77,114 @@ class Mixin(ResponseMarker):
         for marker in self.inner:
             payload.update(marker(response, payload))
         return payload
+
+
+@dataclass(frozen=True, **SLOTS)
+class Columnar(ResponseMarker):
+    """
+    Validate a list of flat records column-wise, and turn it into a mapping of a field name to the column.
+
+    Each column is validated at once against the respective model field, so no model instance
+    gets created per record. The records are validated one by one, if the model relies on anything which
+    cannot be applied to a column: validators, `AliasChoices` or `AliasPath`, default factories,
+    or the model configuration.
+
+    The output is not validated against the method's return type again.
+
+    Note: Columns are Python lists
+        The columns are plain lists of the validated values, not NumPy arrays: NumPy is not a dependency,
+        and the validated values (for example, `datetime`) would mostly end up in object arrays anyway.
+        Set `to_arrow` to get typed, contiguous columns.
+
+    Examples:
+        >>> class Measurement(BaseModel):
+        >>>     timestamp: datetime
+        >>>     value: float
+        >>>
+        >>> def get_measurements(self) -> Annotated[dict[str, list[Any]], Columnar(Measurement)]:
+        >>>     ...
+    """
+
+    validates: ClassVar[bool] = True
+
+    record_type: type[BaseModel]
+    """Record schema."""
+
+    to_arrow: bool = False
+    """
+    Produce a [PyArrow table](https://arrow.apache.org/docs/python/generated/pyarrow.Table.html)
+    instead of a dictionary, requires `pyarrow`.
+    """
+
+    @override
+    def __call__(self, response: Any, payload: Sequence[Mapping[str, Any]]) -> Any:  # noqa: D102
+        if (columns_by_name := _get_columns(self.record_type)) is not None:
+            columns = {
+                name: column.type_adapter.validate_python(column.extract(payload))
+                for name, column in columns_by_name.items()
+            }
+        else:
+            records = _get_records_adapter(self.record_type).validate_python(payload)
+            columns = {name: [getattr(record, name) for record in records] for name in self.record_type.model_fields}
+        if self.to_arrow:
+            import pyarrow  # type: ignore[import-not-found]
+
+            return pyarrow.table(columns)
+        return columns
+
+
+@dataclass(frozen=True, **SLOTS)
+class _Column:
+    key: str
+    """Record key, which is the field's alias, or its name."""
+
+    required: bool
+    default: Any
+    type_adapter: TypeAdapter[list[Any]]
+
+    def extract(self, records: Sequence[Mapping[str, Any]]) -> list[Any]:
+        """Extract the column values from the records."""
+        if self.required:
+            try:
+                return [record[self.key] for record in records]
+            except KeyError:
+                raise ValueError(f"a record misses the required `{self.key}`") from None
+        return [record.get(self.key, self.default) for record in records]
+
+
+_COLUMNAR_CONFIG_KEYS = frozenset({"title", "json_schema_extra", "frozen", "protected_namespaces", "defer_build"})
+"""Model configuration keys which do not affect the validation."""
+
+
+@cache
+def _get_columns(record_type: type[BaseModel]) -> dict[str, _Column] | None:
+    """Build the column validators by the field names, or return `None` if the model cannot be validated column-wise."""
+    decorators = record_type.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+        or not _COLUMNAR_CONFIG_KEYS.issuperset(record_type.model_config)
+    ):
+        return None
+    columns: dict[str, _Column] = {}
+    for name, field in record_type.model_fields.items():
+        if field.default_factory is not None:
+            return None  # the factory must be called per record
+        if field.validation_alias is not None and not isinstance(field.validation_alias, str):
+            return None  # `AliasChoices` or `AliasPath`
+        key = field.validation_alias if field.validation_alias is not None else (field.alias or name)
+        annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+        columns[name] = _Column(
+            key=key,
+            required=field.is_required(),
+            default=None if field.is_required() else field.get_default(),
+            type_adapter=TypeAdapter(list[annotation]),  # type: ignore[valid-type]
+        )
+    return columns
+
+
+@cache
+def _get_records_adapter(record_type: type[BaseModel]) -> TypeAdapter[list[BaseModel]]:
+    return TypeAdapter(list[record_type])  # type: ignore[valid-type]
@@ -0,0 +1,153 @@
+"""Retrying method marker."""
+
+from __future__ import annotations
+
+from asyncio import sleep as async_sleep
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from random import uniform
+from time import sleep
+from typing import Any, Generic, cast
+
+from annotated_types import SLOTS
+from typing_extensions import override
+
+from combadge._helpers.backend_local import BackendLocal
+from combadge._helpers.budget import Budget
+from combadge._helpers.errors import get_retry_after, get_status_code, is_connect_error, is_transport_error
+from combadge.core.deadline import get_remaining_time
+from combadge.core.errors import BackendError, DeadlineExceededError
+from combadge.core.markers.method import MethodMarker
+from combadge.core.typevars import FunctionT
+
+__all__ = ("Retried", "retry")
+
+DEFAULT_RETRY_STATUSES = frozenset({408, 429, 502, 503, 504})
+
+_budgets: dict[float, BackendLocal[Budget]] = {}
+"""Backend retry budgets, keyed by the budget ratio – so that only the methods with the same ratio share one."""
+
+
+@dataclass(**SLOTS)
+class Retried(Generic[FunctionT], MethodMarker[Any, FunctionT]):  # noqa: D101
+    attempts: int = 3
+    backoff: float = 0.1
+    max_backoff: float = 10.0
+    jitter: bool = True
+    statuses: Collection[int] = DEFAULT_RETRY_STATUSES
+    idempotent: bool = True
+    budget: float = 0.1
+
+    @override
+    def wrap(self, what: FunctionT) -> FunctionT:  # noqa: D102
+        method_budget = Budget(self.budget)
+        backend_budgets = _budgets.setdefault(self.budget, BackendLocal())
+
+        def get_budget(service: Any) -> Budget:
+            return backend_budgets.get(service, method_budget)
+
+        if iscoroutinefunction(what):
+
+            @wraps(what)
+            async def async_wrapper(service: Any, *args: Any, **kwargs: Any) -> Any:
+                budget = get_budget(service)
+                budget.deposit()
+                attempt = 1
+                while True:
+                    try:
+                        return await what(service, *args, **kwargs)
+                    except BackendError as e:
+                        if (delay := self._get_delay(attempt, e.inner)) is None or not budget.withdraw():
+                            raise
+                    await async_sleep(delay)
+                    attempt += 1
+
+            return cast(FunctionT, async_wrapper)
+
+        @wraps(what)
+        def wrapper(service: Any, *args: Any, **kwargs: Any) -> Any:
+            budget = get_budget(service)
+            budget.deposit()
+            attempt = 1
+            while True:
+                try:
+                    return what(service, *args, **kwargs)
+                except BackendError as e:
+                    if (delay := self._get_delay(attempt, e.inner)) is None or not budget.withdraw():
+                        raise
+                sleep(delay)
+                attempt += 1
+
+        return cast(FunctionT, wrapper)
+
+    def _get_delay(self, attempt: int, exception: BaseException) -> float | None:
+        """Get the delay before the next attempt, or `None` if the call should not be retried."""
+        if attempt >= self.attempts or not self._is_retryable(exception):
+            return None
+        ceiling = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        delay = uniform(0.0, ceiling) if self.jitter else ceiling  # noqa: S311
+        if (retry_after := get_retry_after(exception)) is not None:
+            if retry_after > self.max_backoff:
+                # The server asks to come back later than we are willing to wait.
+                return None
+            delay = max(delay, retry_after)
+        try:
+            remaining = get_remaining_time()
+        except DeadlineExceededError:
+            return None
+        if remaining is not None and delay >= remaining:
+            return None  # the retry would not make it before the deadline anyway
+        return delay
+
+    def _is_retryable(self, exception: BaseException) -> bool:
+        if (status_code := get_status_code(exception)) is not None:
+            # 429 means that the request has been rejected without processing:
+            return status_code in self.statuses and (self.idempotent or status_code == 429)
+        if is_connect_error(exception):
+            return True
+        return self.idempotent and is_transport_error(exception)
+
+
+def retry(
+    attempts: int = 3,
+    *,
+    backoff: float = 0.1,
+    max_backoff: float = 10.0,
+    jitter: bool = True,
+    statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+    idempotent: bool = True,
+    budget: float = 0.1,
+) -> Callable[[FunctionT], FunctionT]:
+    """
+    Retry the failed calls with an exponential backoff.
+
+    Only a [`BackendError`][combadge.core.errors.BackendError] gets retried, and only when it is caused by
+    a transport error (connection failure, timeout, and so on) or a response with one of the retryable statuses.
+    The `Retry-After` response header is honoured.
+
+    The retries are limited by a token bucket, which is shared by the retried methods of a backend with the same budget:
+    each call deposits the `budget` fraction of a token, and each retry withdraws a whole token.
+    Thus, the retries cannot multiply the load on a server during an outage.
+
+    Args:
+        attempts: maximum number of the attempts, including the first one
+        backoff: base delay (in seconds), which doubles with each attempt
+        max_backoff: maximum delay (in seconds), a call is not retried if `Retry-After` asks for a longer one
+        jitter: randomize the delays ([full jitter](https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/)),
+            so that the clients do not retry in sync
+        statuses: retryable HTTP status codes
+        idempotent: whether the method may be safely repeated, non-idempotent methods are only retried when
+            the request has certainly not been processed: on a connection failure or on `429 Too Many Requests`
+        budget: ratio of the retries to the calls, the methods of a backend with the same ratio share the budget
+
+    Examples:
+        >>> class SupportsHttpbin(Protocol):
+        >>>     @retry(attempts=5, backoff=0.2)
+        >>>     @http_method("GET")
+        >>>     @path("/status/{status_code}")
+        >>>     def get_status(self, status_code: int) -> None:
+        >>>         ...
+    """
+    return Retried[Any](attempts, backoff, max_backoff, jitter, statuses, idempotent, budget).mark
@@ -0,0 +1,66 @@
+"""Timeout method marker."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Generic, cast
+
+from annotated_types import SLOTS
+from typing_extensions import override
+
+from combadge.core.deadline import deadline
+from combadge.core.markers.method import MethodMarker
+from combadge.core.typevars import FunctionT
+
+__all__ = ("TimeLimited", "timeout")
+
+
+@dataclass(**SLOTS)
+class TimeLimited(Generic[FunctionT], MethodMarker[Any, FunctionT]):  # noqa: D101
+    timeout: float
+
+    @override
+    def wrap(self, what: FunctionT) -> FunctionT:  # noqa: D102
+        if iscoroutinefunction(what):
+
+            @wraps(what)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with deadline(self.timeout):
+                    return await what(*args, **kwargs)
+
+            return cast(FunctionT, async_wrapper)
+
+        @wraps(what)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with deadline(self.timeout):
+                return what(*args, **kwargs)
+
+        return cast(FunctionT, wrapper)
+
+
+def timeout(timeout: float) -> Callable[[FunctionT], FunctionT]:
+    """
+    Limit the method call time.
+
+    The timeout is applied as a [deadline][combadge.core.deadline.deadline], so it covers the retries
+    and the queueing as well (when the marker is placed above them), and it never extends an outer deadline.
+
+    Args:
+        timeout: time limit (in seconds)
+
+    Examples:
+        >>> class SupportsCountryInfo(Protocol):
+        >>>     @timeout(0.05)
+        >>>     @operation_name("CapitalCity")
+        >>>     def get_capital_city(self, ...) -> ...:
+        >>>         ...
+        >>>
+        >>>     @timeout(30.0)
+        >>>     @operation_name("FullCountryInfoAllCountries")
+        >>>     def get_all_countries(self) -> ...:
+        >>>         ...
+    """
+    return TimeLimited[Any](timeout).mark
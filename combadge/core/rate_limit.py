@@ -0,0 +1,166 @@
+"""Rate limiters used by the [`@rate_limit`][combadge.core.markers.rate_limiting.rate_limit] marker."""
+
+from __future__ import annotations
+
+import os
+from abc import ABC, abstractmethod
+from mmap import mmap
+from os import PathLike
+from struct import Struct
+from threading import Lock
+from time import monotonic, time
+
+_TIMESTAMP = Struct("d")
+
+
+class BaseRateLimiter(ABC):
+    """
+    Abstract rate limiter.
+
+    Limiters hand out reservations rather than block, so that the same limiter
+    may pace both sync and async callers.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def reserve(self) -> float:
+        """
+        Reserve a permit for a single call.
+
+        Returns:
+            Delay (in seconds) which the caller must wait before making the call.
+        """
+        raise NotImplementedError
+
+
+class _Gcra:
+    """
+    Token bucket, implemented as the [generic cell rate algorithm](https://en.wikipedia.org/wiki/Generic_cell_rate_algorithm).
+
+    Instead of counting tokens, it only keeps the «theoretical arrival time» of the next call.
+    The reservations are handed out in order, so the waiting callers form a FIFO queue.
+    """
+
+    __slots__ = ("_interval", "_tolerance")
+
+    def __init__(self, rate: float, burst: float | None) -> None:
+        if rate <= 0.0:
+            raise ValueError("rate must be positive")
+        if burst is None:
+            burst = max(rate, 1.0)
+        elif burst < 1.0:
+            raise ValueError("burst must be at least 1")
+        self._interval = 1.0 / rate
+        self._tolerance = (burst - 1.0) * self._interval
+
+    def advance(self, arrival_time: float, now: float) -> tuple[float, float]:
+        """Get the delay of the new reservation, and the new theoretical arrival time."""
+        delay = max(arrival_time - self._tolerance - now, 0.0)
+        return delay, max(arrival_time, now) + self._interval
+
+
+class TokenBucket(BaseRateLimiter):
+    """
+    In-process token bucket.
+
+    Tip: This limiter is thread-safe
+        Share an instance between methods (or services) to limit their total rate.
+    """
+
+    __slots__ = ("_gcra", "_arrival_time", "_lock")
+
+    def __init__(self, rate: float, *, burst: float | None = None) -> None:
+        """
+        Instantiate the limiter.
+
+        Args:
+            rate: sustained rate (in calls per second)
+            burst: maximum number of calls which may be made at once, defaults to the rate
+        """
+        self._gcra = _Gcra(rate, burst)
+        self._arrival_time = 0.0
+        self._lock = Lock()
+
+    def reserve(self) -> float:  # noqa: D102
+        with self._lock:
+            delay, self._arrival_time = self._gcra.advance(self._arrival_time, monotonic())
+        return delay
+
+
+class SharedTokenBucket(BaseRateLimiter):
+    """
+    Token bucket which is shared between the processes on a host through a memory-mapped file.
+
+    Instantiate it with the same file path in each worker process, so that their total rate stays under the quota.
+    It may also be instantiated before the workers get forked: the state file is opened on the first reservation
+    in each process, since the forked processes would not exclude each other through an inherited file descriptor.
+
+    Note: POSIX only
+        The processes are synchronized with `flock()`.
+    """
+
+    __slots__ = ("_path", "_gcra", "_pid", "_fd", "_memory", "_lock")
+
+    def __init__(self, path: str | PathLike[str], rate: float, *, burst: float | None = None) -> None:
+        """
+        Instantiate the limiter.
+
+        Args:
+            path: path to the state file, which is created if it does not exist
+            rate: sustained rate (in calls per second)
+            burst: maximum number of calls which may be made at once, defaults to the rate
+        """
+        self._path = path
+        self._gcra = _Gcra(rate, burst)
+        self._pid: int | None = None
+        """Process which has opened the state file."""
+        self._fd = -1
+        self._memory: mmap | None = None
+        # `flock()` does not exclude the threads which share the file descriptor:
+        self._lock = Lock()
+
+    def reserve(self) -> float:  # noqa: D102
+        from fcntl import LOCK_EX, LOCK_UN, flock
+
+        with self._lock:
+            memory = self._open()
+            flock(self._fd, LOCK_EX)
+            try:
+                (arrival_time,) = _TIMESTAMP.unpack_from(memory)
+                # Wall clock, since the state file may outlive the monotonic clock (for example, over a reboot):
+                delay, arrival_time = self._gcra.advance(arrival_time, time())
+                _TIMESTAMP.pack_into(memory, 0, arrival_time)
+            finally:
+                flock(self._fd, LOCK_UN)
+        return delay
+
+    def close(self) -> None:
+        """Close the state file, if it has been opened by this process."""
+        with self._lock:
+            if self._pid == os.getpid():
+                self._close()
+            self._pid = None
+
+    def _open(self) -> mmap:
+        """Open the state file in the current process, unless it is already open."""
+        pid = os.getpid()
+        if self._pid == pid:
+            assert self._memory is not None
+            return self._memory
+        if self._pid is not None:
+            # Forked: the inherited descriptor shares its `flock()` with the parent process, so open a new one.
+            self._close()
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < _TIMESTAMP.size:
+            os.ftruncate(self._fd, _TIMESTAMP.size)
+        self._memory = mmap(self._fd, _TIMESTAMP.size)
+        self._pid = pid
+        return self._memory
+
+    def _close(self) -> None:
+        assert self._memory is not None
+        self._memory.close()
+        os.close(self._fd)
+        self._memory = None
+        self._fd = -1
@@ -105,9 +105,11 @@ class Signature:
             payload: parsed response payload
             response_type: user response type (we require type adapter because the inner type may be anything)
         """
+        validated = False
         for marker in self.response_markers:
             payload = marker(response, payload)
-        if not isinstance(payload, BaseModel):  # TODO: this `if` may no needed anymore.
+            validated = marker.validates
+        if not validated and not isinstance(payload, BaseModel):  # TODO: this `if` may no needed anymore.
             # Implicitly parse a Pydantic model.
             # TODO: come up with something smarter to better uncouple Combadge from Pydantic.
             payload = response_type.validate_python(payload)
@@ -0,0 +1,213 @@
+"""
+Connection pre-warming.
+
+The backends open the connections by sending several `HEAD` requests at once, and holding each response
+until all of them are received – so that each request takes its own connection from the pool.
+The connections then return to the pool, and remain there as idle ones until their keep-alive expiry.
+"""
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Event, Task, gather, get_running_loop, wait_for
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import sleep as async_sleep
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, AsyncExitStack, ExitStack, suppress
+from logging import getLogger
+from threading import Barrier, BrokenBarrierError, Thread
+from threading import Event as ThreadingEvent
+from types import TracebackType
+from typing import Any
+
+from typing_extensions import Self
+
+__all__ = ("warm_up", "warm_up_async", "ConnectionWarmer", "AsyncConnectionWarmer")
+
+logger = getLogger(__name__)
+
+
+def warm_up(open_connection: Callable[[], AbstractContextManager[Any]], n: int, *, timeout: float = 10.0) -> int:
+    """
+    Open the connections concurrently, each one from its own thread.
+
+    Args:
+        open_connection: opens a connection and holds it as long as the context is entered,
+            for example, `#!python lambda: client.stream("HEAD", url)`
+        n: number of the connections to open
+        timeout: maximum time (in seconds) to hold the opened connections while waiting for the rest
+
+    Returns:
+        Number of the successfully opened connections.
+    """
+    if n <= 0:
+        return 0
+    barrier = Barrier(n, timeout=timeout)
+
+    def hold(_: int) -> Exception | None:
+        with ExitStack() as stack:
+            try:
+                stack.enter_context(open_connection())
+            except Exception as e:  # noqa: BLE001
+                error: Exception | None = e
+            else:
+                error = None
+            with suppress(BrokenBarrierError):
+                barrier.wait()
+        return error
+
+    with ThreadPoolExecutor(n, thread_name_prefix="combadge-warm-up") as executor:
+        return _count_opened(list(executor.map(hold, range(n))))
+
+
+async def warm_up_async(
+    open_connection: Callable[[], AbstractAsyncContextManager[Any]],
+    n: int,
+    *,
+    timeout: float = 10.0,
+) -> int:
+    """
+    Open the connections concurrently.
+
+    Args:
+        open_connection: opens a connection and holds it as long as the context is entered,
+            for example, `#!python lambda: client.stream("HEAD", url)`
+        n: number of the connections to open
+        timeout: maximum time (in seconds) to hold the opened connections while waiting for the rest
+
+    Returns:
+        Number of the successfully opened connections.
+    """
+    if n <= 0:
+        return 0
+    n_arrived = 0
+    all_arrived = Event()
+
+    async def hold() -> Exception | None:
+        nonlocal n_arrived
+        async with AsyncExitStack() as stack:
+            try:
+                await stack.enter_async_context(open_connection())
+            except Exception as e:  # noqa: BLE001
+                error: Exception | None = e
+            else:
+                error = None
+            n_arrived += 1
+            if n_arrived == n:
+                all_arrived.set()
+            with suppress(AsyncTimeoutError):
+                await wait_for(all_arrived.wait(), timeout)
+        return error
+
+    return _count_opened(await gather(*(hold() for _ in range(n))))
+
+
+def _count_opened(errors: list[Exception | None]) -> int:
+    """Count the successfully opened connections, and log the failures."""
+    failures = [error for error in errors if error is not None]
+    if failures:
+        logger.warning(
+            "Failed to open %d of %d connections, the last error: %r",
+            len(failures),
+            len(errors),
+            failures[-1],
+        )
+    return len(errors) - len(failures)
+
+
+class ConnectionWarmer:
+    """
+    Repeats the warm-up in a background thread, so that the pool keeps the idle connections ready.
+
+    The warm-up should only open the missing connections, so that the warmer does not compete
+    with the calls for the pool.
+
+    The interval should be shorter than the connection keep-alive expiry,
+    which is 5 seconds by default in HTTPX.
+    """
+
+    __slots__ = ("_warm_up", "_interval", "_stopped", "_thread")
+
+    def __init__(self, warm_up: Callable[[], object], *, interval: float) -> None:
+        """
+        Start the warmer.
+
+        Args:
+            warm_up: warms the connections up
+            interval: delay (in seconds) between the warm-ups
+        """
+        self._warm_up = warm_up
+        self._interval = interval
+        self._stopped = ThreadingEvent()
+        self._thread = Thread(target=self._run, name="combadge-connection-warmer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the warmer and wait for the ongoing warm-up to finish."""
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            self._warm_up()
+            if self._stopped.wait(self._interval):
+                break
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+
+class AsyncConnectionWarmer:
+    """
+    Repeats the warm-up in a background task, so that the pool keeps the idle connections ready.
+
+    The warm-up should only open the missing connections, so that the warmer does not compete
+    with the calls for the pool.
+
+    The interval should be shorter than the connection keep-alive expiry,
+    which is 5 seconds by default in HTTPX.
+    """
+
+    __slots__ = ("_warm_up", "_interval", "_task")
+
+    def __init__(self, warm_up: Callable[[], Awaitable[object]], *, interval: float) -> None:
+        """
+        Start the warmer, must be called from a running event loop.
+
+        Args:
+            warm_up: warms the connections up
+            interval: delay (in seconds) between the warm-ups
+        """
+        self._warm_up = warm_up
+        self._interval = interval
+        self._task: Task[None] = get_running_loop().create_task(self._run(), name="combadge-connection-warmer")
+
+    async def stop(self) -> None:
+        """Stop the warmer."""
+        self._task.cancel()
+        with suppress(CancelledError):
+            await self._task
+
+    async def _run(self) -> None:
+        while True:
+            await self._warm_up()
+            await async_sleep(self._interval)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.stop()
@@ -1,32 +1,50 @@
 from __future__ import annotations
 
 from collections.abc import Hashable
+from time import monotonic, time
 from types import TracebackType
 from typing import Any, cast
 
-from httpx import AsyncClient, Response
+from httpx import URL, AsyncClient, Response, TimeoutException
+from httpx import Request as HttpxRequest
 from pydantic import TypeAdapter
 from typing_extensions import Self, override
 
+from combadge._helpers.errors import is_overload_status
+from combadge._helpers.httpx import count_idle_connections, hold_connection_async
 from combadge._helpers.pydantic import get_type_adapter
 from combadge.core.binder import BaseBoundService
+from combadge.core.concurrency import ConcurrencyLimiter
 from combadge.core.errors import BackendError
 from combadge.core.interfaces import ServiceMethod
 from combadge.core.signature import Signature
+from combadge.core.warming import AsyncConnectionWarmer, warm_up_async
 from combadge.support.http.request import Request
 from combadge.support.httpx.backends.base import BaseHttpxBackend
+from combadge.support.httpx.cache import HttpCache
+from combadge.support.httpx.timeouts import AdaptiveTimeout
 
 
 class HttpxBackend(BaseHttpxBackend[AsyncClient]):
     """Async HTTPX backend."""
 
-    __slots__ = ("_client", "_service_cache", "_raise_for_status")
+    __slots__ = (
+        "_client",
+        "_service_cache",
+        "_raise_for_status",
+        "_http_cache",
+        "_adaptive_timeout",
+        "_concurrency_limiter",
+    )
 
     def __init__(
         self,
         client: AsyncClient,
         *,
         raise_for_status: bool = True,
+        http_cache: HttpCache | None = None,
+        adaptive_timeout: AdaptiveTimeout | None = None,
+        concurrency_limiter: ConcurrencyLimiter | None = None,
     ) -> None:
         """
         Instantiate the backend.
@@ -34,30 +52,125 @@ class HttpxBackend(BaseHttpxBackend[AsyncClient]):
         Args:
             client: [HTTPX client](https://www.python-httpx.org/advanced/#client-instances)
             raise_for_status: automatically call `raise_for_status()`
+            http_cache: optional [HTTP cache][combadge.support.httpx.cache.HttpCache],
+                which is shared by all the services bound to this backend
+            adaptive_timeout: optional [adaptive timeout][combadge.support.httpx.timeouts.AdaptiveTimeout],
+                which derives the method timeouts from the observed latencies
+            concurrency_limiter: optional [adaptive concurrency limiter][combadge.core.concurrency.ConcurrencyLimiter]
+                for the requests sent by this backend
         """
-        BaseHttpxBackend.__init__(self, client, raise_for_status=raise_for_status)
+        BaseHttpxBackend.__init__(
+            self,
+            client,
+            raise_for_status=raise_for_status,
+            http_cache=http_cache,
+            adaptive_timeout=adaptive_timeout,
+        )
+        self._concurrency_limiter = concurrency_limiter
 
     @classmethod
     @override
     def bind_method(cls, signature: Signature) -> ServiceMethod[HttpxBackend]:  # noqa: D102
         response_type: TypeAdapter[Any] = get_type_adapter(cast(Hashable, signature.return_type))
+        # Identifies this bound method in the adaptive timeouts:
+        method_key = object()
 
         async def bound_method(self: BaseBoundService[HttpxBackend], *args: Any, **kwargs: Any) -> Any:
             request = signature.build_request(Request, self, args, kwargs)
+            backend = self.__combadge_backend__
+            timeout = backend._get_timeout(method_key)
             with BackendError:
-                response: Response = await self.__combadge_backend__._client.request(
-                    request.get_method(),
-                    request.get_url_path(),
-                    json=(request.payload or None),
-                    data=(request.form_data or None),
-                    params=(request.query_params or None),
-                    headers=(request.http_headers or None),
-                )
-                payload = self.__combadge_backend__._parse_payload(response)
+                response = await backend._send(backend._build_request(request, timeout), method_key)
+                payload = backend._parse_payload(response)
             return signature.apply_response_markers(response, payload, response_type)
 
         return bound_method  # type: ignore[return-value]
 
+    async def _send(self, request: HttpxRequest, method_key: Hashable) -> Response:
+        if self._http_cache is None:
+            return await self._send_limited(request, method_key)
+        cached = self._http_cache.lookup(request)
+        if cached is not None and cached.is_fresh(time()):
+            return cached.to_response(request)
+        response = await self._send_limited(self._http_cache.make_conditional(request, cached), method_key)
+        return self._http_cache.update(request, response, cached)
+
+    async def _send_limited(self, request: HttpxRequest, method_key: Hashable) -> Response:
+        if self._concurrency_limiter is None:
+            return await self._send_timed(request, method_key)
+        async with self._concurrency_limiter.acquire() as permit:
+            response = await self._send_timed(request, method_key)
+            permit.dropped = is_overload_status(response.status_code)
+        return response
+
+    async def _send_timed(self, request: HttpxRequest, method_key: Hashable) -> Response:
+        if self._adaptive_timeout is None:
+            return await self._client.send(request)
+        start_time = monotonic()
+        try:
+            response = await self._client.send(request)
+        except TimeoutException:
+            # Timed out calls are recorded too, so that the timeout could grow along with the latency.
+            # Other errors are not, since an instant failure (like a refused connection) would shrink the timeout.
+            self._adaptive_timeout.observe(method_key, monotonic() - start_time)
+            raise
+        self._adaptive_timeout.observe(method_key, monotonic() - start_time)
+        return response
+
+    async def warm_connections(self, n: int, *, url: str | URL | None = None, timeout: float = 10.0) -> int:
+        """
+        Open the pooled connections in advance, so that the first calls do not pay for the handshakes.
+
+        Args:
+            n: number of the connections to open, the extra ones are dropped if it exceeds the pool's
+                `max_keepalive_connections`; one connection is enough for HTTP/2
+            url: URL to send the `HEAD` requests to, relative to the base URL; defaults to the base URL
+            timeout: maximum time (in seconds) to hold the opened connections while waiting for the rest
+
+        Returns:
+            Number of the successfully opened connections.
+
+        Examples:
+            >>> backend = HttpxBackend(AsyncClient(base_url="https://example.com"))
+            >>> await backend.warm_connections(10)
+        """
+        warm_up_url = self._get_warm_up_url(url)
+        return await warm_up_async(lambda: hold_connection_async(self._client, warm_up_url), n, timeout=timeout)
+
+    def keep_connections_warm(
+        self,
+        n: int,
+        *,
+        url: str | URL | None = None,
+        interval: float = 4.0,
+        timeout: float = 10.0,
+    ) -> AsyncConnectionWarmer:
+        """
+        Keep at least `n` idle connections ready.
+
+        Periodically checks the pool in a background task, and once fewer than `n` connections are idle,
+        [warms the connections up][combadge.support.httpx.backends.async_.HttpxBackend.warm_connections] again.
+        Holding `n` connections at once reuses the idle ones, and opens only the missing ones.
+
+        The interval should be shorter than the pool's `keepalive_expiry`, which is 5 seconds by default.
+
+        Returns:
+            Started warmer, which should be stopped when the backend is no longer used.
+
+        Examples:
+            >>> async with backend.keep_connections_warm(10):
+            >>>     await serve_forever()
+        """
+        warm_up_url = self._get_warm_up_url(url)
+        return AsyncConnectionWarmer(
+            lambda: self.warm_connections(
+                n if count_idle_connections(self._client, warm_up_url) < n else 0,
+                url=warm_up_url,
+                timeout=timeout,
+            ),
+            interval=interval,
+        )
+
     async def __aenter__(self) -> Self:
         self._client = await self._client.__aenter__()
         return self
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Hashable
 from typing import Any, Generic, TypeVar
 
-from httpx import AsyncClient, Client, Response
+from httpx import URL, AsyncClient, Client, Response, Timeout
+from httpx import Request as HttpxRequest
 
+from combadge._helpers.httpx import limit_timeout
 from combadge.core.backend import BaseBackend
+from combadge.core.deadline import get_remaining_time
+from combadge.support.http.request import Request
+from combadge.support.httpx.cache import HttpCache
+from combadge.support.httpx.timeouts import AdaptiveTimeout
 
 _ClientT = TypeVar("_ClientT", Client, AsyncClient)
 
@@ -13,12 +20,58 @@ _ClientT = TypeVar("_ClientT", Client, AsyncClient)
 class BaseHttpxBackend(BaseBackend, Generic[_ClientT], ABC):
     """[HTTPX](https://www.python-httpx.org/) client support."""
 
-    __slots__ = ("_service_cache", "_client", "_raise_for_status")
+    __slots__ = ("_service_cache", "_client", "_raise_for_status", "_http_cache", "_adaptive_timeout")
 
-    def __init__(self, client: _ClientT, *, raise_for_status: bool = True) -> None:  # noqa: D107
+    def __init__(  # noqa: D107
+        self,
+        client: _ClientT,
+        *,
+        raise_for_status: bool = True,
+        http_cache: HttpCache | None = None,
+        adaptive_timeout: AdaptiveTimeout | None = None,
+    ) -> None:
         super().__init__()
         self._client: _ClientT = client
         self._raise_for_status = raise_for_status
+        self._http_cache = http_cache
+        self._adaptive_timeout = adaptive_timeout
+
+    def _get_timeout(self, method_key: Hashable | None = None) -> Timeout:
+        """
+        Get the request timeout.
+
+        It is the method's adaptive timeout (if enabled) or the client's one,
+        capped by the time remaining until the current deadline.
+        """
+        timeout = self._client.timeout
+        if (
+            self._adaptive_timeout is not None
+            and method_key is not None
+            and (adaptive_timeout := self._adaptive_timeout.get_timeout(method_key)) is not None
+        ):
+            timeout = Timeout(adaptive_timeout)
+        if (remaining := get_remaining_time()) is not None:
+            timeout = limit_timeout(timeout, remaining)
+        return timeout
+
+    def _get_warm_up_url(self, url: str | URL | None) -> URL:
+        """Get the URL to warm the connections up to, which is the client's base URL by default."""
+        if url is not None:
+            return self._client.base_url.join(url)
+        if not self._client.base_url.host:
+            raise ValueError("the client has no base URL, specify the URL to warm the connections up to")
+        return self._client.base_url
+
+    def _build_request(self, request: Request, timeout: Timeout) -> HttpxRequest:
+        return self._client.build_request(
+            request.get_method(),
+            request.get_url_path(),
+            json=(request.payload or None),
+            data=(request.form_data or None),
+            params=(request.query_params or None),
+            headers=(request.http_headers or None),
+            timeout=timeout,
+        )
 
     def _parse_payload(self, from_response: Response) -> Any:
         if self._raise_for_status:
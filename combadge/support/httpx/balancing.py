@@ -0,0 +1,479 @@
+"""
+Client-side load balancing across the server replicas for the HTTPX-based backends.
+
+The balancing is implemented as an HTTPX transport, which routes each request to one of the replicas
+by replacing the request's origin. The `Host` header and the TLS server name stay those of the original URL,
+so the virtual hosts and the certificates issued for the service name keep working.
+The balancing works with any backend built on top of an HTTPX client,
+including the Zeep backends with the [`HttpxTransport`][combadge.support.zeep.transports.HttpxTransport].
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from hashlib import blake2b
+from itertools import count
+from logging import getLogger
+from os import PathLike
+from pathlib import Path
+from random import sample
+from threading import Lock
+from time import monotonic
+
+from annotated_types import SLOTS
+from httpx import (
+    URL,
+    AsyncBaseTransport,
+    AsyncByteStream,
+    AsyncHTTPTransport,
+    BaseTransport,
+    HTTPTransport,
+    Request,
+    Response,
+    SyncByteStream,
+)
+
+__all__ = (
+    "Replica",
+    "BalancingPolicy",
+    "RoundRobin",
+    "LeastOutstanding",
+    "PowerOfTwoChoices",
+    "ConsistentHash",
+    "LoadBalancer",
+    "LoadBalancingTransport",
+    "AsyncLoadBalancingTransport",
+)
+
+logger = getLogger(__name__)
+
+
+@dataclass(eq=False, **SLOTS)
+class Replica:
+    """Server replica along with its runtime statistics."""
+
+    url: URL
+    """Replica origin."""
+
+    outstanding: int = 0
+    """Number of the requests in flight, including the responses which are still being read."""
+
+    failures: int = 0
+    """Number of the consecutive failures."""
+
+    ejected_until: float = 0.0
+    """The replica is not used until this monotonic timestamp."""
+
+
+class BalancingPolicy(ABC):
+    """Picks a replica for a request."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def choose(self, replicas: Sequence[Replica], request: Request) -> Replica:
+        """
+        Pick a replica.
+
+        Args:
+            replicas: non-empty sequence of the healthy replicas
+            request: request being sent
+        """
+        raise NotImplementedError
+
+
+class RoundRobin(BalancingPolicy):
+    """Picks the replicas in turn."""
+
+    __slots__ = ("_counter",)
+
+    def __init__(self) -> None:  # noqa: D107
+        self._counter = count()
+
+    def choose(self, replicas: Sequence[Replica], request: Request) -> Replica:  # noqa: D102
+        return replicas[next(self._counter) % len(replicas)]
+
+
+class LeastOutstanding(BalancingPolicy):
+    """Picks the replica with the fewest requests in flight."""
+
+    __slots__ = ()
+
+    def choose(self, replicas: Sequence[Replica], request: Request) -> Replica:  # noqa: D102
+        return min(replicas, key=_get_outstanding)
+
+
+class PowerOfTwoChoices(BalancingPolicy):
+    """
+    Picks the less loaded of two random replicas.
+
+    It performs almost as well as the [least outstanding][combadge.support.httpx.balancing.LeastOutstanding]
+    policy, but does not herd the clients onto the same replica.
+    """
+
+    __slots__ = ()
+
+    def choose(self, replicas: Sequence[Replica], request: Request) -> Replica:  # noqa: D102
+        if len(replicas) == 1:
+            return replicas[0]
+        return min(sample(replicas, 2), key=_get_outstanding)
+
+
+class ConsistentHash(BalancingPolicy):
+    """
+    Routes the requests with the same key to the same replica, which improves the server-side cache hit rate.
+
+    When a replica is added or removed, only a small share of the keys moves to another replica.
+    """
+
+    __slots__ = ("_key", "_virtual_nodes", "_ring_replicas", "_ring_hashes", "_ring_nodes")
+
+    def __init__(self, key: Callable[[Request], str] | None = None, *, virtual_nodes: int = 100) -> None:
+        """
+        Instantiate the policy.
+
+        Args:
+            key: extracts the routing key from a request, the URL path and query by default
+            virtual_nodes: number of the points per replica on the hash ring, more points spread the keys more evenly
+        """
+        self._key = key if key is not None else _get_raw_path
+        self._virtual_nodes = virtual_nodes
+        self._ring_replicas: tuple[Replica, ...] = ()
+        self._ring_hashes: list[int] = []
+        self._ring_nodes: list[Replica] = []
+
+    def choose(self, replicas: Sequence[Replica], request: Request) -> Replica:  # noqa: D102
+        if tuple(replicas) != self._ring_replicas:
+            self._build_ring(replicas)
+        index = bisect(self._ring_hashes, _hash(self._key(request))) % len(self._ring_hashes)
+        return self._ring_nodes[index]
+
+    def _build_ring(self, replicas: Sequence[Replica]) -> None:
+        ring = sorted(
+            (_hash(f"{replica.url}#{node}"), replica) for replica in replicas for node in range(self._virtual_nodes)
+        )
+        self._ring_hashes = [hash_ for hash_, _ in ring]
+        self._ring_nodes = [replica for _, replica in ring]
+        self._ring_replicas = tuple(replicas)
+
+
+class LoadBalancer:
+    """
+    Keeps track of the replicas, and picks one for each request.
+
+    A replica which keeps failing (transport errors and `5xx` responses) gets ejected for a while.
+    If all the replicas are ejected, all of them are used, since some capacity is better than none.
+
+    Tip: This object is thread-safe
+        It may be shared between the sync and async transports.
+    """
+
+    __slots__ = (
+        "_policy",
+        "_failure_threshold",
+        "_ejection_time",
+        "_lock",
+        "_replicas",
+        "_path",
+        "_reload_interval",
+        "_reloaded_at",
+        "_mtime",
+    )
+
+    def __init__(
+        self,
+        endpoints: Iterable[str | URL] = (),
+        *,
+        policy: BalancingPolicy | None = None,
+        failure_threshold: int = 5,
+        ejection_time: float = 30.0,
+    ) -> None:
+        """
+        Instantiate the balancer.
+
+        Args:
+            endpoints: replica origins, for example, `https://10.0.0.1:8443`
+            policy: balancing policy, [round-robin][combadge.support.httpx.balancing.RoundRobin] by default
+            failure_threshold: number of the consecutive failures which ejects a replica
+            ejection_time: time (in seconds) for which a failing replica is ejected
+        """
+        self._policy = policy if policy is not None else RoundRobin()
+        self._failure_threshold = failure_threshold
+        self._ejection_time = ejection_time
+        self._lock = Lock()
+        self._replicas: list[Replica] = []
+        self._path: Path | None = None
+        self._reload_interval = 0.0
+        self._reloaded_at = 0.0
+        self._mtime: float | None = None
+        self.reload(endpoints)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | PathLike[str],
+        *,
+        reload_interval: float = 5.0,
+        policy: BalancingPolicy | None = None,
+        failure_threshold: int = 5,
+        ejection_time: float = 30.0,
+    ) -> LoadBalancer:
+        """
+        Instantiate the balancer with the endpoints listed in a file, one per line.
+
+        The file is checked for changes at most once per the reload interval, and re-read if it has been modified,
+        so the endpoints may be updated without restarting. Empty lines and `#` comments are ignored.
+        If the file becomes unreadable or empty, the last endpoints are kept.
+        """
+        self = cls(policy=policy, failure_threshold=failure_threshold, ejection_time=ejection_time)
+        self._path = Path(path)
+        self._reload_interval = reload_interval
+        self._reload_from_file()
+        return self
+
+    @property
+    def replicas(self) -> list[Replica]:
+        """Current replicas."""
+        return list(self._replicas)
+
+    def reload(self, endpoints: Iterable[str | URL]) -> None:
+        """
+        Replace the endpoints.
+
+        The statistics of the replicas which remain in the list are kept.
+        """
+        with self._lock:
+            existing = {str(replica.url): replica for replica in self._replicas}
+            replicas = []
+            for endpoint in endpoints:
+                url = URL(endpoint)
+                replicas.append(existing.get(str(url)) or Replica(url))
+            self._replicas = replicas
+
+    def acquire(self, request: Request) -> Replica:
+        """Pick a replica for the request, and account for the request in flight."""
+        if self._path is not None and monotonic() - self._reloaded_at >= self._reload_interval:
+            self._reload_from_file()
+        with self._lock:
+            if not self._replicas:
+                raise LookupError("there are no endpoints to balance between")
+            now = monotonic()
+            healthy = [replica for replica in self._replicas if replica.ejected_until <= now]
+            replica = self._policy.choose(healthy or self._replicas, request)
+            replica.outstanding += 1
+        return replica
+
+    def release(self, replica: Replica, *, failed: bool | None) -> None:
+        """
+        Account for the completed request.
+
+        Args:
+            replica: replica which has served the request
+            failed: whether the request has failed, `#!python None` if the outcome is unknown (the request has been
+                cancelled) – such a request does not affect the failure count
+        """
+        with self._lock:
+            replica.outstanding -= 1
+            if failed is None:
+                return
+            if not failed:
+                replica.failures = 0
+                return
+            replica.failures += 1
+            if replica.failures >= self._failure_threshold:
+                replica.ejected_until = monotonic() + self._ejection_time
+                replica.failures = 0
+
+    def _reload_from_file(self) -> None:
+        """Re-read the endpoints file, if it has changed since the last reload."""
+        assert self._path is not None
+        self._reloaded_at = monotonic()
+        try:
+            mtime = self._path.stat().st_mtime
+            if mtime == self._mtime:
+                return
+            text = self._path.read_text()
+        except (OSError, ValueError) as e:
+            if self._mtime is None:
+                raise  # there is no endpoint list to fall back to
+            # The file may be missing for a moment while it is being replaced:
+            logger.warning("failed to reload the endpoints from `%s`, keeping the last ones: %r", self._path, e)
+            return
+        lines = (line.partition("#")[0].strip() for line in text.splitlines())
+        if not (endpoints := [line for line in lines if line]) and self._mtime is not None:
+            logger.warning("`%s` lists no endpoints, keeping the last ones", self._path)
+            return
+        self._mtime = mtime
+        self.reload(endpoints)
+
+
+class LoadBalancingTransport(BaseTransport):
+    """
+    Sync HTTPX transport which balances the requests across the replicas.
+
+    Examples:
+        >>> balancer = LoadBalancer(["http://10.0.0.1:8080", "http://10.0.0.2:8080"], policy=PowerOfTwoChoices())
+        >>> backend = HttpxBackend(Client(base_url="http://my-service", transport=LoadBalancingTransport(balancer)))
+    """
+
+    def __init__(self, balancer: LoadBalancer, transport: BaseTransport | None = None) -> None:
+        """
+        Instantiate the transport.
+
+        Args:
+            balancer: load balancer, which may be shared between transports
+            transport: underlying transport which sends the routed requests, its connection pool is shared by
+                all the replicas – pass the connection limits and HTTP/2 settings here, rather than to the client
+        """
+        self._balancer = balancer
+        self._transport = transport if transport is not None else HTTPTransport()
+
+    def handle_request(self, request: Request) -> Response:  # noqa: D102
+        replica = self._balancer.acquire(request)
+        try:
+            response = self._transport.handle_request(_route(request, replica))
+        except Exception:
+            self._balancer.release(replica, failed=True)
+            raise
+        except BaseException:
+            # The request has been cancelled, which says nothing about the replica's health:
+            self._balancer.release(replica, failed=None)
+            raise
+        release = _ReleaseOnce(self._balancer, replica, failed=response.status_code >= 500)
+        if response.is_closed:
+            release()  # the body has already been read
+        else:
+            assert isinstance(response.stream, SyncByteStream)
+            response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    def close(self) -> None:  # noqa: D102
+        self._transport.close()
+
+
+class AsyncLoadBalancingTransport(AsyncBaseTransport):
+    """
+    Async HTTPX transport which balances the requests across the replicas.
+
+    Examples:
+        >>> balancer = LoadBalancer.from_file("/etc/my-service/endpoints.txt", policy=LeastOutstanding())
+        >>> transport = AsyncLoadBalancingTransport(balancer)
+        >>> backend = HttpxBackend(AsyncClient(base_url="http://my-service", transport=transport))
+    """
+
+    def __init__(self, balancer: LoadBalancer, transport: AsyncBaseTransport | None = None) -> None:
+        """
+        Instantiate the transport.
+
+        Args:
+            balancer: load balancer, which may be shared between transports
+            transport: underlying transport which sends the routed requests, its connection pool is shared by
+                all the replicas – pass the connection limits and HTTP/2 settings here, rather than to the client
+        """
+        self._balancer = balancer
+        self._transport = transport if transport is not None else AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: Request) -> Response:  # noqa: D102
+        replica = self._balancer.acquire(request)
+        try:
+            response = await self._transport.handle_async_request(_route(request, replica))
+        except Exception:
+            self._balancer.release(replica, failed=True)
+            raise
+        except BaseException:
+            # The request has been cancelled, which says nothing about the replica's health:
+            self._balancer.release(replica, failed=None)
+            raise
+        release = _ReleaseOnce(self._balancer, replica, failed=response.status_code >= 500)
+        if response.is_closed:
+            release()  # the body has already been read
+        else:
+            assert isinstance(response.stream, AsyncByteStream)
+            response.stream = _AsyncReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:  # noqa: D102
+        await self._transport.aclose()
+
+
+class _ReleaseOnce:
+    """Releases the replica when the response gets closed, which may happen more than once."""
+
+    __slots__ = ("_balancer", "_replica", "_failed", "_released")
+
+    def __init__(self, balancer: LoadBalancer, replica: Replica, *, failed: bool) -> None:
+        self._balancer = balancer
+        self._replica = replica
+        self._failed = failed
+        self._released = False
+
+    def __call__(self) -> None:
+        if not self._released:
+            self._released = True
+            self._balancer.release(self._replica, failed=self._failed)
+
+
+class _ReleasingStream(SyncByteStream):
+    """Keeps the request in flight until its response body has been read and closed."""
+
+    __slots__ = ("_stream", "_release")
+
+    def __init__(self, stream: SyncByteStream, release: _ReleaseOnce) -> None:
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+class _AsyncReleasingStream(AsyncByteStream):
+    """Keeps the request in flight until its response body has been read and closed."""
+
+    __slots__ = ("_stream", "_release")
+
+    def __init__(self, stream: AsyncByteStream, release: _ReleaseOnce) -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+def _route(request: Request, replica: Replica) -> Request:
+    """
+    Redirect the request to the replica's origin.
+
+    The `Host` header is left intact, and the TLS server name is set to the original host,
+    so that the replica serves the right virtual host, and its certificate is verified against the service name.
+    """
+    request.extensions.setdefault("sni_hostname", request.url.host)
+    request.url = request.url.copy_with(scheme=replica.url.scheme, host=replica.url.host, port=replica.url.port)
+    return request
+
+
+def _get_outstanding(replica: Replica) -> int:
+    return replica.outstanding
+
+
+def _get_raw_path(request: Request) -> str:
+    return request.url.raw_path.decode("ascii")
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(blake2b(key.encode(), digest_size=8).digest(), "big")
@@ -0,0 +1,310 @@
+"""
+HTTP-semantics response cache for the HTTPX backends.
+
+The cache honours `Cache-Control: max-age`, and revalidates the stale responses
+by means of `If-None-Match` and `If-Modified-Since`.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from json import dumps, loads
+from os import PathLike
+from threading import Lock
+from time import time
+
+from annotated_types import SLOTS
+from httpx import Headers, Request, Response
+
+from combadge._helpers.sqlite import SharedDatabase
+
+__all__ = ("CachedResponse", "BaseHttpCacheStorage", "MemoryStorage", "SqliteStorage", "HttpCache")
+
+_CACHEABLE_METHODS = frozenset(("GET", "HEAD"))
+_CACHEABLE_STATUS_CODES = frozenset((200, 203, 300, 301, 308, 404, 410))
+_NOT_STORED_HEADERS = frozenset(("content-encoding", "content-length", "transfer-encoding"))
+"""The stored content is already decoded, so these headers do not apply to it anymore."""
+
+
+@dataclass(**SLOTS)
+class CachedResponse:
+    """Stored HTTP response."""
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+
+    fresh_until: float
+    """Until this UNIX timestamp the response is served without revalidation."""
+
+    vary: list[tuple[str, str | None]] = field(default_factory=list)
+    """Request header values which the response depends upon, as per the response `Vary` header."""
+
+    def is_fresh(self, now: float) -> bool:  # noqa: D102
+        return now < self.fresh_until
+
+    def matches(self, request: Request) -> bool:
+        """Check whether the request headers match the stored `Vary` values."""
+        return all(request.headers.get(name) == value for name, value in self.vary)
+
+    def to_response(self, request: Request) -> Response:
+        """Construct an HTTPX response from the stored one."""
+        return Response(self.status_code, headers=self.headers, content=self.content, request=request)
+
+
+class BaseHttpCacheStorage(ABC):
+    """Abstract storage of the HTTP responses."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """Get the stored response, or `#!python None` if it is missing."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, response: CachedResponse) -> None:
+        """Store the response."""
+        raise NotImplementedError
+
+
+class MemoryStorage(BaseHttpCacheStorage):
+    """In-process storage with LRU eviction."""
+
+    __slots__ = ("_responses", "_lock", "_maxsize")
+
+    def __init__(self, maxsize: int | None = 1024) -> None:
+        """
+        Instantiate the storage.
+
+        Args:
+            maxsize: maximum number of responses, the least recently used ones get evicted first;
+                `#!python None` means no limit
+        """
+        self._responses: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = maxsize
+
+    def get(self, key: str) -> CachedResponse | None:  # noqa: D102
+        with self._lock:
+            response = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: CachedResponse) -> None:  # noqa: D102
+        with self._lock:
+            self._responses[key] = response
+            self._responses.move_to_end(key)
+            if self._maxsize is not None:
+                while len(self._responses) > self._maxsize:
+                    self._responses.popitem(last=False)
+
+
+class SqliteStorage(BaseHttpCacheStorage):
+    """
+    Local SQLite file storage.
+
+    The file survives restarts, and may be shared between processes. The storage may be instantiated
+    before forking: each process opens its own connection on the first access.
+
+    Warning: Blocks the event loop
+        The storage queries the database synchronously, so with the async backend each cache lookup and update
+        blocks the event loop, including the wait for another process to release the database lock.
+        Prefer the [`MemoryStorage`][combadge.support.httpx.cache.MemoryStorage] for the async backend.
+    """
+
+    __slots__ = ("_database", "_lock", "_maxsize")
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS http_responses (
+            key TEXT PRIMARY KEY,
+            status_code INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            content BLOB NOT NULL,
+            fresh_until REAL NOT NULL,
+            vary TEXT NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS http_responses_accessed_at ON http_responses (accessed_at);
+    """
+
+    def __init__(self, path: str | PathLike[str], *, maxsize: int | None = 10_000) -> None:
+        """
+        Instantiate the storage.
+
+        Args:
+            path: database file path, the database gets created if missing
+            maxsize: maximum number of responses, the least recently used ones get evicted first;
+                `#!python None` means no limit
+        """
+        self._database = SharedDatabase(path, schema=self._SCHEMA)
+        self._lock = Lock()
+        self._maxsize = maxsize
+
+    def get(self, key: str) -> CachedResponse | None:  # noqa: D102
+        with self._lock:
+            connection = self._database.connect()
+            row = connection.execute(
+                "SELECT status_code, headers, content, fresh_until, vary FROM http_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE http_responses SET accessed_at = ? WHERE key = ?", (time(), key))
+        status_code, headers, content, fresh_until, vary = row
+        return CachedResponse(
+            status_code,
+            [tuple(header) for header in loads(headers)],
+            content,
+            fresh_until,
+            [tuple(value) for value in loads(vary)],
+        )
+
+    def set(self, key: str, response: CachedResponse) -> None:  # noqa: D102
+        with self._lock:
+            connection = self._database.connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO http_responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status_code,
+                    dumps(response.headers),
+                    response.content,
+                    response.fresh_until,
+                    dumps(response.vary),
+                    time(),
+                ),
+            )
+            if self._maxsize is not None:
+                connection.execute(
+                    "DELETE FROM http_responses WHERE key IN ("
+                    " SELECT key FROM http_responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?"
+                    ")",
+                    (self._maxsize,),
+                )
+
+
+class HttpCache:
+    """
+    HTTP response cache, which should be passed to an HTTPX backend.
+
+    Examples:
+        >>> backend = HttpxBackend(Client(base_url=...), http_cache=HttpCache(SqliteStorage("cache.db")))
+    """
+
+    __slots__ = ("_storage",)
+
+    def __init__(self, storage: BaseHttpCacheStorage | None = None) -> None:
+        """
+        Instantiate the cache.
+
+        Args:
+            storage: response storage, defaults to [`MemoryStorage`][combadge.support.httpx.cache.MemoryStorage]
+        """
+        self._storage = storage if storage is not None else MemoryStorage()
+
+    def lookup(self, request: Request) -> CachedResponse | None:
+        """
+        Look up the stored response, which may be either fresh or stale.
+
+        The request may force the revalidation by means of `Cache-Control: no-cache` or `max-age=0`,
+        in which case the stored response is returned as stale.
+        """
+        cache_control = _parse_cache_control(request.headers)
+        if request.method not in _CACHEABLE_METHODS or "no-store" in cache_control:
+            return None
+        cached = self._storage.get(_make_key(request))
+        if cached is None or not cached.matches(request):
+            return None
+        if "no-cache" in cache_control or cache_control.get("max-age") == "0":
+            return replace(cached, fresh_until=0.0)
+        return cached
+
+    @staticmethod
+    def make_conditional(request: Request, cached: CachedResponse | None) -> Request:
+        """Add the validators of the stale response to the request."""
+        if cached is not None:
+            cached_headers = Headers(cached.headers)
+            if (etag := cached_headers.get("ETag")) is not None:
+                request.headers["If-None-Match"] = etag
+            if (last_modified := cached_headers.get("Last-Modified")) is not None:
+                request.headers["If-Modified-Since"] = last_modified
+        return request
+
+    def update(self, request: Request, response: Response, cached: CachedResponse | None) -> Response:
+        """
+        Update the cache with the received response.
+
+        Returns:
+            Response to use, which is the stored one in case of `304 Not Modified`.
+        """
+        if request.method not in _CACHEABLE_METHODS:
+            return response
+        if response.status_code == 304 and cached is not None:
+            headers = Headers(cached.headers)
+            headers.update({name: value for name, value in response.headers.items() if name not in _NOT_STORED_HEADERS})
+            # The stored response may be shared with the concurrent requests, so not altering it in place:
+            cached = replace(cached, headers=headers.multi_items(), fresh_until=_get_fresh_until(headers))
+            self._storage.set(_make_key(request), cached)
+            return cached.to_response(request)
+        if not self._is_storable(request, response):
+            return response
+        cached = CachedResponse(
+            response.status_code,
+            [(name, value) for name, value in response.headers.multi_items() if name not in _NOT_STORED_HEADERS],
+            response.content,
+            _get_fresh_until(response.headers),
+            [(name, request.headers.get(name)) for name in _parse_vary(response.headers)],
+        )
+        self._storage.set(_make_key(request), cached)
+        return response
+
+    @staticmethod
+    def _is_storable(request: Request, response: Response) -> bool:
+        if response.status_code not in _CACHEABLE_STATUS_CODES:
+            return False
+        if "no-store" in _parse_cache_control(request.headers) or "no-store" in _parse_cache_control(response.headers):
+            return False
+        if "*" in _parse_vary(response.headers):
+            return False
+        # Storing only the responses which are either fresh for a while, or could be revalidated later:
+        return (
+            _get_fresh_until(response.headers) > time()
+            or "ETag" in response.headers
+            or "Last-Modified" in response.headers
+        )
+
+
+def _make_key(request: Request) -> str:
+    return f"{request.method} {request.url}"
+
+
+def _parse_cache_control(headers: Headers) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for value in headers.get_list("Cache-Control", split_commas=True):
+        name, _, argument = value.partition("=")
+        directives[name.strip().lower()] = argument.strip().strip('"') or None
+    return directives
+
+
+def _parse_vary(headers: Headers) -> list[str]:
+    return [name.strip().lower() for name in headers.get_list("Vary", split_commas=True) if name.strip()]
+
+
+def _get_fresh_until(headers: Headers) -> float:
+    """Calculate the response expiration timestamp from its `Cache-Control` and `Age` headers."""
+    cache_control = _parse_cache_control(headers)
+    if "no-cache" in cache_control:
+        return 0.0
+    try:
+        max_age = int(cache_control["max-age"] or "")
+    except (KeyError, ValueError):
+        return 0.0
+    try:
+        age = int(headers.get("Age", "0"))
+    except ValueError:
+        age = 0
+    return time() + max(max_age - age, 0)
@@ -0,0 +1,275 @@
+"""
+Connection rotation for the HTTPX transports.
+
+Long-lived keep-alive connections stick to the upstream replicas which were alive when the connections were opened,
+so that the newly scaled-out replicas behind an L4 load balancer get no traffic. The rotating transports limit
+the connection age and the number of requests per connection, and retire an exhausted connection once it is idle,
+so that the in-flight requests are never interrupted. The next request opens a fresh connection instead.
+"""
+
+from __future__ import annotations
+
+import ssl
+from collections.abc import Iterable
+from dataclasses import dataclass
+from math import inf
+from random import uniform
+from time import monotonic
+from typing import Any
+
+from annotated_types import SLOTS
+from httpcore import AsyncNetworkBackend, AsyncNetworkStream, NetworkBackend, NetworkStream
+from httpx import AsyncHTTPTransport, HTTPTransport, Request, Response
+
+__all__ = ("RotatingTransport", "AsyncRotatingTransport")
+
+_SocketOptions = Iterable[Any]
+
+
+@dataclass(**SLOTS)
+class _Rotation:
+    """Connection limits."""
+
+    max_lifetime: float | None
+    max_requests: int | None
+    jitter: float
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.jitter < 1.0:
+            raise ValueError(f"jitter must be within [0.0, 1.0), got {self.jitter}")
+
+    def new_budget(self) -> _Budget:
+        # Randomize the limits, so that the connections opened at once do not get retired at once:
+        factor = uniform(1.0 - self.jitter, 1.0 + self.jitter)  # noqa: S311
+        return _Budget(
+            expires_at=monotonic() + self.max_lifetime * factor if self.max_lifetime is not None else inf,
+            max_requests=self.max_requests * factor if self.max_requests is not None else inf,
+        )
+
+
+@dataclass(**SLOTS)
+class _Budget:
+    """Remaining lifetime of a connection."""
+
+    expires_at: float
+    max_requests: float
+    n_requests: int = 0
+
+    def is_exhausted(self) -> bool:
+        return self.n_requests >= self.max_requests or monotonic() >= self.expires_at
+
+
+class _RotatingStream(NetworkStream):
+    __slots__ = ("_stream", "budget")
+
+    def __init__(self, stream: NetworkStream, budget: _Budget) -> None:
+        self._stream = stream
+        self.budget = budget
+
+    def read(self, max_bytes: int, timeout: float | None = None) -> bytes:
+        return self._stream.read(max_bytes, timeout)
+
+    def write(self, buffer: bytes, timeout: float | None = None) -> None:
+        self._stream.write(buffer, timeout)
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def start_tls(
+        self,
+        ssl_context: ssl.SSLContext,
+        server_hostname: str | None = None,
+        timeout: float | None = None,
+    ) -> NetworkStream:
+        return _RotatingStream(self._stream.start_tls(ssl_context, server_hostname, timeout), self.budget)
+
+    def get_extra_info(self, info: str) -> Any:
+        if info == "is_readable" and self.budget.is_exhausted():
+            # The pool only checks this on idle connections, and treats a readable one as closed by the server:
+            return True
+        return self._stream.get_extra_info(info)
+
+
+class _AsyncRotatingStream(AsyncNetworkStream):
+    __slots__ = ("_stream", "budget")
+
+    def __init__(self, stream: AsyncNetworkStream, budget: _Budget) -> None:
+        self._stream = stream
+        self.budget = budget
+
+    async def read(self, max_bytes: int, timeout: float | None = None) -> bytes:
+        return await self._stream.read(max_bytes, timeout)
+
+    async def write(self, buffer: bytes, timeout: float | None = None) -> None:
+        await self._stream.write(buffer, timeout)
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+    async def start_tls(
+        self,
+        ssl_context: ssl.SSLContext,
+        server_hostname: str | None = None,
+        timeout: float | None = None,
+    ) -> AsyncNetworkStream:
+        stream = await self._stream.start_tls(ssl_context, server_hostname, timeout)
+        return _AsyncRotatingStream(stream, self.budget)
+
+    def get_extra_info(self, info: str) -> Any:
+        if info == "is_readable" and self.budget.is_exhausted():
+            # The pool only checks this on idle connections, and treats a readable one as closed by the server:
+            return True
+        return self._stream.get_extra_info(info)
+
+
+class _RotatingBackend(NetworkBackend):
+    __slots__ = ("_backend", "_rotation")
+
+    def __init__(self, backend: NetworkBackend, rotation: _Rotation) -> None:
+        self._backend = backend
+        self._rotation = rotation
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: _SocketOptions | None = None,
+    ) -> NetworkStream:
+        stream = self._backend.connect_tcp(host, port, timeout, local_address, socket_options)
+        return _RotatingStream(stream, self._rotation.new_budget())
+
+    def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: _SocketOptions | None = None,
+    ) -> NetworkStream:
+        stream = self._backend.connect_unix_socket(path, timeout, socket_options)
+        return _RotatingStream(stream, self._rotation.new_budget())
+
+    def sleep(self, seconds: float) -> None:
+        self._backend.sleep(seconds)
+
+
+class _AsyncRotatingBackend(AsyncNetworkBackend):
+    __slots__ = ("_backend", "_rotation")
+
+    def __init__(self, backend: AsyncNetworkBackend, rotation: _Rotation) -> None:
+        self._backend = backend
+        self._rotation = rotation
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: _SocketOptions | None = None,
+    ) -> AsyncNetworkStream:
+        stream = await self._backend.connect_tcp(host, port, timeout, local_address, socket_options)
+        return _AsyncRotatingStream(stream, self._rotation.new_budget())
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: _SocketOptions | None = None,
+    ) -> AsyncNetworkStream:
+        stream = await self._backend.connect_unix_socket(path, timeout, socket_options)
+        return _AsyncRotatingStream(stream, self._rotation.new_budget())
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class RotatingTransport(HTTPTransport):
+    """
+    Sync HTTPX transport which recycles the connections by their age and number of requests.
+
+    Note: HTTP/1.1 only
+        An HTTP/2 connection multiplexes the requests, so it is never idle under load, and does not get rotated.
+
+    Examples:
+        >>> transport = RotatingTransport(max_lifetime=300.0, max_requests=1000, limits=Limits(max_connections=50))
+        >>> backend = HttpxBackend(Client(base_url="http://my-service", transport=transport))
+    """
+
+    def __init__(
+        self,
+        *,
+        max_lifetime: float | None = None,
+        max_requests: int | None = None,
+        jitter: float = 0.1,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Instantiate the transport.
+
+        Args:
+            max_lifetime: maximum connection age (in seconds)
+            max_requests: maximum number of the requests per connection
+            jitter: relative spread of the limits, so that the connections do not get recycled all at once
+            kwargs: [`HTTPTransport`](https://www.python-httpx.org/advanced/transports/) parameters
+        """
+        super().__init__(**kwargs)
+        # HTTPX does not expose the pool's network backend, hence wrapping it in place:
+        self._pool._network_backend = _RotatingBackend(
+            self._pool._network_backend,
+            _Rotation(max_lifetime, max_requests, jitter),
+        )
+
+    def handle_request(self, request: Request) -> Response:  # noqa: D102
+        response = super().handle_request(request)
+        _count_request(response)
+        return response
+
+
+class AsyncRotatingTransport(AsyncHTTPTransport):
+    """
+    Async HTTPX transport which recycles the connections by their age and number of requests.
+
+    Note: HTTP/1.1 only
+        An HTTP/2 connection multiplexes the requests, so it is never idle under load, and does not get rotated.
+
+    Examples:
+        >>> transport = AsyncRotatingTransport(max_lifetime=300.0, max_requests=1000)
+        >>> backend = HttpxBackend(AsyncClient(base_url="http://my-service", transport=transport))
+    """
+
+    def __init__(
+        self,
+        *,
+        max_lifetime: float | None = None,
+        max_requests: int | None = None,
+        jitter: float = 0.1,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Instantiate the transport.
+
+        Args:
+            max_lifetime: maximum connection age (in seconds)
+            max_requests: maximum number of the requests per connection
+            jitter: relative spread of the limits, so that the connections do not get recycled all at once
+            kwargs: [`AsyncHTTPTransport`](https://www.python-httpx.org/advanced/transports/) parameters
+        """
+        super().__init__(**kwargs)
+        # HTTPX does not expose the pool's network backend, hence wrapping it in place:
+        self._pool._network_backend = _AsyncRotatingBackend(
+            self._pool._network_backend,
+            _Rotation(max_lifetime, max_requests, jitter),
+        )
+
+    async def handle_async_request(self, request: Request) -> Response:  # noqa: D102
+        response = await super().handle_async_request(request)
+        _count_request(response)
+        return response
+
+
+def _count_request(response: Response) -> None:
+    """Account for the request in the budget of the connection which has served it."""
+    stream = response.extensions.get("network_stream")
+    if isinstance(stream, (_RotatingStream, _AsyncRotatingStream)):
+        stream.budget.n_requests += 1
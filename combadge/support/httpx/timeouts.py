@@ -0,0 +1,90 @@
+"""Adaptive request timeouts for the HTTPX backends."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from threading import Lock
+
+from combadge._helpers.latency import LatencyWindow
+
+
+class AdaptiveTimeout:
+    """
+    Derives the per-method timeouts from the observed latencies.
+
+    The effective timeout of a method is a multiple of its latency percentile, within the bounds.
+    Thus, a stuck call to a fast endpoint gets abandoned quickly, without breaking the slow endpoints.
+    Until enough latencies are observed, the client's timeout is used.
+
+    Tip: This object is thread-safe
+        It may be shared between backends.
+
+    Examples:
+        >>> backend = HttpxBackend(
+        >>>     Client(base_url="https://example.com", timeout=30.0),
+        >>>     adaptive_timeout=AdaptiveTimeout(percentile=0.99, multiplier=3.0, min_timeout=0.1),
+        >>> )
+    """
+
+    __slots__ = (
+        "_percentile",
+        "_multiplier",
+        "_min_timeout",
+        "_max_timeout",
+        "_window_size",
+        "_min_samples",
+        "_windows",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.99,
+        multiplier: float = 3.0,
+        min_timeout: float = 0.1,
+        max_timeout: float = 30.0,
+        window_size: int = 1000,
+        min_samples: int = 20,
+    ) -> None:
+        """
+        Instantiate the adaptive timeout.
+
+        Args:
+            percentile: observed latency percentile, in the range `(0.0, 1.0]`
+            multiplier: timeout to the latency percentile ratio
+            min_timeout: minimum timeout (in seconds)
+            max_timeout: maximum timeout (in seconds)
+            window_size: number of the recent latencies observed per method
+            min_samples: number of the observed latencies required to adapt the timeout
+        """
+        self._percentile = percentile
+        self._multiplier = multiplier
+        self._min_timeout = min_timeout
+        self._max_timeout = max_timeout
+        self._window_size = window_size
+        self._min_samples = min_samples
+        self._windows: dict[Hashable, LatencyWindow] = {}
+        self._lock = Lock()
+
+    def get_timeout(self, method_key: Hashable) -> float | None:
+        """
+        Get the effective timeout of the method.
+
+        Returns:
+            Timeout (in seconds), or `#!python None` if there are not enough observed latencies.
+        """
+        if (window := self._windows.get(method_key)) is None or (
+            latency := window.percentile(self._percentile)
+        ) is None:
+            return None
+        return max(self._min_timeout, min(self._max_timeout, latency * self._multiplier))
+
+    def observe(self, method_key: Hashable, latency: float) -> None:
+        """Record the method call latency (in seconds)."""
+        if (window := self._windows.get(method_key)) is None:
+            with self._lock:
+                window = self._windows.get(method_key)
+                if window is None:
+                    window = self._windows[method_key] = LatencyWindow(self._window_size, min_samples=self._min_samples)
+        window.add(latency)
@@ -0,0 +1,10 @@
+"""
+[JSON-RPC 2.0][1] support – the backends require `combadge[httpx]` extra.
+
+!!! tip "JSON-RPC is transported over HTTP"
+
+    Method parameters are marked with the generic HTTP [`Payload`][combadge.support.http.markers.Payload]
+    and [`Field`][combadge.support.http.markers.Field] markers, which build the `params` object.
+
+[1]: https://www.jsonrpc.org/specification
+"""
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from annotated_types import SLOTS
+
+
+@dataclass(**SLOTS)
+class JsonRpcMethodName:
+    """JSON-RPC method name."""
+
+    method_name: str | None = None
+
+    def get_method_name(self) -> str:
+        """Get validated JSON-RPC method name."""
+        if not (method_name := self.method_name):
+            raise ValueError("a JSON-RPC request requires a non-empty method name")
+        return method_name
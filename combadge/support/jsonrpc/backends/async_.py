@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from asyncio import Future, TimerHandle, get_running_loop
+from collections.abc import Hashable
+from types import TracebackType
+from typing import Any, cast
+
+from httpx import AsyncClient, Response, Timeout
+from pydantic import TypeAdapter
+from typing_extensions import Self, override
+
+from combadge._helpers.asyncio import spawn
+from combadge._helpers.httpx import max_timeout
+from combadge._helpers.pydantic import get_type_adapter
+from combadge.core.binder import BaseBoundService
+from combadge.core.errors import BackendError
+from combadge.core.interfaces import ServiceMethod
+from combadge.core.signature import Signature
+from combadge.support.jsonrpc.backends.base import BaseJsonRpcBackend
+from combadge.support.jsonrpc.request import Request
+
+
+class JsonRpcBackend(BaseJsonRpcBackend[AsyncClient]):
+    """Async JSON-RPC backend over HTTPX."""
+
+    __slots__ = (
+        "_service_cache",
+        "_client",
+        "_raise_for_status",
+        "_http_cache",
+        "_adaptive_timeout",
+        "_endpoint",
+        "_ids",
+        "_batch_window",
+        "_max_batch_size",
+        "_batch",
+        "_batch_timer",
+    )
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        *,
+        endpoint: str = "",
+        raise_for_status: bool = True,
+        batch_window: float | None = None,
+        max_batch_size: int = 100,
+    ) -> None:
+        """
+        Instantiate the backend.
+
+        Args:
+            client: [HTTPX client](https://www.python-httpx.org/advanced/#client-instances)
+            endpoint: URL path of the JSON-RPC endpoint, relative to the client's base URL
+            raise_for_status: automatically call `raise_for_status()`
+            batch_window: enables the batching mode – the concurrent calls made within the window (in seconds)
+                get packed into a single JSON-RPC batch, `0.0` means the same event loop tick
+            max_batch_size: the batch is sent immediately once it reaches the size
+
+        Note: Batched calls share the HTTP request
+            Hence, the per-call HTTP headers are ignored in the batching mode,
+            and the batch request gets the longest of the calls' timeouts.
+        """
+        BaseJsonRpcBackend.__init__(self, client, endpoint=endpoint, raise_for_status=raise_for_status)
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._batch: dict[Any, tuple[dict[str, Any], Timeout, Future[tuple[Response, Any]]]] = {}
+        self._batch_timer: TimerHandle | None = None
+
+    @classmethod
+    @override
+    def bind_method(cls, signature: Signature) -> ServiceMethod[JsonRpcBackend]:  # noqa: D102
+        result_type, error_type = cls._split_response_type(signature.return_type)
+        response_type: TypeAdapter[Any] = get_type_adapter(cast(Hashable, result_type))
+
+        async def bound_method(self: BaseBoundService[JsonRpcBackend], *args: Any, **kwargs: Any) -> Any:
+            request = signature.build_request(Request, self, args, kwargs)
+            backend = self.__combadge_backend__
+            timeout = backend._get_timeout()
+            with BackendError:
+                envelope = backend._make_envelope(request)
+                if backend._batch_window is None:
+                    response: Response = await backend._client.post(
+                        backend._endpoint,
+                        json=envelope,
+                        headers=(request.http_headers or None),
+                        timeout=timeout,
+                    )
+                    response_envelope = backend._parse_payload(response)
+                else:
+                    response, response_envelope = await backend._enqueue(envelope, timeout)
+                payload, error = backend._parse_envelope(response_envelope, error_type)
+            if error is not None:
+                return error
+            return signature.apply_response_markers(response, payload, response_type)
+
+        return bound_method  # type: ignore[return-value]
+
+    def _enqueue(self, envelope: dict[str, Any], timeout: Timeout) -> Future[tuple[Response, Any]]:
+        """Add the request object to the pending batch, and return the future response object."""
+        loop = get_running_loop()
+        future: Future[tuple[Response, Any]] = loop.create_future()
+        if not self._batch:
+            self._batch_timer = loop.call_later(cast(float, self._batch_window), self._flush)
+        self._batch[envelope["id"]] = (envelope, timeout, future)
+        if len(self._batch) >= self._max_batch_size:
+            self._flush()
+        return future
+
+    def _flush(self) -> None:
+        """Send the pending batch and start a new one."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        if self._batch:
+            spawn(self._send_batch(self._batch))
+            self._batch = {}
+
+    async def _send_batch(
+        self,
+        batch: dict[Any, tuple[dict[str, Any], Timeout, Future[tuple[Response, Any]]]],
+    ) -> None:
+        """Send the batch, and route the response objects back to the callers by their identifiers."""
+        try:
+            response = await self._client.post(
+                self._endpoint,
+                json=[envelope for envelope, _, _ in batch.values()],
+                timeout=max_timeout(timeout for _, timeout, _ in batch.values()),
+            )
+            response_envelopes = self._parse_payload(response)
+            if not isinstance(response_envelopes, list):
+                # A server responds with a single error object, if the batch as a whole is invalid.
+                by_id = dict.fromkeys(batch, response_envelopes)
+            else:
+                by_id = {envelope.get("id"): envelope for envelope in response_envelopes}
+        except Exception as e:
+            for _, _, future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            # The batch has been cancelled, for example, on the event loop shutdown, so should be the callers:
+            for _, _, future in batch.values():
+                future.cancel()
+            raise
+
+        for id_, (_, _, future) in batch.items():
+            if future.done():
+                continue  # the caller has been cancelled
+            try:
+                future.set_result((response, by_id[id_]))
+            except KeyError:
+                future.set_exception(KeyError(f"the batch response misses the request #{id_}"))
+
+    async def __aenter__(self) -> Self:
+        self._client = await self._client.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> Any:
+        return await self._client.__aexit__(exc_type, exc_value, traceback)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from abc import ABC
+from itertools import count
+from types import GenericAlias, UnionType
+from typing import Any, Union
+from typing import get_args as get_type_args
+from typing import get_origin as get_type_origin
+
+from pydantic import TypeAdapter
+
+from combadge._helpers.pydantic import get_type_adapter
+from combadge.support.httpx.backends.base import BaseHttpxBackend, _ClientT
+from combadge.support.jsonrpc.request import Request
+from combadge.support.jsonrpc.response import JsonRpcError, ResponseEnvelope
+
+_UNSET = object()
+
+
+class BaseJsonRpcBackend(BaseHttpxBackend[_ClientT], ABC):
+    """Base class for the sync and async backends. Not intended for a direct use."""
+
+    __slots__ = ("_service_cache", "_client", "_raise_for_status", "_http_cache", "_endpoint", "_ids")
+
+    def __init__(self, client: _ClientT, *, endpoint: str, raise_for_status: bool) -> None:  # noqa: D107
+        BaseHttpxBackend.__init__(self, client, raise_for_status=raise_for_status)
+        self._endpoint = endpoint
+        self._ids = count(1)
+
+    def _make_envelope(self, request: Request) -> dict[str, Any]:
+        """Wrap the request into a JSON-RPC request object with a new identifier."""
+        envelope: dict[str, Any] = {"jsonrpc": "2.0", "method": request.get_method_name(), "id": next(self._ids)}
+        if request.payload is not None:
+            envelope["params"] = request.payload
+        return envelope
+
+    @staticmethod
+    def _split_response_type(response_type: Any) -> tuple[Any, TypeAdapter[Any]]:
+        """
+        Split the response type into results and errors.
+
+        JSON-RPC errors are delivered separately from the results, so we need to extract them
+        from the annotated response type.
+        """
+
+        if get_type_origin(response_type) in (Union, UnionType):
+            return_types = get_type_args(response_type)
+        else:
+            return_types = (response_type,)
+
+        result_type: Any = _UNSET
+        error_types: list[type[JsonRpcError]] = []
+
+        for return_type in return_types:
+            if (
+                isinstance(return_type, type)
+                and not isinstance(return_type, GenericAlias)  # remove when dropping Python 3.10
+                and issubclass(return_type, JsonRpcError)
+            ):
+                error_types.append(return_type)
+            elif result_type is _UNSET:
+                result_type = return_type
+            else:
+                result_type = result_type | return_type
+
+        if result_type is _UNSET:
+            result_type = None
+        if JsonRpcError not in error_types:
+            error_types.append(JsonRpcError)  # always falling back to the generic error
+
+        return result_type, get_type_adapter(Union[tuple(error_types)])  # noqa: UP007
+
+    @staticmethod
+    def _parse_envelope(envelope: Any, error_type: TypeAdapter[Any]) -> tuple[Any, JsonRpcError | None]:
+        """
+        Parse the JSON-RPC response object.
+
+        Returns:
+            Result payload and the validated error, if any.
+        """
+        parsed = ResponseEnvelope.model_validate(envelope)
+        if parsed.error is not None:
+            return None, error_type.validate_python(parsed.error)
+        return parsed.result, None
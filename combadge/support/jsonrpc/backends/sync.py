@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from collections.abc import Hashable
+from types import TracebackType
+from typing import Any, cast
+
+from httpx import Client, Response
+from pydantic import TypeAdapter
+from typing_extensions import Self, override
+
+from combadge._helpers.pydantic import get_type_adapter
+from combadge.core.binder import BaseBoundService
+from combadge.core.errors import BackendError
+from combadge.core.interfaces import ServiceMethod
+from combadge.core.signature import Signature
+from combadge.support.jsonrpc.backends.base import BaseJsonRpcBackend
+from combadge.support.jsonrpc.request import Request
+
+
+class JsonRpcBackend(BaseJsonRpcBackend[Client]):
+    """Sync JSON-RPC backend over HTTPX."""
+
+    __slots__ = (
+        "_service_cache",
+        "_client",
+        "_raise_for_status",
+        "_http_cache",
+        "_adaptive_timeout",
+        "_endpoint",
+        "_ids",
+    )
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        endpoint: str = "",
+        raise_for_status: bool = True,
+    ) -> None:
+        """
+        Instantiate the backend.
+
+        Args:
+            client: [HTTPX client](https://www.python-httpx.org/advanced/#client-instances)
+            endpoint: URL path of the JSON-RPC endpoint, relative to the client's base URL
+            raise_for_status: automatically call `raise_for_status()`
+        """
+        BaseJsonRpcBackend.__init__(self, client, endpoint=endpoint, raise_for_status=raise_for_status)
+
+    @classmethod
+    @override
+    def bind_method(cls, signature: Signature) -> ServiceMethod[JsonRpcBackend]:  # noqa: D102
+        result_type, error_type = cls._split_response_type(signature.return_type)
+        response_type: TypeAdapter[Any] = get_type_adapter(cast(Hashable, result_type))
+
+        def bound_method(self: BaseBoundService[JsonRpcBackend], *args: Any, **kwargs: Any) -> Any:
+            request = signature.build_request(Request, self, args, kwargs)
+            backend = self.__combadge_backend__
+            timeout = backend._get_timeout()
+            with BackendError:
+                response: Response = backend._client.post(
+                    backend._endpoint,
+                    json=backend._make_envelope(request),
+                    headers=(request.http_headers or None),
+                    timeout=timeout,
+                )
+                payload, error = backend._parse_envelope(backend._parse_payload(response), error_type)
+            if error is not None:
+                return error
+            return signature.apply_response_markers(response, payload, response_type)
+
+        return bound_method  # type: ignore[return-value]
+
+    def __enter__(self) -> Self:
+        self._client = self._client.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> Any:
+        return self._client.__exit__(exc_type, exc_value, traceback)
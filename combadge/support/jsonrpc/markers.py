@@ -0,0 +1,33 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from inspect import BoundArguments
+from typing import Any, Generic
+
+from annotated_types import SLOTS
+from typing_extensions import override
+
+from combadge.core.markers.method import MethodMarker
+from combadge.core.typevars import FunctionT
+from combadge.support.jsonrpc.abc import JsonRpcMethodName
+
+
+@dataclass(**SLOTS)
+class MethodName(Generic[FunctionT], MethodMarker[JsonRpcMethodName, FunctionT]):  # noqa: D101
+    name: str
+
+    @override
+    def prepare_request(self, request: JsonRpcMethodName, _arguments: BoundArguments) -> None:  # noqa: D102
+        request.method_name = self.name
+
+
+def method_name(name: str) -> Callable[[FunctionT], FunctionT]:
+    """
+    Mark a service call's JSON-RPC method name.
+
+    Examples:
+        >>> class SupportsCalculator(Protocol):
+        >>>     @method_name("subtract")
+        >>>     def subtract(self, minuend: Annotated[int, Field("minuend")], ...) -> ...:
+        >>>         ...
+    """
+    return MethodName[Any](name).mark
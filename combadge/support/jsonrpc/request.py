@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from annotated_types import SLOTS
+
+from combadge.support.http.abc import HttpRequestHeaders, HttpRequestPayload
+from combadge.support.jsonrpc.abc import JsonRpcMethodName
+from combadge.support.shared.request import BaseBackendRequest
+
+
+@dataclass(**SLOTS)
+class Request(BaseBackendRequest, JsonRpcMethodName, HttpRequestHeaders, HttpRequestPayload):
+    """Backend-agnostic JSON-RPC request."""
@@ -0,0 +1,33 @@
+"""Response models for JSON-RPC."""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from combadge.core.response import ErrorResponse
+
+
+class JsonRpcError(ErrorResponse):
+    """
+    [JSON-RPC error object][1] response model.
+
+    [1]: https://www.jsonrpc.org/specification#error_object
+
+    Tip:
+        JSON-RPC backends **always** fall back to `JsonRpcError` if the actual error
+        does not match any of the protocol's error return types. Subclass it and narrow down
+        the `code` with a `Literal` to handle the specific errors.
+    """
+
+    code: int
+    message: str
+    data: Any = None
+
+
+class ResponseEnvelope(BaseModel):
+    """[JSON-RPC response object](https://www.jsonrpc.org/specification#response_object)."""
+
+    jsonrpc: Literal["2.0"]
+    id: int | str | None = None
+    result: Any = None
+    error: dict[str, Any] | None = None
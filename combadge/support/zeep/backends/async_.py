@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from asyncio import wait_for
 from collections.abc import Collection
+from contextlib import nullcontext
 from os import PathLike, fspath
 from ssl import SSLContext
 from types import TracebackType
@@ -15,18 +17,23 @@ from zeep.proxy import AsyncOperationProxy, AsyncServiceProxy
 from zeep.transports import AsyncTransport
 from zeep.wsse import UsernameToken
 
+from combadge._helpers.httpx import count_idle_connections, hold_connection_async
 from combadge.core.binder import BaseBoundService
-from combadge.core.errors import BackendError
+from combadge.core.concurrency import ConcurrencyLimiter
+from combadge.core.deadline import get_remaining_time
+from combadge.core.errors import BackendError, CombadgeError
 from combadge.core.interfaces import ServiceMethod
 from combadge.core.signature import Signature
+from combadge.core.warming import AsyncConnectionWarmer, warm_up_async
 from combadge.support.soap.request import Request
 from combadge.support.zeep.backends.base import BaseZeepBackend, ByBindingName, ByServiceName
+from combadge.support.zeep.transports import AsyncHttpxTransport
 
 
 class ZeepBackend(BaseZeepBackend[AsyncServiceProxy, AsyncOperationProxy]):
     """Asynchronous Zeep service."""
 
-    __slots__ = ("_service", "_service_cache")
+    __slots__ = ("_service", "_service_cache", "_concurrency_limiter")
 
     @classmethod
     def with_params(
@@ -40,30 +47,44 @@ class ZeepBackend(BaseZeepBackend[AsyncServiceProxy, AsyncOperationProxy]):
         wsse: UsernameToken | None = None,
         verify_ssl: PathLike | bool | SSLContext = True,
         cert: PathLike | tuple[PathLike, PathLike | None] | tuple[PathLike, PathLike | None, str | None] | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: AsyncTransport | None = None,
+        concurrency_limiter: ConcurrencyLimiter | None = None,
     ) -> ZeepBackend:
         """
         Instantiate the backend using a set of the most common parameters.
 
         Using the `__init__()` may become quite wordy, so this method simplifies typical use cases.
-        """
-        verify = verify_ssl if isinstance(verify_ssl, (bool, SSLContext)) else fspath(verify_ssl)
-
-        if isinstance(cert, tuple):
-            cert_file = cert[0]
-            key_file = cert[1]
-            password = cert[2] if len(cert) == 3 else None  # type: ignore[misc]
-            cert_ = (fspath(cert_file), fspath(key_file) if key_file else None, password)
-        elif cert is not None:
-            cert_ = fspath(cert)
-        else:
-            cert_ = None
-
-        transport = AsyncTransport(
-            timeout=None,  # overloaded
-            client=httpx.AsyncClient(timeout=operation_timeout, verify=verify, cert=cert_),
-            wsdl_client=httpx.Client(timeout=load_timeout, verify=verify, cert=cert_),
-        )
 
+        Args:
+            wsdl_path: path to the WSDL document
+            service: service specification, the client's default service is used when omitted
+            plugins: [Zeep plugins](https://docs.python-zeep.org/en/master/plugins.html)
+            load_timeout: timeout for loading the WSDL and XSD documents
+            operation_timeout: timeout for the operation calls
+            wsse: [WS-Security](https://docs.python-zeep.org/en/master/wsse.html) username token
+            verify_ssl: verify the server certificate, a path to a CA bundle, or an SSL context
+            cert: client certificate file, or a tuple of the certificate file, key file and password
+            limits: [connection pool limits](https://www.python-httpx.org/advanced/resource-limits/),
+                including the keep-alive expiry
+            http2: enable HTTP/2, requires `httpx[http2]`
+            transport: pre-configured transport, which may be shared between several backends;
+                when specified, the other connection parameters are ignored.
+                Zeep's own `AsyncTransport` closes its client on the exit of any of its backends,
+                so share an [`AsyncHttpxTransport`][combadge.support.zeep.transports.AsyncHttpxTransport] instead
+            concurrency_limiter: optional [adaptive concurrency limiter][combadge.core.concurrency.ConcurrencyLimiter]
+                for the operation calls
+        """
+        if transport is None:
+            transport = cls._create_transport(
+                load_timeout=load_timeout,
+                operation_timeout=operation_timeout,
+                verify_ssl=verify_ssl,
+                cert=cert,
+                limits=limits,
+                http2=http2,
+            )
         client = AsyncClient(fspath(wsdl_path), wsse=wsse, plugins=plugins, transport=transport)
         if service is None:
             service_proxy = client.service
@@ -78,32 +99,80 @@ class ZeepBackend(BaseZeepBackend[AsyncServiceProxy, AsyncOperationProxy]):
             )
         else:
             raise TypeError(type(service))
-        return cls(service_proxy)
+        return cls(service_proxy, concurrency_limiter=concurrency_limiter)
+
+    @staticmethod
+    def _create_transport(
+        *,
+        load_timeout: float | None,
+        operation_timeout: float | None,
+        verify_ssl: PathLike | bool | SSLContext,
+        cert: PathLike | tuple[PathLike, PathLike | None] | tuple[PathLike, PathLike | None, str | None] | None,
+        limits: httpx.Limits | None,
+        http2: bool,
+    ) -> AsyncHttpxTransport:
+        verify = verify_ssl if isinstance(verify_ssl, (bool, SSLContext)) else fspath(verify_ssl)
+
+        if isinstance(cert, tuple):
+            cert_file = cert[0]
+            key_file = cert[1]
+            password = cert[2] if len(cert) == 3 else None  # type: ignore[misc]
+            cert_ = (fspath(cert_file), fspath(key_file) if key_file else None, password)
+        elif cert is not None:
+            cert_ = fspath(cert)
+        else:
+            cert_ = None
+
+        return AsyncHttpxTransport(
+            httpx.AsyncClient(
+                timeout=operation_timeout,
+                verify=verify,
+                cert=cert_,
+                limits=limits or httpx.Limits(),
+                http2=http2,
+            ),
+            wsdl_client=httpx.Client(timeout=load_timeout, verify=verify, cert=cert_),
+            close_clients=True,
+        )
 
     def __init__(
         self,
         service: AsyncServiceProxy,
+        *,
+        concurrency_limiter: ConcurrencyLimiter | None = None,
     ) -> None:
         """
         Instantiate the backend.
 
         Args:
             service: [service proxy object](https://docs.python-zeep.org/en/master/client.html#the-serviceproxy-object)
+            concurrency_limiter: optional [adaptive concurrency limiter][combadge.core.concurrency.ConcurrencyLimiter]
+                for the operation calls
         """
         BaseZeepBackend.__init__(self, service)
+        self._concurrency_limiter = concurrency_limiter
 
     @classmethod
     @override
     def bind_method(cls, signature: Signature, /) -> ServiceMethod[ZeepBackend]:  # noqa: D102
-        response_type, fault_type = cls._adapt_response_type(signature.return_type)
+        response_type, fault_index = cls._adapt_response_type(signature.return_type)
 
         async def bound_method(self: BaseBoundService[ZeepBackend], *args: Any, **kwargs: Any) -> Any:
             request = signature.build_request(Request, self, args, kwargs)
-            operation = self.__combadge_backend__._get_operation(request.get_operation_name())
+            backend = self.__combadge_backend__
+            operation = backend._get_operation(request.get_operation_name())
+            timeout = get_remaining_time()
             try:
-                response = await operation(**(request.payload or {}), _soapheaders=request.soap_header)
+                async with backend._concurrency_limiter.acquire() if backend._concurrency_limiter else nullcontext():
+                    # Zeep's async transport does not accept a per-call timeout, hence limiting the call as a whole:
+                    response = await wait_for(
+                        operation(**(request.payload or {}), _soapheaders=request.soap_header),
+                        timeout,
+                    )
             except Fault as e:
-                return self.__combadge_backend__._parse_soap_fault(e, fault_type)
+                return backend._parse_soap_fault(e, fault_index)
+            except CombadgeError:
+                raise
             except Exception as e:
                 raise BackendError(e) from e
             else:
@@ -113,6 +182,54 @@ class ZeepBackend(BaseZeepBackend[AsyncServiceProxy, AsyncOperationProxy]):
 
     binder = bind_method  # type: ignore[assignment]
 
+    async def warm_connections(self, n: int, *, address: str | None = None, timeout: float = 10.0) -> int:
+        """
+        Open the pooled connections in advance, so that the first calls do not pay for the handshakes.
+
+        Args:
+            n: number of the connections to open, the extra ones are dropped if it exceeds the pool's
+                `max_keepalive_connections`; one connection is enough for HTTP/2
+            address: address to send the `HEAD` requests to, defaults to the service address
+            timeout: maximum time (in seconds) to hold the opened connections while waiting for the rest
+
+        Returns:
+            Number of the successfully opened connections.
+        """
+        client: httpx.AsyncClient = self._service._client.transport.client
+        address = self._get_warm_up_address(address)
+        return await warm_up_async(lambda: hold_connection_async(client, address), n, timeout=timeout)
+
+    def keep_connections_warm(
+        self,
+        n: int,
+        *,
+        address: str | None = None,
+        interval: float = 4.0,
+        timeout: float = 10.0,
+    ) -> AsyncConnectionWarmer:
+        """
+        Keep at least `n` idle connections ready.
+
+        Periodically checks the pool in a background task, and once fewer than `n` connections are idle,
+        [warms the connections up][combadge.support.zeep.backends.async_.ZeepBackend.warm_connections] again.
+        Holding `n` connections at once reuses the idle ones, and opens only the missing ones.
+
+        The interval should be shorter than the pool's `keepalive_expiry`, which is 5 seconds by default.
+
+        Returns:
+            Started warmer, which should be stopped when the backend is no longer used.
+        """
+        address = self._get_warm_up_address(address)
+        client: httpx.AsyncClient = self._service._client.transport.client
+        return AsyncConnectionWarmer(
+            lambda: self.warm_connections(
+                n if count_idle_connections(client, address) < n else 0,
+                address=address,
+                timeout=timeout,
+            ),
+            interval=interval,
+        )
+
     async def __aenter__(self) -> Self:
         self._service = await self._service.__aenter__()
         return self
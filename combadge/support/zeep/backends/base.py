@@ -1,19 +1,22 @@
 from __future__ import annotations
 
 from abc import ABC
-from dataclasses import dataclass
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from enum import Enum
 from types import GenericAlias, UnionType
-from typing import Any, Generic, TypeVar, Union
+from typing import Any, Generic, Literal, TypeVar, Union
 from typing import get_args as get_type_args
 from typing import get_origin as get_type_origin
 
 from annotated_types import SLOTS
-from pydantic import HttpUrl, TypeAdapter
+from pydantic import HttpUrl, TypeAdapter, ValidationError
 from pydantic_core import Url
 from zeep.exceptions import Fault
 from zeep.proxy import OperationProxy, ServiceProxy
 
 from combadge._helpers.pydantic import get_type_adapter
+from combadge._helpers.typing import unwrap_annotated
 from combadge.core.backend import BaseBackend
 from combadge.core.errors import BackendError
 from combadge.support.soap.response import BaseSoapFault
@@ -28,9 +31,6 @@ See Also:
 
 _OperationProxyT = TypeVar("_OperationProxyT", bound=OperationProxy)
 
-_SoapFaultT = TypeVar("_SoapFaultT")
-"""Specific SOAP Fault model type."""
-
 _UNSET = object()
 
 
@@ -45,12 +45,13 @@ class BaseZeepBackend(BaseBackend, ABC, Generic[_ServiceProxyT, _OperationProxyT
         self._service = service
 
     @staticmethod
-    def _split_response_type(response_type: Any) -> tuple[Any, Any]:
+    def _split_response_type(response_type: Any) -> tuple[Any, SoapFaultIndex]:
         """
         Split the response type into non-faults and faults.
 
         SOAP faults are handled separately, so we need to extract them from the annotated
-        response type.
+        response type. The fault models get indexed by their fault codes, so that parsing
+        a fault does not require trying each of them.
         """
 
         if get_type_origin(response_type) in (Union, UnionType):
@@ -59,7 +60,7 @@ class BaseZeepBackend(BaseBackend, ABC, Generic[_ServiceProxyT, _OperationProxyT
             return_types = (response_type,)
 
         response_type: Any = _UNSET
-        fault_type: Any = _UNSET
+        fault_types: list[type[BaseSoapFault]] = []
 
         for return_type in return_types:
             if (
@@ -68,7 +69,7 @@ class BaseZeepBackend(BaseBackend, ABC, Generic[_ServiceProxyT, _OperationProxyT
                 and issubclass(return_type, BaseSoapFault)
             ):
                 # We should treat the return type as a SOAP fault type.
-                fault_type = fault_type | return_type if fault_type is not _UNSET else return_type
+                fault_types.append(return_type)
             elif response_type is _UNSET:
                 response_type = return_type
             else:
@@ -76,17 +77,14 @@ class BaseZeepBackend(BaseBackend, ABC, Generic[_ServiceProxyT, _OperationProxyT
 
         if response_type is _UNSET:
             response_type = None
-        if fault_type is _UNSET:
-            fault_type = BaseSoapFault
 
-        # Base SOAP fault should always be present as a fallback.
-        return response_type, fault_type | BaseSoapFault
+        return response_type, SoapFaultIndex.from_types(fault_types)
 
     @classmethod
-    def _adapt_response_type(cls, response_type: Any) -> tuple[TypeAdapter[Any], TypeAdapter[Any]]:
-        """Split the response type into non-faults and faults, and wrap them into the adapters."""
-        response_type, fault_type = cls._split_response_type(response_type)
-        return get_type_adapter(response_type), get_type_adapter(fault_type)
+    def _adapt_response_type(cls, response_type: Any) -> tuple[TypeAdapter[Any], SoapFaultIndex]:
+        """Split the response type into non-faults and faults, and wrap the former into the adapter."""
+        response_type, fault_index = cls._split_response_type(response_type)
+        return get_type_adapter(response_type), fault_index
 
     def _get_operation(self, name: str) -> _OperationProxyT:
         """Get an operation by its name."""
@@ -95,10 +93,79 @@ class BaseZeepBackend(BaseBackend, ABC, Generic[_ServiceProxyT, _OperationProxyT
         except AttributeError as e:
             raise InvalidOperationError(e) from e
 
+    def _get_warm_up_address(self, address: str | None) -> str:
+        """Get the address to warm the connections up to, which is the service address by default."""
+        if address is not None:
+            return address
+        # Zeep does not expose the address of a service proxy otherwise:
+        return self._service._binding_options["address"]
+
     @staticmethod
-    def _parse_soap_fault(exception: Fault, fault_type: TypeAdapter[_SoapFaultT]) -> _SoapFaultT:
+    def _parse_soap_fault(exception: Fault, fault_index: SoapFaultIndex) -> BaseSoapFault:
         """Parse the SOAP fault."""
-        return fault_type.validate_python(exception.__dict__)
+        return fault_index.parse(exception.__dict__)
+
+
+@dataclass(**SLOTS)
+class SoapFaultIndex:
+    """
+    SOAP fault models indexed by their fault codes.
+
+    A model gets indexed when its `code` is annotated with a `Literal`. Thus, a fault is only validated
+    against the models declaring its code, falling back to the models without a literal code,
+    and finally to `BaseSoapFault`.
+    """
+
+    by_code: Mapping[Any, tuple[type[BaseSoapFault], ...]] = field(default_factory=dict)
+    """Fault models by their literal fault codes."""
+
+    unindexed: TypeAdapter[Any] | None = None
+    """Union of the fault models which do not declare a literal fault code."""
+
+    @classmethod
+    def from_types(cls, fault_types: Iterable[type[BaseSoapFault]]) -> SoapFaultIndex:
+        """Build the index from the fault models."""
+        by_code: dict[Any, tuple[type[BaseSoapFault], ...]] = {}
+        unindexed: list[type[BaseSoapFault]] = []
+        for fault_type in fault_types:
+            if fault_type is BaseSoapFault:
+                continue  # it is always the fallback anyway
+            codes = _get_literal_codes(fault_type)
+            if codes:
+                for code in codes:
+                    by_code[code] = (*by_code.get(code, ()), fault_type)
+            else:
+                unindexed.append(fault_type)
+        return cls(
+            by_code=by_code,
+            unindexed=get_type_adapter(Union[tuple(unindexed)]) if unindexed else None,  # noqa: UP007
+        )
+
+    def parse(self, fault: dict[str, Any]) -> BaseSoapFault:
+        """Validate the fault against the matching model."""
+        for fault_type in self.by_code.get(fault.get("code"), ()):
+            try:
+                return fault_type.model_validate(fault)
+            except ValidationError:
+                continue
+        if self.unindexed is not None:
+            try:
+                return self.unindexed.validate_python(fault)
+            except ValidationError:
+                pass
+        # Base SOAP fault should always be present as a fallback.
+        return BaseSoapFault.model_validate(fault)
+
+
+def _get_literal_codes(of_fault_type: type[BaseSoapFault]) -> tuple[Any, ...]:
+    """Get the literal fault codes declared by the model, if any."""
+    code_field = of_fault_type.model_fields.get("code")
+    if code_field is None:
+        return ()
+    annotation = unwrap_annotated(code_field.annotation)
+    if get_type_origin(annotation) is not Literal:
+        return ()
+    return tuple(code.value if isinstance(code, Enum) else code for code in get_type_args(annotation))
 
 
 @dataclass(**SLOTS)
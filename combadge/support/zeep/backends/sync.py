@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Collection
+from collections.abc import Collection, Iterator
+from contextlib import contextmanager
 from os import PathLike, fspath
 from types import TracebackType
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 from typing_extensions import Self, override
 from zeep import Client, Plugin, Transport
@@ -13,12 +15,39 @@ from zeep.proxy import OperationProxy, ServiceProxy
 from zeep.wsse import UsernameToken
 
 from combadge.core.binder import BaseBoundService
-from combadge.core.errors import BackendError
+from combadge.core.deadline import get_remaining_time
+from combadge.core.errors import BackendError, CombadgeError
 from combadge.core.interfaces import ServiceMethod
 from combadge.core.signature import Signature
+from combadge.core.warming import ConnectionWarmer, warm_up
 from combadge.support.soap.request import Request
 from combadge.support.zeep.backends.base import BaseZeepBackend, ByBindingName, ByServiceName
 
+if TYPE_CHECKING:
+    import httpx
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class _Transport(Transport):
+    """
+    Zeep's default `requests`-based transport, which limits the operation timeout by the current deadline.
+
+    The deadline is a context variable, so the transport is never altered per call and may be shared by threads.
+    """
+
+    @property  # type: ignore[override]
+    def operation_timeout(self) -> float | None:
+        timeout: float | None = self._operation_timeout
+        if (remaining := get_remaining_time()) is not None:
+            # Calls made within a deadline only get the remaining time:
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        return timeout
+
+    @operation_timeout.setter
+    def operation_timeout(self, value: float | None) -> None:
+        self._operation_timeout = value
+
 
 class ZeepBackend(BaseZeepBackend[ServiceProxy, OperationProxy]):
     """Synchronous Zeep service."""
@@ -38,23 +67,71 @@ class ZeepBackend(BaseZeepBackend[ServiceProxy, OperationProxy]):
         verify_ssl: bool | PathLike = True,
         cert_file: PathLike | None = None,
         key_file: PathLike | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: Transport | None = None,
     ) -> ZeepBackend:
         """
         Instantiate the backend using a set of the most common parameters.
 
         Using the `__init__()` may become quite wordy, so this method simplifies typical use cases.
+
+        Args:
+            wsdl_path: path to the WSDL document
+            service: service specification, the client's default service is used when omitted
+            plugins: [Zeep plugins](https://docs.python-zeep.org/en/master/plugins.html)
+            load_timeout: timeout for loading the WSDL and XSD documents
+            operation_timeout: timeout for the operation calls
+            wsse: [WS-Security](https://docs.python-zeep.org/en/master/wsse.html) username token
+            verify_ssl: verify the server certificate, or a path to a CA bundle
+            cert_file: client certificate file
+            key_file: client certificate key file
+            limits: [connection pool limits](https://www.python-httpx.org/advanced/resource-limits/),
+                including the keep-alive expiry
+            http2: enable HTTP/2, requires `httpx[http2]`
+            transport: pre-configured transport, which may be shared between several backends;
+                when specified, the other connection parameters are ignored.
+                The backends do not close the clients of a passed `HttpxTransport`, unless it has `close_clients`
+
+        Tip: Pool limits and HTTP/2
+            The default `requests`-based transport supports neither of these.
+            Specifying `limits` or `http2` switches the backend to
+            [`HttpxTransport`][combadge.support.zeep.transports.HttpxTransport].
         """
-        client = Client(
-            fspath(wsdl_path),
-            wsse=wsse,
-            transport=Transport(timeout=load_timeout, operation_timeout=operation_timeout),
-            plugins=plugins,
-        )
-        client.transport.session.verify = verify_ssl if isinstance(verify_ssl, bool) else fspath(verify_ssl)
-        client.transport.session.cert = (
-            fspath(cert_file) if cert_file is not None else None,
-            fspath(key_file) if key_file is not None else None,
-        )
+        if transport is None:
+            if limits is not None or http2:
+                # HTTPX is an optional dependency for the sync backend:
+                import httpx
+
+                from combadge.support.zeep.transports import HttpxTransport
+
+                verify = verify_ssl if isinstance(verify_ssl, bool) else fspath(verify_ssl)
+                cert: str | tuple[str, str] | None
+                if cert_file is None:
+                    cert = None
+                elif key_file is None:
+                    cert = fspath(cert_file)
+                else:
+                    cert = (fspath(cert_file), fspath(key_file))
+                transport = HttpxTransport(
+                    httpx.Client(
+                        timeout=operation_timeout,
+                        verify=verify,
+                        cert=cert,
+                        limits=limits or httpx.Limits(),
+                        http2=http2,
+                    ),
+                    wsdl_client=httpx.Client(timeout=load_timeout, verify=verify, cert=cert),
+                    close_clients=True,
+                )
+            else:
+                transport = _Transport(timeout=load_timeout, operation_timeout=operation_timeout)
+                transport.session.verify = verify_ssl if isinstance(verify_ssl, bool) else fspath(verify_ssl)
+                transport.session.cert = (
+                    fspath(cert_file) if cert_file is not None else None,
+                    fspath(key_file) if key_file is not None else None,
+                )
+        client = Client(fspath(wsdl_path), wsse=wsse, transport=transport, plugins=plugins)
         if service is None:
             service_proxy = client.service
         elif isinstance(service, ByServiceName):
@@ -80,15 +157,18 @@ class ZeepBackend(BaseZeepBackend[ServiceProxy, OperationProxy]):
     @classmethod
     @override
     def bind_method(cls, signature: Signature, /) -> ServiceMethod[ZeepBackend]:  # noqa: D102
-        response_type, fault_type = cls._adapt_response_type(signature.return_type)
+        response_type, fault_index = cls._adapt_response_type(signature.return_type)
 
         def bound_method(self: BaseBoundService[ZeepBackend], *args: Any, **kwargs: Any) -> Any:
             request = signature.build_request(Request, self, args, kwargs)
             operation = self.__combadge_backend__._get_operation(request.get_operation_name())
+            get_remaining_time()  # fail fast, if the deadline has passed
             try:
                 response = operation(**(request.payload or {}), _soapheaders=request.soap_header)
             except Fault as e:
-                return self.__combadge_backend__._parse_soap_fault(e, fault_type)
+                return self.__combadge_backend__._parse_soap_fault(e, fault_index)
+            except CombadgeError:
+                raise
             except Exception as e:
                 raise BackendError(e) from e
             else:
@@ -98,6 +178,89 @@ class ZeepBackend(BaseZeepBackend[ServiceProxy, OperationProxy]):
 
     binder = bind_method  # type: ignore[assignment]
 
+    def warm_connections(self, n: int, *, address: str | None = None, timeout: float = 10.0) -> int:
+        """
+        Open the pooled connections in advance, so that the first calls do not pay for the handshakes.
+
+        Args:
+            n: number of the connections to open, the extra ones are dropped if it exceeds the pool size
+            address: address to send the `HEAD` requests to, defaults to the service address
+            timeout: maximum time (in seconds) to hold the opened connections while waiting for the rest
+
+        Returns:
+            Number of the successfully opened connections.
+        """
+        address = self._get_warm_up_address(address)
+        return warm_up(lambda: self._hold_connection(address), n, timeout=timeout)
+
+    def keep_connections_warm(
+        self,
+        n: int,
+        *,
+        address: str | None = None,
+        interval: float = 4.0,
+        timeout: float = 10.0,
+    ) -> ConnectionWarmer:
+        """
+        Keep at least `n` idle connections ready.
+
+        Periodically checks the pool in a background thread, and once fewer than `n` connections are idle,
+        [warms the connections up][combadge.support.zeep.backends.sync.ZeepBackend.warm_connections] again.
+        Holding `n` connections at once reuses the idle ones, and opens only the missing ones.
+
+        The interval should be shorter than the pool's keep-alive expiry.
+
+        Returns:
+            Started warmer, which should be stopped when the backend is no longer used.
+        """
+        address = self._get_warm_up_address(address)
+        return ConnectionWarmer(
+            lambda: self.warm_connections(
+                n if self._count_idle_connections(address) < n else 0,
+                address=address,
+                timeout=timeout,
+            ),
+            interval=interval,
+        )
+
+    def _count_idle_connections(self, address: str) -> int:
+        """Count the idle connections in the transport's pool."""
+        transport = self._service._client.transport
+        if hasattr(transport, "session"):
+            # `requests` does not expose its pools, the idle connections are the ones returned to the `urllib3` pools:
+            split_address = urlsplit(address)
+            origin = (
+                split_address.scheme,
+                split_address.hostname,
+                split_address.port or _DEFAULT_PORTS.get(split_address.scheme),
+            )
+            pools = transport.session.get_adapter(address).poolmanager.pools
+            n_idle = 0
+            for key in pools.keys():  # noqa: SIM118 – the container does not support iterating over itself
+                if (key.key_scheme, key.key_host, key.key_port) == origin and (pool := pools.get(key)) is not None:
+                    n_idle += sum(connection is not None for connection in list(getattr(pool.pool, "queue", ())))
+            return n_idle
+        # `HttpxTransport`, HTTPX is an optional dependency for the sync backend:
+        from combadge._helpers.httpx import count_idle_connections
+
+        return count_idle_connections(transport.client, address)
+
+    @contextmanager
+    def _hold_connection(self, address: str) -> Iterator[None]:
+        """Take a connection from the transport's pool, and return it to the pool on exit."""
+        transport = self._service._client.transport
+        if hasattr(transport, "session"):
+            # `requests` holds the connection until the streamed response is consumed:
+            with transport.session.head(address, stream=True) as response:
+                yield
+                _ = response.content
+        else:
+            # `HttpxTransport`, HTTPX is an optional dependency for the sync backend:
+            from combadge._helpers.httpx import hold_connection
+
+            with hold_connection(transport.client, address):
+                yield
+
     def __enter__(self) -> Self:
         self._service = self._service.__enter__()
         return self
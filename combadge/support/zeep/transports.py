@@ -0,0 +1,168 @@
+"""Additional Zeep transports."""
+
+from __future__ import annotations
+
+from logging import getLogger
+from typing import Any
+
+import httpx
+from requests import Response
+from zeep import Transport
+from zeep.exceptions import TransportError
+from zeep.transports import AsyncTransport
+from zeep.utils import get_version
+from zeep.wsdl.utils import etree_to_string
+
+from combadge._helpers.httpx import limit_timeout
+from combadge.core.deadline import get_remaining_time
+
+
+class HttpxTransport(Transport):
+    """
+    Synchronous Zeep transport which sends requests via an [HTTPX client][1] instead of `requests`.
+
+    Unlike the default transport, it honours the HTTPX [pool limits][2] and supports HTTP/2.
+    A single instance may be shared by several Zeep clients (and, thus, backends)
+    so that they reuse one connection pool. Zeep closes the transport on the client exit,
+    so by default the transport leaves the HTTPX clients open, and their owner should close them.
+
+    [1]: https://www.python-httpx.org/advanced/clients/
+    [2]: https://www.python-httpx.org/advanced/resource-limits/
+
+    Examples:
+        >>> transport = HttpxTransport(httpx.Client(limits=httpx.Limits(max_connections=50), http2=True))
+        >>> backend_a = ZeepBackend.with_params(wsdl_a, transport=transport)
+        >>> backend_b = ZeepBackend.with_params(wsdl_b, transport=transport)
+    """
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        *,
+        wsdl_client: httpx.Client | None = None,
+        cache: Any = None,
+        operation_timeout: float | None = None,
+        close_clients: bool = False,
+    ) -> None:
+        """
+        Instantiate the transport.
+
+        Args:
+            client: HTTPX client which performs the operation calls
+            wsdl_client: HTTPX client which loads WSDL and XSD documents, defaults to `client`
+            cache: Zeep cache for the loaded documents
+            operation_timeout: operation timeout, overrides the client's default timeout when set
+            close_clients: whether the transport owns the clients, and `close()` should close them –
+                which must not be the case for a shared transport
+        """
+
+        # Intentionally not calling the super constructor, since it would instantiate a `requests` session.
+        self._close_session = False
+        self._close_clients = close_clients
+        self.cache = cache
+        self.load_timeout = None
+        self.operation_timeout = operation_timeout
+        self.client = client
+        self.wsdl_client = wsdl_client or client
+        self.logger = getLogger(__name__)
+
+        user_agent = f"Zeep/{get_version()} (www.python-zeep.org)"
+        self.client.headers["User-Agent"] = user_agent
+        self.wsdl_client.headers["User-Agent"] = user_agent
+
+    def get(self, address: str, params: Any, headers: Any) -> Response:  # noqa: D102
+        response = self.client.get(address, params=params, headers=headers, timeout=self._get_timeout())
+        return self._new_response(response)
+
+    def post(self, address: str, message: Any, headers: Any) -> Response:  # noqa: D102
+        response = self.client.post(address, content=message, headers=headers, timeout=self._get_timeout())
+        return self._new_response(response)
+
+    def post_xml(self, address: str, envelope: Any, headers: Any) -> Response:  # noqa: D102
+        return self.post(address, etree_to_string(envelope), headers)
+
+    def close(self) -> None:
+        """Close the underlying clients, if the transport owns them."""
+        if not self._close_clients:
+            return
+        self.client.close()
+        if self.wsdl_client is not self.client:
+            self.wsdl_client.close()
+
+    def _load_remote_data(self, url: str) -> bytes:
+        response = self.wsdl_client.get(url)
+        result = response.read()
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise TransportError(status_code=response.status_code) from e
+        return result
+
+    def _get_timeout(self) -> Any:
+        timeout = httpx.Timeout(self.operation_timeout) if self.operation_timeout is not None else self.client.timeout
+        if (remaining := get_remaining_time()) is not None:
+            # Calls made within a deadline only get the remaining time:
+            timeout = limit_timeout(timeout, remaining)
+        return timeout
+
+    @staticmethod
+    def _new_response(response: httpx.Response) -> Response:
+        """Convert the HTTPX response into the `requests` one, which is what Zeep expects."""
+        new = Response()
+        new._content = response.read()
+        new.status_code = response.status_code
+        new.headers = response.headers  # type: ignore[assignment]
+        new.encoding = response.encoding
+        return new
+
+
+class AsyncHttpxTransport(AsyncTransport):
+    """
+    Asynchronous Zeep transport which may be shared by several Zeep clients (and, thus, backends).
+
+    Zeep's own `AsyncTransport` closes its HTTPX client on the exit of any of its Zeep clients,
+    which breaks the others. By default this transport leaves the HTTPX clients open, and their owner should close them.
+
+    Examples:
+        >>> transport = AsyncHttpxTransport(httpx.AsyncClient(limits=httpx.Limits(max_connections=50), http2=True))
+        >>> backend_a = ZeepBackend.with_params(wsdl_a, transport=transport)
+        >>> backend_b = ZeepBackend.with_params(wsdl_b, transport=transport)
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        wsdl_client: httpx.Client | None = None,
+        cache: Any = None,
+        close_clients: bool = False,
+    ) -> None:
+        """
+        Instantiate the transport.
+
+        Args:
+            client: HTTPX client which performs the operation calls
+            wsdl_client: HTTPX client which loads WSDL and XSD documents – Zeep loads them synchronously
+            cache: Zeep cache for the loaded documents
+            close_clients: whether the transport owns the clients, and `aclose()` should close them –
+                which must not be the case for a shared transport
+        """
+
+        # Intentionally not calling the super constructor, since it would replace the clients' headers.
+        self._close_session = False
+        self._close_clients = close_clients
+        self.cache = cache
+        self.client = client
+        self.wsdl_client = wsdl_client or httpx.Client()
+        self.logger = getLogger(__name__)
+
+        user_agent = f"Zeep/{get_version()} (www.python-zeep.org)"
+        self.client.headers["User-Agent"] = user_agent
+        self.wsdl_client.headers["User-Agent"] = user_agent
+
+    async def aclose(self) -> None:
+        """Close the underlying clients, if the transport owns them."""
+        if not self._close_clients:
+            return
+        await self.client.aclose()
+        self.wsdl_client.close()
@@ -0,0 +1,78 @@
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from types import ModuleType
+
+import httpx
+from lxml import etree  # type: ignore[import-untyped]
+from zeep import Client
+from zeep.exceptions import Fault
+
+from combadge.codegen.wsdl import _to_field_name, generate, main
+from combadge.support.zeep.backends.sync import ZeepBackend
+from combadge.support.zeep.transports import HttpxTransport
+
+_WSDL_PATH = Path(__file__).parent / "faults.wsdl"
+
+_RESPONSE = """<?xml version="1.0" encoding="utf-8"?>
+<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
+  <soap:Body>
+    <GetOrderResponse xmlns="http://example.com/orders">
+      <createdAt>2023-01-27T13:14:04</createdAt>
+      <lines><sku>foo</sku><quantity>2</quantity></lines>
+      <lines><sku>bar</sku><quantity>1</quantity><price>9.99</price></lines>
+    </GetOrderResponse>
+  </soap:Body>
+</soap:Envelope>"""
+
+
+def _import(path: Path) -> ModuleType:
+    spec = spec_from_file_location(path.stem, path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_module(tmp_path: Path) -> None:
+    output_path = tmp_path / "orders.py"
+    main([str(_WSDL_PATH), "--output", str(output_path)])
+    orders = _import(output_path)
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        assert b"<ns0:orderId>42</ns0:orderId>" in request.content
+        return httpx.Response(200, text=_RESPONSE, headers={"Content-Type": "text/xml; charset=utf-8"})
+
+    transport = HttpxTransport(httpx.Client(transport=httpx.MockTransport(handle)))
+    service = ZeepBackend(Client(str(_WSDL_PATH), transport=transport).service)[orders.SupportsOrders]
+
+    response = service.get_order(orders.GetOrderRequest(order_id=42)).unwrap()
+    assert isinstance(response, orders.GetOrderResponse)
+    assert [line.sku for line in response.lines] == ["foo", "bar"]
+    assert response.lines[0].price is None
+
+
+def test_generated_fault(tmp_path: Path) -> None:
+    output_path = tmp_path / "orders_faults.py"
+    output_path.write_text(generate(_WSDL_PATH))
+    orders = _import(output_path)
+
+    detail = etree.fromstring('<detail><OrderNotFound xmlns="http://example.com/orders"/></detail>')
+    _, fault_index = ZeepBackend._split_response_type(orders.GetOrderResponse | orders.OrderNotFoundFault)
+    fault = ZeepBackend._parse_soap_fault(Fault("not found", "SOAP-ENV:Server", detail=detail), fault_index)
+    assert isinstance(fault, orders.OrderNotFoundFault)
+
+    fault = ZeepBackend._parse_soap_fault(Fault("unknown", "SOAP-ENV:Server"), fault_index)
+    assert type(fault) is not orders.OrderNotFoundFault
+
+
+def test_generate_async() -> None:
+    source = generate(Path(__file__).parent.parent / "integration" / "wsdl" / "NumberConversion.wsdl", is_async=True)
+    assert "async def number_to_words(" in source
+    compile(source, "number_conversion.py", "exec")
+
+
+def test_to_field_name() -> None:
+    assert _to_field_name("sCountryISOCode") == "s_country_iso_code"
+    assert _to_field_name("class") == "class_"
+    assert _to_field_name("_value_1") == "value_1"
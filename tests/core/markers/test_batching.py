@@ -0,0 +1,80 @@
+from asyncio import CancelledError, all_tasks, gather, sleep, wait_for
+from typing import Any
+
+import pytest
+
+from combadge.core.markers.batching import Batched
+
+
+class _Service:
+    def __init__(self) -> None:
+        self.bulk_calls: list[list[int]] = []
+
+    async def get_items(self, ids: list[int]) -> list[dict[str, int]]:
+        self.bulk_calls.append(ids)
+        return [{"id": id_, "value": id_ * 10} for id_ in reversed(ids) if id_ != 404]
+
+
+async def _get_item(self: Any, item_id: int) -> dict[str, int]:
+    raise NotImplementedError
+
+
+async def test_batch() -> None:
+    service = _Service()
+    get_item = Batched[Any]("get_items", key=lambda item: item["id"]).wrap(_get_item)
+
+    results = await gather(get_item(service, 1), get_item(service, 2), get_item(service, item_id=1))
+    assert results == [{"id": 1, "value": 10}, {"id": 2, "value": 20}, {"id": 1, "value": 10}]
+    assert service.bulk_calls == [[1, 2]]
+
+
+async def test_max_batch_size() -> None:
+    service = _Service()
+    get_item = Batched[Any]("get_items", key=lambda item: item["id"], max_batch_size=2).wrap(_get_item)
+
+    await gather(get_item(service, 1), get_item(service, 2), get_item(service, 3))
+    assert service.bulk_calls == [[1, 2], [3]]
+
+
+async def test_missing_key() -> None:
+    service = _Service()
+    get_item = Batched[Any]("get_items", key=lambda item: item["id"]).wrap(_get_item)
+
+    results = await gather(get_item(service, 1), get_item(service, 404), return_exceptions=True)
+    assert results[0] == {"id": 1, "value": 10}
+    assert isinstance(results[1], KeyError)
+
+
+async def test_bulk_exception() -> None:
+    class _FailingService:
+        async def get_items(self, ids: list[int]) -> Any:
+            raise ValueError
+
+    get_item = Batched[Any]("get_items").wrap(_get_item)
+    results = await gather(get_item(_FailingService(), 1), get_item(_FailingService(), 2), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+async def test_dispatch_cancelled() -> None:
+    class _HangingService:
+        async def get_items(self, ids: list[int]) -> Any:
+            await sleep(10.0)
+
+    get_item = Batched[Any]("get_items").wrap(_get_item)
+    callers = gather(get_item(_HangingService(), 1), get_item(_HangingService(), 2), return_exceptions=True)
+    await sleep(0.01)
+    (dispatch,) = (
+        task for task in all_tasks() if getattr(task.get_coro(), "__qualname__", None) == "_Batcher._dispatch"
+    )
+    dispatch.cancel()
+
+    results = await wait_for(callers, 1.0)
+    assert all(isinstance(result, CancelledError) for result in results), "the callers must not hang"
+
+
+def test_invalid_method() -> None:
+    async def get_item(self: Any, item_id: int, extra: int) -> None:
+        raise NotImplementedError
+
+    with pytest.raises(TypeError):
+        Batched[Any]("get_items").wrap(get_item)
@@ -0,0 +1,64 @@
+from asyncio import create_task, sleep
+from threading import Event, Thread
+from typing import Any
+
+import pytest
+
+from combadge.core.concurrency import Bulkhead
+from combadge.core.errors import LimitExceededError
+from combadge.core.markers.bulkheading import Bulkheaded
+
+
+def test_sync_max_wait() -> None:
+    started = Event()
+    release = Event()
+
+    def slow(self: Any) -> None:
+        started.set()
+        release.wait()
+
+    bulkhead = Bulkhead(1, max_wait=0.01)
+    method = Bulkheaded[Any](bulkhead).wrap(slow)
+    thread = Thread(target=method, args=(None,))
+    thread.start()
+    try:
+        started.wait()
+        assert bulkhead.in_flight == 1
+        with pytest.raises(LimitExceededError):
+            method(None)
+    finally:
+        release.set()
+        thread.join()
+    assert (bulkhead.in_flight, bulkhead.queue_depth) == (0, 0)
+
+
+def test_sync_queue_full() -> None:
+    bulkhead = Bulkhead(1, max_queue_size=0)
+    with bulkhead.acquire(), pytest.raises(LimitExceededError):
+        Bulkheaded[Any](bulkhead).wrap(lambda self: None)(None)
+
+
+def test_per_method() -> None:
+    marker = Bulkheaded[Any](lambda: Bulkhead(1, max_queue_size=0))
+    method_a = marker.wrap(lambda self, other: other(self))
+    method_b = marker.wrap(lambda self: 42)
+    assert method_a(None, method_b) == 42  # would be rejected if the bulkhead was shared
+
+
+async def test_async_group() -> None:
+    bulkhead = Bulkhead(1, max_queue_size=1)
+
+    async def slow(self: Any) -> None:
+        await sleep(0.01)
+
+    method_a = Bulkheaded[Any](bulkhead).wrap(slow)
+    method_b = Bulkheaded[Any](bulkhead).wrap(slow)
+    task_a = create_task(method_a(None))
+    task_b = create_task(method_b(None))
+    await sleep(0.0)
+    assert (bulkhead.in_flight, bulkhead.queue_depth) == (1, 1)
+    with pytest.raises(LimitExceededError):
+        await method_b(None)
+    await task_a
+    await task_b
+    assert (bulkhead.in_flight, bulkhead.queue_depth) == (0, 0)
@@ -0,0 +1,107 @@
+from asyncio import sleep
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from combadge.core.cache import SqliteCache
+from combadge.core.markers.caching import Cached
+from combadge.core.response import ErrorResponse, SuccessfulResponse
+
+
+class _Response(SuccessfulResponse):
+    value: int
+
+
+class _ErrorResponse(ErrorResponse):
+    pass
+
+
+def _make_method(mock: Mock) -> Any:
+    def method(self: Any, x: int, y: int = 0) -> _Response | _ErrorResponse:
+        return mock(x, y)
+
+    return method
+
+
+def test_cache_hit() -> None:
+    mock = Mock(side_effect=lambda x, y: _Response(value=x + y))
+    method = Cached[Any](ttl=60.0).wrap(_make_method(mock))
+
+    assert method(None, 1) == _Response(value=1)
+    assert method(None, x=1, y=0) == _Response(value=1)  # same bound arguments
+    assert method(None, 2) == _Response(value=2)
+    assert mock.call_count == 2
+
+
+def test_shared_storage_rejects_unstable_keys(tmp_path: Path) -> None:
+    mock = Mock(side_effect=lambda x, y: _Response(value=x + y))
+    method = Cached[Any](ttl=60.0, storage=SqliteCache(tmp_path / "cache.db")).wrap(_make_method(mock))
+
+    assert method(None, 1) == _Response(value=1)
+    with pytest.raises(TypeError, match="`function` value cannot be fingerprinted"):
+        method(None, 1, lambda: 2)
+    mock.assert_called_once()
+
+
+def test_key_function(tmp_path: Path) -> None:
+    mock = Mock(side_effect=lambda x, y: _Response(value=x))
+    storage = SqliteCache(tmp_path / "cache.db")
+    method = Cached[Any](ttl=60.0, storage=storage, key=lambda x, y=None: x).wrap(_make_method(mock))
+
+    assert method(None, 1, lambda: 2) == _Response(value=1)
+    assert method(None, 1, lambda: 3) == _Response(value=1)
+    assert mock.call_count == 1
+
+
+def test_expired() -> None:
+    mock = Mock(return_value=_Response(value=42))
+    method = Cached[Any](ttl=0.0).wrap(_make_method(mock))
+
+    method(None, 1)
+    method(None, 1)
+    assert mock.call_count == 2
+
+
+def test_error_response_not_cached_by_default() -> None:
+    mock = Mock(return_value=_ErrorResponse())
+    method = Cached[Any](ttl=60.0).wrap(_make_method(mock))
+
+    method(None, 1)
+    method(None, 1)
+    assert mock.call_count == 2
+
+
+def test_error_response_cached() -> None:
+    mock = Mock(return_value=_ErrorResponse())
+    method = Cached[Any](ttl=60.0, error_ttl=60.0).wrap(_make_method(mock))
+
+    method(None, 1)
+    method(None, 1)
+    assert mock.call_count == 1
+
+
+def test_maxsize() -> None:
+    mock = Mock(side_effect=lambda x, y: _Response(value=x))
+    method = Cached[Any](ttl=60.0, maxsize=1).wrap(_make_method(mock))
+
+    method(None, 1)
+    method(None, 2)
+    method(None, 1)
+    assert mock.call_count == 3
+
+
+async def test_async_stale_while_revalidate() -> None:
+    mock = AsyncMock(side_effect=[_Response(value=1), _Response(value=2)])
+
+    async def method(self: Any, x: int) -> _Response:
+        return await mock(x)
+
+    wrapped = Cached[Any](ttl=0.0, stale_while_revalidate=60.0).wrap(method)
+
+    assert await wrapped(None, 1) == _Response(value=1)
+    assert await wrapped(None, 1) == _Response(value=1)  # stale, and the refresh is scheduled
+    await sleep(0.0)  # let the refresh finish
+    assert await wrapped(None, 1) == _Response(value=2)
+    assert mock.await_count == 2
@@ -0,0 +1,71 @@
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from combadge.core.circuit_breaker import CircuitBreaker, CircuitState
+from combadge.core.errors import BackendError, CircuitOpenError
+from combadge.core.markers.circuit_breaking import CircuitBroken, circuit_breaker
+from combadge.core.markers.method import MethodMarker
+
+
+def test_fails_fast() -> None:
+    mock = Mock(side_effect=BackendError(httpx.ConnectError("failed")))
+    method = CircuitBroken[Any](CircuitBreaker(2)).wrap(mock)
+    for _ in range(2):
+        with pytest.raises(BackendError):
+            method(None)
+    with pytest.raises(CircuitOpenError):
+        method(None)
+    assert mock.call_count == 2
+
+
+async def test_async() -> None:
+    breaker = CircuitBreaker(1)
+    mock = AsyncMock(side_effect=[42, BackendError(httpx.ConnectError("failed"))])
+    method = CircuitBroken[Any](breaker).wrap(mock)
+    assert await method(None) == 42
+    with pytest.raises(BackendError):
+        await method(None)
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_per_backend() -> None:
+    class Backend:
+        pass
+
+    class Service:
+        __combadge_backend__ = Backend()
+
+    marker = CircuitBroken[Any](lambda: CircuitBreaker(1), per_backend=True)
+    method_a = marker.wrap(Mock(side_effect=BackendError(httpx.ConnectError("failed"))))
+    method_b = marker.wrap(Mock(return_value=42))
+    with pytest.raises(BackendError):
+        method_a(Service())
+    with pytest.raises(CircuitOpenError):
+        method_b(Service())
+
+
+def test_per_backend_different_settings() -> None:
+    class Backend:
+        pass
+
+    class Service:
+        __combadge_backend__ = Backend()
+
+    def wrap(decorator: Any, mock: Mock) -> Any:
+        def method(self: Any) -> None:
+            pass
+
+        (marker,) = MethodMarker.ensure_markers(decorator(method))
+        return marker.wrap(mock)
+
+    failing = Mock(side_effect=BackendError(httpx.ConnectError("failed")))
+    with pytest.raises(BackendError):
+        wrap(circuit_breaker(1, per_backend=True), failing)(Service())
+    assert wrap(circuit_breaker(2, per_backend=True), Mock(return_value=42))(Service()) == 42, (
+        "the different settings do not share the breaker"
+    )
+    with pytest.raises(CircuitOpenError):
+        wrap(circuit_breaker(1, per_backend=True), Mock())(Service())  # but the equal ones do
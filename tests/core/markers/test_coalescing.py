@@ -0,0 +1,69 @@
+from asyncio import CancelledError, Event, create_task, gather, sleep
+from typing import Any
+
+import pytest
+
+from combadge.core.markers.coalescing import SingleFlight
+
+
+async def test_coalesce() -> None:
+    calls = 0
+    event = Event()
+
+    async def method(self: Any, x: int) -> int:
+        nonlocal calls
+        calls += 1
+        await event.wait()
+        return x
+
+    wrapped = SingleFlight[Any]().wrap(method)
+    tasks = [create_task(wrapped(None, 1)), create_task(wrapped(None, x=1)), create_task(wrapped(None, 2))]
+    await sleep(0.0)
+    event.set()
+    assert await gather(*tasks) == [1, 1, 2]
+    assert calls == 2
+
+    # The completed call is forgotten:
+    assert await wrapped(None, 1) == 1
+    assert calls == 3
+
+
+async def test_shared_exception() -> None:
+    event = Event()
+
+    async def method(self: Any) -> None:
+        await event.wait()
+        raise ValueError
+
+    wrapped = SingleFlight[Any]().wrap(method)
+    tasks = [create_task(wrapped(None)), create_task(wrapped(None))]
+    await sleep(0.0)
+    event.set()
+    for result in await gather(*tasks, return_exceptions=True):
+        assert isinstance(result, ValueError)
+
+
+async def test_cancelled_waiter() -> None:
+    event = Event()
+
+    async def method(self: Any) -> int:
+        await event.wait()
+        return 42
+
+    wrapped = SingleFlight[Any]().wrap(method)
+    cancelled = create_task(wrapped(None))
+    waiter = create_task(wrapped(None))
+    await sleep(0.0)
+    cancelled.cancel()
+    with pytest.raises(CancelledError):
+        await cancelled
+    event.set()
+    assert await waiter == 42
+
+
+def test_sync_method() -> None:
+    def method(self: Any) -> None:
+        pass
+
+    with pytest.raises(TypeError):
+        SingleFlight[Any]().wrap(method)
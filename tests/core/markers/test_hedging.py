@@ -0,0 +1,85 @@
+from asyncio import sleep
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import pytest
+
+from combadge._helpers.latency import LatencyWindow
+from combadge.core.markers import hedging
+from combadge.core.markers.hedging import Hedged
+
+
+def _make_method(*delays: float) -> tuple[Callable[..., Coroutine[Any, Any, int]], list[str]]:
+    """Make a method which sleeps for the specified delays in the subsequent calls."""
+    events: list[str] = []
+
+    async def method(self: Any) -> int:
+        index = len([event for event in events if event == "call"])
+        events.append("call")
+        try:
+            await sleep(delays[index % len(delays)])
+        except BaseException:
+            events.append("cancelled")
+            raise
+        return index
+
+    return method, events
+
+
+async def test_not_hedged() -> None:
+    method, events = _make_method(0.0)
+    assert await Hedged[Any](delay=0.1).wrap(method)(None) == 0
+    assert events == ["call"]
+
+
+async def test_hedged() -> None:
+    method, events = _make_method(1.0, 0.0)
+    assert await Hedged[Any](delay=0.01).wrap(method)(None) == 1
+    await sleep(0.0)  # let the loser handle the cancellation
+    assert events == ["call", "call", "cancelled"]
+
+
+async def test_records_primary_latencies(monkeypatch: pytest.MonkeyPatch) -> None:
+    latencies = LatencyWindow(min_samples=1)
+    monkeypatch.setattr(hedging, "LatencyWindow", lambda: latencies)
+    method, _ = _make_method(0.0, 1.0, 0.0)
+    hedged_method = Hedged[Any](delay=0.05).wrap(method)
+
+    assert await hedged_method(None) == 0
+    assert await hedged_method(None) == 2  # the primary loses to the hedge
+    await sleep(0.0)  # let the loser handle the cancellation
+    assert len(latencies._latencies) == 2, "the hedge must not be recorded"
+    assert latencies._latencies[1] >= 0.05, "the lost primary must be recorded with the time it has taken"
+
+
+async def test_budget_exhausted() -> None:
+    method, events = _make_method(0.05)
+    hedged_method = Hedged[Any](delay=0.01, budget=0.0).wrap(method)
+    for _ in range(11):
+        await hedged_method(None)
+    # The first 10 calls use up the initial burst, and the 11th one is not hedged:
+    assert events[-1:] == ["call"]
+    assert events.count("call") == 21
+
+
+async def test_adaptive_delay_requires_samples() -> None:
+    method, events = _make_method(0.02)
+    assert await Hedged[Any]().wrap(method)(None) == 0
+    assert events == ["call"]
+
+
+async def test_primary_failure() -> None:
+    async def fail(self: Any) -> None:
+        await sleep(0.0)
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        await Hedged[Any](delay=0.01).wrap(fail)(None)
+
+
+def test_sync_method() -> None:
+    def method(self: Any) -> None:
+        pass
+
+    with pytest.raises(TypeError):
+        Hedged[Any]().wrap(method)
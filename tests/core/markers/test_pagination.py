@@ -0,0 +1,148 @@
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Literal, Protocol
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from pydantic import BaseModel
+from typing_extensions import assert_type
+
+from combadge.core.binder import bind
+from combadge.core.errors import BackendError
+from combadge.core.markers.pagination import (
+    CursorPagination,
+    LinkPagination,
+    OffsetPagination,
+    Paginated,
+    _find_next_link,
+    paginate_by_offset,
+)
+from combadge.core.markers.retrying import retry
+from combadge.core.response import ErrorResponse, SuccessfulResponse
+
+_ITEMS = list(range(10))
+
+
+class _Page(BaseModel):
+    items: list[int]
+    next_cursor: str | None = None
+    link: str | None = None
+
+
+def _get_page(self: Any, cursor: str | None = None, limit: int | None = None, offset: int = 0) -> _Page:
+    start = int(cursor or offset)
+    stop = start + (limit or 3)
+    return _Page(
+        items=_ITEMS[start:stop],
+        next_cursor=str(stop) if stop < len(_ITEMS) else None,
+        link=f'<https://example.com/items?offset={stop}&foo=bar>; rel="next"' if stop < len(_ITEMS) else None,
+    )
+
+
+async def _get_page_async(self: Any, cursor: str | None = None, limit: int | None = None, offset: int = 0) -> _Page:
+    return _get_page(self, cursor, limit, offset)
+
+
+_STRATEGIES = [
+    CursorPagination(parameter="cursor", next_cursor="next_cursor"),
+    OffsetPagination(page_size=4),
+    OffsetPagination(),
+    LinkPagination(),
+]
+
+
+@pytest.mark.parametrize("strategy", _STRATEGIES)
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_paginate(strategy: Any, prefetch: int) -> None:
+    method = Paginated[Any](strategy, prefetch=prefetch).wrap(_get_page)
+    assert list(method(None)) == _ITEMS
+
+
+@pytest.mark.parametrize("strategy", _STRATEGIES)
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+async def test_paginate_async(strategy: Any, prefetch: int) -> None:
+    method = Paginated[Any](strategy, prefetch=prefetch).wrap(_get_page_async)
+    assert [item async for item in method(None)] == _ITEMS
+
+
+def test_lazy() -> None:
+    calls = 0
+
+    def get_page(self: Any, cursor: str | None = None) -> _Page:
+        nonlocal calls
+        calls += 1
+        return _get_page(self, cursor)
+
+    iterator = Paginated[Any](CursorPagination(parameter="cursor", next_cursor="next_cursor")).wrap(get_page)(None)
+    assert calls == 0
+    assert next(iterator) == 0
+    iterator.close()
+    assert calls <= 2  # the first page, and possibly the prefetched one
+
+
+class _SupportsItems(Protocol):
+    @paginate_by_offset(page_size=3)
+    @retry(backoff=0.0)
+    async def get_items(self, offset: int = 0, limit: int | None = None) -> _Page: ...
+
+
+def _bind_flaky_method(signature: Any) -> Any:
+    failed_offsets: set[int] = set()
+
+    async def bound_method(self: Any, offset: int = 0, limit: int | None = None) -> _Page:
+        if offset not in failed_offsets:
+            failed_offsets.add(offset)
+            raise BackendError(httpx.ReadTimeout("failed"))
+        return _get_page(self, limit=limit, offset=offset)
+
+    return bound_method
+
+
+async def test_paginate_async_retried() -> None:
+    """The pagination wraps the retries, even though the retry decorator is applied first."""
+    service = bind(_SupportsItems, Mock(bind_method=_bind_flaky_method))
+    items = service.get_items()
+    assert_type(items, AsyncIterator[Any])
+    assert [item async for item in items] == _ITEMS
+
+
+async def test_map_paginated() -> None:
+    service: Any = bind(_SupportsItems, Mock(bind_method=_bind_flaky_method))
+    results = [result.unwrap() async for result in service.get_items.map([0, 5], ordered=True)]
+    assert results == [_ITEMS, _ITEMS[5:]]
+
+
+class _SuccessfulPage(_Page, SuccessfulResponse):
+    pass
+
+
+class _ErrorPage(ErrorResponse):
+    code: Literal["ERROR"] = "ERROR"
+
+
+def test_error_page() -> None:
+    pages: Iterator[_SuccessfulPage | _ErrorPage] = iter([_SuccessfulPage(items=[1, 2], next_cursor="2"), _ErrorPage()])
+
+    def get_page(self: Any, cursor: str | None = None) -> _SuccessfulPage | _ErrorPage:
+        return next(pages)
+
+    method = Paginated[Any](CursorPagination(parameter="cursor", next_cursor="next_cursor"), prefetch=0).wrap(get_page)
+    iterator = method(None)
+    assert [next(iterator), next(iterator)] == [1, 2]
+    with pytest.raises(_ErrorPage.Error):
+        next(iterator)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (
+            '<https://example.com/?page=2>; rel="next", <https://example.com/?page=9>; rel="last"',
+            "https://example.com/?page=2",
+        ),
+        ('<https://example.com/?page=9>; rel="last"', None),
+        ("<https://example.com/?page=2>; rel=next", "https://example.com/?page=2"),
+    ],
+)
+def test_find_next_link(header: str, expected: str | None) -> None:
+    assert _find_next_link(header) == expected
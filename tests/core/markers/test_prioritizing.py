@@ -0,0 +1,24 @@
+from typing import Any
+
+from combadge.core.concurrency import get_priority, use_priority
+from combadge.core.markers.prioritizing import Prioritized
+
+
+def test_default_priority() -> None:
+    method = Prioritized[Any](10).wrap(lambda self: get_priority())
+    assert method(None) == 10
+    assert get_priority() == 0
+
+
+async def test_call_priority_overrides() -> None:
+    async def method(self: Any) -> int:
+        return get_priority()
+
+    with use_priority(5):
+        assert await Prioritized[Any](10).wrap(method)(None) == 5
+
+
+def test_call_priority_zero_overrides() -> None:
+    with use_priority(0):
+        assert Prioritized[Any](10).wrap(lambda self: get_priority())(None) == 0
+    assert get_priority(default=7) == 7
@@ -0,0 +1,86 @@
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from combadge.core.markers.method import MethodMarker
+from combadge.core.markers.rate_limiting import RateLimited, rate_limit
+from combadge.core.rate_limit import BaseRateLimiter, TokenBucket
+
+
+class _FixedDelay(BaseRateLimiter):
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    def reserve(self) -> float:
+        return self.delay
+
+
+def test_no_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleep = Mock()
+    monkeypatch.setattr("combadge.core.markers.rate_limiting.sleep", sleep)
+    assert RateLimited[Any](_FixedDelay(0.0)).wrap(Mock(return_value=42))(None) == 42
+    sleep.assert_not_called()
+
+
+def test_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleep = Mock()
+    monkeypatch.setattr("combadge.core.markers.rate_limiting.sleep", sleep)
+    assert RateLimited[Any](_FixedDelay(0.5)).wrap(Mock(return_value=42))(None) == 42
+    sleep.assert_called_once_with(0.5)
+
+
+async def test_async_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleep = AsyncMock()
+    monkeypatch.setattr("combadge.core.markers.rate_limiting.async_sleep", sleep)
+    assert await RateLimited[Any](_FixedDelay(0.5)).wrap(AsyncMock(return_value=42))(None) == 42
+    sleep.assert_awaited_once_with(0.5)
+
+
+def test_per_method() -> None:
+    marker = RateLimited[Any](lambda: TokenBucket(1.0, burst=1.0))
+    method_a = marker.wrap(Mock())
+    method_b = marker.wrap(Mock())
+    method_a(None)
+    method_b(None)  # would sleep for a second if the limiter was shared
+
+
+def test_per_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleep = Mock()
+    monkeypatch.setattr("combadge.core.markers.rate_limiting.sleep", sleep)
+
+    class Backend:
+        pass
+
+    class Service:
+        __combadge_backend__ = Backend()
+
+    marker = RateLimited[Any](lambda: TokenBucket(1.0, burst=1.0), per_backend=True)
+    marker.wrap(Mock())(Service())
+    marker.wrap(Mock())(Service())
+    sleep.assert_called_once()
+
+
+def test_per_backend_different_rates(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleep = Mock()
+    monkeypatch.setattr("combadge.core.markers.rate_limiting.sleep", sleep)
+
+    class Backend:
+        pass
+
+    class Service:
+        __combadge_backend__ = Backend()
+
+    def wrap(decorator: Any) -> Any:
+        def method(self: Any) -> None:
+            pass
+
+        (marker,) = MethodMarker.ensure_markers(decorator(method))
+        return marker.wrap(Mock())
+
+    wrap(rate_limit(1.0, per_backend=True))(Service())
+    wrap(rate_limit(2.0, per_backend=True))(Service())
+    sleep.assert_not_called()  # the different rates do not share the limiter
+
+    wrap(rate_limit(1.0, per_backend=True))(Service())
+    sleep.assert_called_once()  # but the equal ones do
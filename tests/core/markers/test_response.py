@@ -1,6 +1,14 @@
-from typing import Any
+from abc import abstractmethod
+from collections.abc import Mapping
+from typing import Annotated, Any, Protocol
 
-from combadge.core.markers.response import Map, Mixin, ResponseMarker
+import httpx
+import pytest
+from pydantic import AliasChoices, BaseModel, Field, ValidationError, field_validator
+
+from combadge.core.markers.response import Columnar, Map, Mixin, ResponseMarker
+from combadge.support.http.markers import http_method, path
+from combadge.support.httpx.backends.sync import HttpxBackend
 
 
 def test_map() -> None:
@@ -21,3 +29,64 @@ def test_mixin() -> None:
         "inner2": "bar",
         "outer": "qux",
     }
+
+
+class _Record(BaseModel):
+    id: int
+    value: Annotated[float, Field(gt=0.0)]
+    label: str = Field(default="none", alias="Label")
+
+
+def test_columnar() -> None:
+    payload: list[Mapping[str, Any]] = [{"id": "1", "value": 1.5, "Label": "a"}, {"id": 2, "value": 2}]
+    assert Columnar(_Record)(..., payload) == {"id": [1, 2], "value": [1.5, 2.0], "label": ["a", "none"]}
+
+
+def test_columnar_validation() -> None:
+    with pytest.raises(ValidationError):
+        Columnar(_Record)(..., [{"id": 1, "value": -1.0}])
+    with pytest.raises(ValueError, match="misses"):
+        Columnar(_Record)(..., [{"id": 1}])
+
+
+class _ValidatedRecord(BaseModel):
+    id: int = Field(validation_alias=AliasChoices("id", "ID"))
+    tags: list[str] = Field(default_factory=list)
+
+    @field_validator("id")
+    @classmethod
+    def _double(cls, value: int) -> int:
+        return value * 2
+
+
+def test_columnar_falls_back_to_records() -> None:
+    columns = Columnar(_ValidatedRecord)(..., [{"ID": 1}, {"id": 2}])
+    assert columns["id"] == [2, 4]
+    assert columns["tags"] == [[], []]
+    assert columns["tags"][0] is not columns["tags"][1], "the default factory must be called per record"
+
+
+class _SupportsRecords(Protocol):
+    @http_method("GET")
+    @path("/records")
+    @abstractmethod
+    def get_records(self) -> Annotated[dict[str, list[Any]], Columnar(_Record)]:
+        raise NotImplementedError
+
+    @http_method("GET")
+    @path("/validated-records")
+    @abstractmethod
+    def get_validated_records(self) -> Annotated[dict[str, list[Any]], Columnar(_ValidatedRecord)]:
+        raise NotImplementedError
+
+
+def test_columnar_backend() -> None:
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/records":
+            return httpx.Response(200, json=[{"id": "1", "value": 1.5}, {"id": 2, "value": 2, "Label": "b"}])
+        return httpx.Response(200, json=[{"ID": 1, "tags": ["x"]}])
+
+    backend = HttpxBackend(httpx.Client(base_url="https://example.com", transport=httpx.MockTransport(handle)))
+    service = backend[_SupportsRecords]
+    assert service.get_records() == {"id": [1, 2], "value": [1.5, 2.0], "label": ["none", "b"]}
+    assert service.get_validated_records() == {"id": [2], "tags": [["x"]]}
@@ -0,0 +1,124 @@
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from combadge.core.errors import BackendError
+from combadge.core.markers.retrying import Retried
+
+
+def _make_status_error(status_code: int, headers: dict[str, str] | None = None) -> BackendError:
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return BackendError(httpx.HTTPStatusError("failed", request=request, response=response))
+
+
+def test_retried() -> None:
+    mock = Mock(side_effect=[BackendError(httpx.ReadTimeout("failed")), _make_status_error(503), 42])
+    assert Retried[Any](backoff=0.0).wrap(mock)(None) == 42
+    assert mock.call_count == 3
+
+
+def test_attempts_exhausted() -> None:
+    mock = Mock(side_effect=BackendError(httpx.ConnectError("failed")))
+    with pytest.raises(BackendError):
+        Retried[Any](attempts=2, backoff=0.0).wrap(mock)(None)
+    assert mock.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        _make_status_error(400),
+        BackendError(ValueError("not a transport error")),
+        ValueError("not a backend error"),
+    ],
+)
+def test_not_retryable(exception: Exception) -> None:
+    mock = Mock(side_effect=exception)
+    with pytest.raises(type(exception)):
+        Retried[Any](backoff=0.0).wrap(mock)(None)
+    assert mock.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("exception", "expected_call_count"),
+    [
+        (BackendError(httpx.ReadTimeout("failed")), 1),
+        (_make_status_error(503), 1),
+        (BackendError(httpx.ConnectError("failed")), 3),
+        (_make_status_error(429), 3),
+    ],
+)
+def test_non_idempotent(exception: Exception, expected_call_count: int) -> None:
+    mock = Mock(side_effect=exception)
+    with pytest.raises(BackendError):
+        Retried[Any](backoff=0.0, idempotent=False).wrap(mock)(None)
+    assert mock.call_count == expected_call_count
+
+
+def test_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleep = Mock()
+    monkeypatch.setattr("combadge.core.markers.retrying.sleep", sleep)
+    mock = Mock(side_effect=[_make_status_error(429, {"Retry-After": "2"}), 42])
+    assert Retried[Any](backoff=0.0).wrap(mock)(None) == 42
+    sleep.assert_called_once_with(2.0)
+
+
+def test_retry_after_too_long() -> None:
+    mock = Mock(side_effect=_make_status_error(503, {"Retry-After": "3600"}))
+    with pytest.raises(BackendError):
+        Retried[Any](backoff=0.0, max_backoff=10.0).wrap(mock)(None)
+    assert mock.call_count == 1
+
+
+def test_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleep = Mock()
+    monkeypatch.setattr("combadge.core.markers.retrying.sleep", sleep)
+    mock = Mock(side_effect=BackendError(httpx.ConnectError("failed")))
+    with pytest.raises(BackendError):
+        Retried[Any](attempts=5, backoff=1.0, max_backoff=3.0, jitter=False).wrap(mock)(None)
+    assert [call.args[0] for call in sleep.call_args_list] == [1.0, 2.0, 3.0, 3.0]
+
+
+def test_budget_shared_per_backend() -> None:
+    class Backend:
+        pass
+
+    class Service:
+        __combadge_backend__ = Backend()
+
+    mock = Mock(side_effect=BackendError(httpx.ConnectError("failed")))
+    method_a = Retried[Any](attempts=2, backoff=0.0, budget=0.0).wrap(mock)
+    method_b = Retried[Any](attempts=2, backoff=0.0, budget=0.0).wrap(mock)
+    for method in (method_a, method_b) * 6:
+        with pytest.raises(BackendError):
+            method(Service())
+    # The initial burst of 10 retries is shared by both methods, so the last 2 calls are not retried:
+    assert mock.call_count == 22
+
+
+def test_budget_per_backend_different_ratios() -> None:
+    class Backend:
+        pass
+
+    class Service:
+        __combadge_backend__ = Backend()
+
+    mock = Mock(side_effect=BackendError(httpx.ConnectError("failed")))
+    method_a = Retried[Any](attempts=2, backoff=0.0, budget=0.0).wrap(mock)
+    method_b = Retried[Any](attempts=2, backoff=0.0, budget=1.0).wrap(mock)
+    for _ in range(10):
+        with pytest.raises(BackendError):
+            method_a(Service())
+    with pytest.raises(BackendError):
+        method_b(Service())
+    # The first method has exhausted its own budget, but not the one of the second method:
+    assert mock.call_count == 22
+
+
+async def test_async_retried() -> None:
+    mock = AsyncMock(side_effect=[BackendError(httpx.ReadTimeout("failed")), 42])
+    assert await Retried[Any](backoff=0.0).wrap(mock)(None) == 42
+    assert mock.await_count == 2
@@ -0,0 +1,20 @@
+from typing import Any
+
+from combadge.core.deadline import get_remaining_time
+from combadge.core.markers.timeouts import TimeLimited
+
+
+def test_timeout() -> None:
+    remaining = TimeLimited[Any](1.0).wrap(lambda self: get_remaining_time())(None)
+    assert remaining is not None
+    assert 0.0 < remaining <= 1.0
+
+
+async def test_async_timeout() -> None:
+    async def method(self: Any) -> float | None:
+        return get_remaining_time()
+
+    remaining = await TimeLimited[Any](1.0).wrap(method)(None)
+    assert remaining is not None
+    assert 0.0 < remaining <= 1.0
+    assert get_remaining_time() is None
@@ -0,0 +1,186 @@
+from asyncio import sleep
+from collections.abc import AsyncIterator, Awaitable, Iterator
+from inspect import signature
+from typing import Any, Protocol
+from unittest.mock import Mock
+from weakref import ref
+
+import pytest
+from pydantic import BaseModel
+from typing_extensions import assert_type
+
+from combadge.core.binder import bind
+from combadge.core.bound_method import BoundMethod, ColumnarResults, MapResult, map_calls, map_columns
+
+
+class _SupportsDivision(Protocol):
+    def divide(self, dividend: int, divisor: int = 1) -> float: ...
+
+
+class _SupportsAsyncDivision(Protocol):
+    async def divide(self, dividend: int, divisor: int = 1) -> float: ...
+
+
+def _bind_method(signature: Any) -> Any:
+    def bound_method(self: Any, dividend: int, divisor: int = 1) -> float:
+        return dividend / divisor
+
+    return bound_method
+
+
+def _bind_async_method(signature: Any) -> Any:
+    async def bound_method(self: Any, dividend: int, divisor: int = 1) -> float:
+        await sleep(0.01 * dividend)
+        return dividend / divisor
+
+    return bound_method
+
+
+@pytest.fixture
+def service() -> Any:
+    return bind(_SupportsDivision, Mock(bind_method=_bind_method))
+
+
+@pytest.fixture
+def async_service() -> Any:
+    return bind(_SupportsAsyncDivision, Mock(bind_method=_bind_async_method))
+
+
+def test_bound_method(service: Any) -> None:
+    assert isinstance(service.divide, BoundMethod)
+    assert service.divide == service.divide
+    assert hash(service.divide) == hash(service.divide)
+    assert service.divide.__name__ == "divide"
+    assert service.divide(42, divisor=2) == 21.0
+
+
+def test_signature(service: Any) -> None:
+    assert str(signature(service.divide)) == "(dividend: int, divisor: int = 1) -> float"
+
+
+def test_no_reference_cycle() -> None:
+    service = bind(_SupportsDivision, Mock(bind_method=_bind_method))
+    assert service.divide(4, 2) == 2.0
+    reference = ref(service)
+    del service
+    assert reference() is None, "the service must be freed without the garbage collector"
+
+
+def test_map_calls() -> None:
+    service = bind(_SupportsDivision, Mock(bind_method=_bind_method))
+    results = map_calls(service.divide, [(4, 2), 5], ordered=True)
+    assert_type(results, Iterator[MapResult[float]])
+    assert [result.unwrap() for result in results] == [2.0, 5.0]
+
+    columnar_results = map_columns(service.divide, {"dividend": [4, 5]})
+    assert_type(columnar_results, ColumnarResults[float])
+    assert columnar_results.results == [4.0, 5.0]
+
+
+async def test_map_calls_async() -> None:
+    service = bind(_SupportsAsyncDivision, Mock(bind_method=_bind_async_method))
+    results = map_calls(service.divide, [(4, 2), 5], ordered=True)
+    assert_type(results, AsyncIterator[MapResult[float]])
+    assert [result.unwrap() async for result in results] == [2.0, 5.0]
+
+    columnar_results = map_columns(service.divide, {"dividend": [4, 5]})
+    assert_type(columnar_results, Awaitable[ColumnarResults[float]])
+    assert (await columnar_results).results == [4.0, 5.0]
+
+
+def test_map_ordered(service: Any) -> None:
+    results = list(service.divide.map([(4, 2), {"dividend": 9, "divisor": 3}, 5, (1, 0)], ordered=True))
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert [result.result for result in results[:3]] == [2.0, 3.0, 5.0]
+    assert isinstance(results[3].exception, ZeroDivisionError)
+    with pytest.raises(ZeroDivisionError):
+        results[3].unwrap()
+
+
+def test_map_unordered_is_lazy(service: Any) -> None:
+    def generate() -> Iterator[int]:
+        yield from range(1000)
+        raise AssertionError("should not be consumed")  # pragma: no cover
+
+    results = service.divide.map(generate(), concurrency=2)
+    assert {next(results).result for _ in range(10)} <= set(map(float, range(12)))
+    results.close()
+
+
+async def test_map_async(async_service: Any) -> None:
+    results = [result async for result in async_service.divide.map([5, 1, (3, 0)], concurrency=3)]
+    assert [result.index for result in results] == [1, 2, 0]  # as completed
+    assert results[0] == MapResult(1, 1, result=1.0)
+    assert isinstance(results[1].exception, ZeroDivisionError)
+
+
+async def test_map_async_ordered(async_service: Any) -> None:
+    results = [result.unwrap() async for result in async_service.divide.map([5, 1, 3], concurrency=2, ordered=True)]
+    assert results == [5.0, 1.0, 3.0]
+
+
+class _Frame:
+    """Mimics a Pandas data frame."""
+
+    columns = ("divisor", "dividend")
+
+    def to_dict(self, orient: str) -> dict[str, list[int]]:
+        assert orient == "list"
+        return {"divisor": [2, 0], "dividend": [4, 1]}
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [
+        {"dividend": [4, 1], "divisor": (2, 0)},
+        {"divisor": [2, 0], "dividend": [4, 1]},
+        _Frame(),
+    ],
+)
+def test_map_columns(service: Any, columns: Any) -> None:
+    results = service.divide.map_columns(columns)
+    assert results.results == [2.0, None]
+    assert results.exceptions[0] is None
+    assert isinstance(results.exceptions[1], ZeroDivisionError)
+
+
+async def test_map_columns_async(async_service: Any) -> None:
+    results = await async_service.divide.map_columns({"divisor": [1, 2, 3], "dividend": [3, 2, 1]})
+    assert results.results == [3.0, 1.0, 1 / 3]
+
+
+def test_map_columns_keywords(service: Any) -> None:
+    results = service.divide.map_columns({"divisor": [2], "dividend": [4]})
+    assert results.results == [2.0]
+    results = service.divide.map_columns({"divisor": [2, 4]})  # `dividend` is missing
+    assert all(isinstance(exception, TypeError) for exception in results.exceptions)
+
+
+def test_map_columns_keyword_only() -> None:
+    class SupportsKeywordOnly(Protocol):
+        def get(self, *, code: str) -> str: ...
+
+    def bind_method(signature: Any) -> Any:
+        def bound_method(self: Any, *, code: str) -> str:
+            return code.lower()
+
+        return bound_method
+
+    service: Any = bind(SupportsKeywordOnly, Mock(bind_method=bind_method))
+    results = service.get.map_columns({"code": ["NL", "BE"]})
+    assert results.exceptions == [None, None]
+    assert results.results == ["nl", "be"]
+
+
+def test_map_columns_length_mismatch(service: Any) -> None:
+    with pytest.raises(ValueError, match="same length"):
+        service.divide.map_columns({"dividend": [1, 2], "divisor": [1]})
+
+
+def test_to_columns() -> None:
+    class Model(BaseModel):
+        a: int
+        b: str
+
+    results = ColumnarResults([Model(a=1, b="x"), None], [None, ValueError()])
+    assert results.to_columns() == {"a": [1, None], "b": ["x", None]}
@@ -0,0 +1,82 @@
+from multiprocessing import get_context
+from pathlib import Path
+from time import time
+
+from pydantic import BaseModel
+
+from combadge._helpers.pydantic import get_type_adapter
+from combadge.core.cache import CacheEntry, MemoryCache, SqliteCache
+
+
+class _Model(BaseModel):
+    value: int
+
+
+_ADAPTER = get_type_adapter(int)
+_MODEL_ADAPTER = get_type_adapter(_Model)
+
+
+def test_memory_cache_lru() -> None:
+    cache = MemoryCache(maxsize=2)
+    entry = CacheEntry(42, time() + 60.0, time() + 60.0)
+    cache.set("a", entry, _ADAPTER)
+    cache.set("b", entry, _ADAPTER)
+    assert cache.get("a", _ADAPTER) is entry  # refreshes `a`
+    cache.set("c", entry, _ADAPTER)  # evicts `b`
+    assert cache.get("b", _ADAPTER) is None
+    assert cache.get("a", _ADAPTER) is entry
+    assert cache.get("c", _ADAPTER) is entry
+
+
+def test_memory_cache_expired() -> None:
+    cache = MemoryCache()
+    cache.set("a", CacheEntry(42, 0.0, 0.0), _ADAPTER)
+    assert cache.get("a", _ADAPTER) is None
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_shared(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    entry = CacheEntry(_Model(value=42), time() + 60.0, time() + 60.0)
+    SqliteCache(path).set("a", entry, _MODEL_ADAPTER)
+    assert SqliteCache(path).get("a", _MODEL_ADAPTER) == entry  # another «process»
+
+
+def test_sqlite_cache_expired(tmp_path: Path) -> None:
+    cache = SqliteCache(tmp_path / "cache.db")
+    cache.set("a", CacheEntry(_Model(value=42), 0.0, 0.0), _MODEL_ADAPTER)
+    assert cache.get("a", _MODEL_ADAPTER) is None
+
+
+def test_sqlite_cache_maxsize(tmp_path: Path) -> None:
+    cache = SqliteCache(tmp_path / "cache.db", maxsize=1)
+    entry = CacheEntry(_Model(value=42), time() + 60.0, time() + 60.0)
+    cache.set("a", entry, _MODEL_ADAPTER)
+    cache.set("b", entry, _MODEL_ADAPTER)
+    assert cache.get("a", _MODEL_ADAPTER) is None
+    assert cache.get("b", _MODEL_ADAPTER) == entry
+
+
+def test_sqlite_cache_invalid(tmp_path: Path) -> None:
+    cache = SqliteCache(tmp_path / "cache.db")
+    cache.set("a", CacheEntry(42, time() + 60.0, time() + 60.0), get_type_adapter(int))
+    assert cache.get("a", _MODEL_ADAPTER) is None
+
+
+def test_sqlite_cache_forked(tmp_path: Path) -> None:
+    cache = SqliteCache(tmp_path / "cache.db")
+    entry = CacheEntry(_Model(value=42), time() + 60.0, time() + 60.0)
+    cache.set("a", entry, _MODEL_ADAPTER)
+    parent_connection = cache._database.connect()
+
+    def child() -> None:
+        assert cache._database.connect() is not parent_connection
+        assert cache.get("a", _MODEL_ADAPTER) == entry
+        cache.set("b", entry, _MODEL_ADAPTER)
+
+    process = get_context("fork").Process(target=child)
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+    assert cache._database.connect() is parent_connection
+    assert cache.get("b", _MODEL_ADAPTER) == entry
@@ -0,0 +1,103 @@
+from asyncio import CancelledError
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from combadge.core.circuit_breaker import CircuitBreaker, CircuitState
+from combadge.core.errors import BackendError, CircuitOpenError
+
+
+def _make_status_error(status_code: int) -> BackendError:
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(status_code, request=request)
+    return BackendError(httpx.HTTPStatusError("failed", request=request, response=response))
+
+
+def _fail(breaker: CircuitBreaker, exception: BaseException) -> None:
+    breaker.after_call(breaker.before_call(), exception)
+
+
+def test_opens() -> None:
+    on_state_change = Mock()
+    breaker = CircuitBreaker(2, on_state_change=on_state_change)
+    _fail(breaker, BackendError(httpx.ConnectError("failed")))
+    assert breaker.state is CircuitState.CLOSED
+    _fail(breaker, _make_status_error(503))
+    assert breaker.state is CircuitState.OPEN
+    on_state_change.assert_called_once_with(CircuitState.CLOSED, CircuitState.OPEN)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [_make_status_error(404), BackendError(ValueError()), ValueError()],
+)
+def test_not_failure(exception: BaseException) -> None:
+    breaker = CircuitBreaker(1)
+    _fail(breaker, exception)
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_success_resets_failures() -> None:
+    breaker = CircuitBreaker(2)
+    _fail(breaker, _make_status_error(500))
+    breaker.after_call(breaker.before_call(), None)
+    assert breaker.failures == 0
+
+
+def test_cancellation_keeps_failures() -> None:
+    breaker = CircuitBreaker(2)
+    _fail(breaker, _make_status_error(500))
+    _fail(breaker, CancelledError())
+    assert breaker.failures == 1
+    _fail(breaker, _make_status_error(500))
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_half_open_cancellation() -> None:
+    breaker = CircuitBreaker(1, recovery_timeout=0.0, half_open_probes=1)
+    _fail(breaker, _make_status_error(500))
+    _fail(breaker, CancelledError())
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.failures == 1
+    breaker.before_call()  # the cancelled probe has freed its slot
+
+
+def test_half_open_success() -> None:
+    breaker = CircuitBreaker(1, recovery_timeout=0.0, half_open_probes=1)
+    _fail(breaker, _make_status_error(500))
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    token = breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # only a single probe is allowed
+    breaker.after_call(token, None)
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_failure() -> None:
+    breaker = CircuitBreaker(5, recovery_timeout=0.0)
+    for _ in range(5):
+        _fail(breaker, _make_status_error(500))
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker._recovery_timeout = 60.0
+    _fail(breaker, _make_status_error(500))
+    assert breaker.state is CircuitState.OPEN, "a single failed probe should open the breaker"
+
+
+def test_stale_call_ignored() -> None:
+    breaker = CircuitBreaker(1, recovery_timeout=0.0, half_open_probes=1)
+    stale_token = breaker.before_call()  # admitted while closed
+    _fail(breaker, _make_status_error(500))
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    probe_token = breaker.before_call()
+    breaker.after_call(stale_token, None)
+    assert breaker.state is CircuitState.HALF_OPEN, "a call admitted while closed must not close the breaker"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # nor free the probe slot
+
+    breaker.after_call(probe_token, None)
+    assert breaker.state is CircuitState.CLOSED
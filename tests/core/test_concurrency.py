@@ -0,0 +1,171 @@
+from asyncio import CancelledError, create_task, sleep
+
+import httpx
+import pytest
+
+from combadge.core.concurrency import AimdLimit, BaseLimit, ConcurrencyLimiter, GradientLimit, use_priority
+from combadge.core.errors import BackendError, LimitExceededError
+
+
+class _FixedLimit(BaseLimit):
+    def __init__(self, limit: int) -> None:
+        self._fixed_limit = limit
+        self.updates: list[bool] = []
+
+    @property
+    def limit(self) -> int:
+        return self._fixed_limit
+
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:
+        self.updates.append(dropped)
+
+
+def test_aimd_limit() -> None:
+    limit = AimdLimit(10, min_limit=5, max_limit=11, backoff_ratio=0.5)
+    limit.update(0.1, in_flight=1, dropped=False)
+    assert limit.limit == 10, "the limit is not used, and should not grow"
+    limit.update(0.1, in_flight=10, dropped=False)
+    limit.update(0.1, in_flight=10, dropped=False)
+    assert limit.limit == 11
+    limit.update(0.1, in_flight=10, dropped=True)
+    assert limit.limit == 5
+
+
+def test_aimd_latency_threshold() -> None:
+    limit = AimdLimit(10, backoff_ratio=0.5, latency_threshold=1.0)
+    limit.update(2.0, in_flight=10, dropped=False)
+    assert limit.limit == 5
+
+
+def test_gradient_limit() -> None:
+    limit = GradientLimit(20, smoothing=1.0, tolerance=1.0)
+    for _ in range(10):
+        limit.update(0.1, in_flight=20, dropped=False)
+    assert limit.limit > 20, "stable latency should grow the limit"
+
+    grown_limit = limit.limit
+    for _ in range(10):
+        limit.update(1.0, in_flight=grown_limit, dropped=False)
+    assert limit.limit < grown_limit, "latency growth should shrink the limit"
+
+
+async def test_queueing() -> None:
+    limiter = ConcurrencyLimiter(_FixedLimit(1))
+    events: list[str] = []
+
+    async def call(name: str) -> None:
+        async with limiter.acquire():
+            events.append(f"{name} started")
+            await sleep(0.01)
+            events.append(f"{name} finished")
+
+    tasks = [create_task(call("a")), create_task(call("b"))]
+    await sleep(0.0)
+    assert (limiter.in_flight, limiter.queue_depth) == (1, 1)
+    for task in tasks:
+        await task
+    assert events == ["a started", "a finished", "b started", "b finished"]
+    assert (limiter.in_flight, limiter.queue_depth) == (0, 0)
+
+
+async def test_max_queue_size() -> None:
+    limiter = ConcurrencyLimiter(_FixedLimit(1), max_queue_size=0)
+    async with limiter.acquire():
+        with pytest.raises(LimitExceededError):
+            async with limiter.acquire():
+                pass
+
+
+async def test_max_wait() -> None:
+    limiter = ConcurrencyLimiter(_FixedLimit(1), max_wait=0.01)
+    async with limiter.acquire():
+        with pytest.raises(LimitExceededError):
+            async with limiter.acquire():
+                pass
+    assert (limiter.in_flight, limiter.queue_depth) == (0, 0)
+
+
+async def test_cancelled_waiter() -> None:
+    limiter = ConcurrencyLimiter(_FixedLimit(1))
+
+    async def call() -> None:
+        async with limiter.acquire():
+            await sleep(0.01)
+
+    async with limiter.acquire():
+        task = create_task(call())
+        await sleep(0.0)
+        task.cancel()
+        await sleep(0.0)
+        assert limiter.queue_depth == 0
+    async with limiter.acquire():
+        assert limiter.in_flight == 1
+
+
+@pytest.mark.parametrize(
+    ("exception", "expected_dropped"),
+    [
+        (BackendError(httpx.ReadTimeout("timed out")), True),
+        (ValueError(), False),
+    ],
+)
+async def test_dropped(exception: Exception, expected_dropped: bool) -> None:
+    limit = _FixedLimit(1)
+    with pytest.raises(type(exception)):
+        async with ConcurrencyLimiter(limit).acquire():
+            raise exception
+    assert limit.updates == [expected_dropped]
+
+
+async def test_cancelled_call_not_sampled() -> None:
+    limit = _FixedLimit(1)
+    limiter = ConcurrencyLimiter(limit)
+
+    async def call() -> None:
+        async with limiter.acquire():
+            await sleep(1.0)
+
+    task = create_task(call())
+    await sleep(0.0)
+    task.cancel()
+    with pytest.raises(CancelledError):
+        await task
+    assert limit.updates == [], "the cancelled call must not update the limit"
+    assert limiter._latency is None, "the cancelled call must not update the latency"
+    assert limiter.in_flight == 0
+
+
+async def test_priority() -> None:
+    limiter = ConcurrencyLimiter(_FixedLimit(1), priority_aging=1.0)
+    admitted: list[int] = []
+
+    async def call(priority: int) -> None:
+        with use_priority(priority):
+            async with limiter.acquire():
+                admitted.append(priority)
+
+    async with limiter.acquire():
+        tasks = [create_task(call(priority)) for priority in (0, 10, 5)]
+        await sleep(0.0)
+    for task in tasks:
+        await task
+    assert admitted == [10, 5, 0]
+
+
+async def test_priority_aging() -> None:
+    limiter = ConcurrencyLimiter(_FixedLimit(1), priority_aging=0.001)
+    admitted: list[int] = []
+
+    async def call(priority: int) -> None:
+        with use_priority(priority):
+            async with limiter.acquire():
+                admitted.append(priority)
+
+    async with limiter.acquire():
+        low_priority_task = create_task(call(0))
+        await sleep(0.05)  # worth 50 priority levels
+        high_priority_task = create_task(call(10))
+        await sleep(0.0)
+    await low_priority_task
+    await high_priority_task
+    assert admitted == [0, 10]
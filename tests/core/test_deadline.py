@@ -0,0 +1,80 @@
+from time import sleep
+from typing import Any, Protocol
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from combadge.core.binder import bind
+from combadge.core.deadline import deadline, get_remaining_time
+from combadge.core.errors import DeadlineExceededError
+from combadge.core.markers.pagination import OffsetPagination, Paginated
+
+
+def test_no_deadline() -> None:
+    assert get_remaining_time() is None
+
+
+def test_remaining_time() -> None:
+    with deadline(10.0):
+        remaining = get_remaining_time()
+        assert remaining is not None
+        assert 9.0 < remaining <= 10.0
+    assert get_remaining_time() is None
+
+
+def test_nested_deadline_cannot_extend() -> None:
+    with deadline(1.0), deadline(10.0):
+        remaining = get_remaining_time()
+        assert remaining is not None
+        assert remaining <= 1.0
+
+
+def test_exceeded() -> None:
+    with deadline(0.001):
+        sleep(0.002)
+        with pytest.raises(DeadlineExceededError):
+            get_remaining_time()
+
+
+class _Page(BaseModel):
+    items: list[float]
+
+
+class _SupportsRemainingTime(Protocol):
+    def get_remaining_time(self, index: int) -> float | None: ...
+
+
+def _bind_method(signature: Any) -> Any:
+    def bound_method(self: Any, index: int) -> float | None:
+        return get_remaining_time()
+
+    return bound_method
+
+
+def test_map_propagates_deadline() -> None:
+    service: Any = bind(_SupportsRemainingTime, Mock(bind_method=_bind_method))
+    with deadline(10.0):
+        results = list(service.get_remaining_time.map(range(3)))
+    assert all(result.unwrap() is not None for result in results)
+
+    with deadline(0.001):
+        sleep(0.002)
+        results = list(service.get_remaining_time.map(range(3)))
+    assert all(isinstance(result.exception, DeadlineExceededError) for result in results)
+
+
+def test_paginated_propagates_deadline() -> None:
+    def get_page(self: Any, offset: int = 0, limit: int | None = None) -> _Page:
+        remaining = get_remaining_time()
+        assert remaining is not None
+        return _Page(items=[remaining] if offset == 0 else [])
+
+    method = Paginated[Any](OffsetPagination(page_size=1)).wrap(get_page)
+    with deadline(10.0):
+        assert len(list(method(None))) == 1
+
+    with deadline(0.001):
+        sleep(0.002)
+        with pytest.raises(DeadlineExceededError):
+            list(method(None))
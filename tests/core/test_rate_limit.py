@@ -0,0 +1,52 @@
+from fcntl import LOCK_EX, LOCK_UN, flock
+from multiprocessing import get_context
+from pathlib import Path
+
+import pytest
+
+from combadge.core.rate_limit import SharedTokenBucket, TokenBucket
+
+
+def test_token_bucket() -> None:
+    limiter = TokenBucket(10.0, burst=2.0)
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+    assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+@pytest.mark.parametrize(("rate", "burst"), [(0.0, None), (1.0, 0.5)])
+def test_invalid(rate: float, burst: float | None) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        TokenBucket(rate, burst=burst)
+
+
+def test_shared_token_bucket(tmp_path: Path) -> None:
+    path = tmp_path / "rate"
+    limiter_1 = SharedTokenBucket(path, 10.0, burst=1.0)
+    limiter_2 = SharedTokenBucket(path, 10.0, burst=1.0)
+    try:
+        assert limiter_1.reserve() == 0.0
+        # The other limiter sees the reservation:
+        assert limiter_2.reserve() == pytest.approx(0.1, abs=0.01)
+        assert limiter_1.reserve() == pytest.approx(0.2, abs=0.01)
+    finally:
+        limiter_1.close()
+        limiter_2.close()
+
+
+def test_shared_token_bucket_forked(tmp_path: Path) -> None:
+    limiter = SharedTokenBucket(tmp_path / "rate", 1000.0)
+    limiter.reserve()  # opens the state file in the parent process
+
+    flock(limiter._fd, LOCK_EX)  # pretend the parent is in the middle of a reservation
+    child = get_context("fork").Process(target=limiter.reserve)
+    child.start()
+    try:
+        child.join(0.5)
+        assert child.is_alive(), "the child must wait for the parent to release the lock"
+    finally:
+        flock(limiter._fd, LOCK_UN)
+    child.join(5.0)
+    assert child.exitcode == 0
+    limiter.close()
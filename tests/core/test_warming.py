@@ -0,0 +1,95 @@
+from asyncio import sleep as async_sleep
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from threading import Lock
+from time import sleep
+
+import pytest
+
+from combadge.core.warming import AsyncConnectionWarmer, ConnectionWarmer, warm_up, warm_up_async
+
+
+class _Pool:
+    def __init__(self, *, fail_every: int = 0) -> None:
+        self.n_opened = 0
+        self.n_held = 0
+        self.max_held = 0
+        self._fail_every = fail_every
+        self._lock = Lock()
+
+    def _acquire(self) -> None:
+        with self._lock:
+            self.n_opened += 1
+            if self._fail_every and self.n_opened % self._fail_every == 0:
+                raise ConnectionError
+            self.n_held += 1
+            self.max_held = max(self.max_held, self.n_held)
+
+    def _release(self) -> None:
+        with self._lock:
+            self.n_held -= 1
+
+    @contextmanager
+    def open(self) -> Iterator[None]:
+        self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def open_async(self) -> AsyncIterator[None]:
+        self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+
+def test_warm_up() -> None:
+    pool = _Pool()
+    assert warm_up(pool.open, 5) == 5
+    assert pool.max_held == 5
+    assert pool.n_held == 0
+
+
+def test_warm_up_failures() -> None:
+    pool = _Pool(fail_every=2)
+    assert warm_up(pool.open, 4) == 2
+    assert pool.n_held == 0
+
+
+def test_warm_up_failures_logged(caplog: pytest.LogCaptureFixture) -> None:
+    warm_up(_Pool(fail_every=2).open, 4)
+    assert "Failed to open 2 of 4 connections" in caplog.text
+
+
+def test_warm_up_nothing() -> None:
+    assert warm_up(_Pool().open, 0) == 0
+
+
+async def test_warm_up_async() -> None:
+    pool = _Pool(fail_every=3)
+    assert await warm_up_async(pool.open_async, 6) == 4
+    assert pool.max_held == 4
+    assert pool.n_held == 0
+
+
+def test_connection_warmer() -> None:
+    pool = _Pool()
+    with ConnectionWarmer(lambda: warm_up(pool.open, 2), interval=0.01):
+        sleep(0.1)
+    n_opened = pool.n_opened
+    assert n_opened >= 4
+    sleep(0.05)
+    assert pool.n_opened == n_opened, "the warmer must have stopped"
+
+
+async def test_async_connection_warmer() -> None:
+    pool = _Pool()
+    async with AsyncConnectionWarmer(lambda: warm_up_async(pool.open_async, 2), interval=0.01):
+        await async_sleep(0.1)
+    n_opened = pool.n_opened
+    assert n_opened >= 4
+    await async_sleep(0.05)
+    assert pool.n_opened == n_opened, "the warmer must have stopped"
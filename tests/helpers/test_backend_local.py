@@ -0,0 +1,25 @@
+from combadge._helpers.backend_local import BackendLocal
+
+
+class _Backend:
+    pass
+
+
+class _Service:
+    def __init__(self, backend: _Backend) -> None:
+        self.__combadge_backend__ = backend
+
+
+def test_shared_per_backend() -> None:
+    local: BackendLocal[object] = BackendLocal()
+    backend = _Backend()
+    first = object()
+    assert local.get(_Service(backend), first) is first
+    assert local.get(_Service(backend), object()) is first
+    assert local.get(_Service(_Backend()), object()) is not first
+
+
+def test_unbound() -> None:
+    local: BackendLocal[object] = BackendLocal()
+    default = object()
+    assert local.get(None, default) is default
@@ -0,0 +1,20 @@
+from combadge._helpers.budget import Budget
+
+
+def test_budget() -> None:
+    budget = Budget(0.5, burst=1.0)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+def test_burst() -> None:
+    budget = Budget(1.0, burst=2.0)
+    for _ in range(10):
+        budget.deposit()
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
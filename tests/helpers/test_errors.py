@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from zeep.exceptions import TransportError
+
+from combadge._helpers.errors import get_retry_after, get_status_code, is_connect_error, is_transport_error
+
+
+def _make_status_error(status_code: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("failed", request=request, response=response)
+
+
+def test_get_status_code() -> None:
+    assert get_status_code(_make_status_error(503)) == 503
+    assert get_status_code(TransportError(status_code=502)) == 502
+    assert get_status_code(ValueError()) is None
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({}, None),
+        ({"Retry-After": "2.5"}, 2.5),
+        ({"Retry-After": "-1"}, 0.0),
+        ({"Retry-After": "soon"}, None),
+        ({"Retry-After": format_datetime(datetime.now(timezone.utc) - timedelta(hours=1), usegmt=True)}, 0.0),
+    ],
+)
+def test_get_retry_after(headers: dict[str, str], expected: float | None) -> None:
+    assert get_retry_after(_make_status_error(429, headers)) == expected
+
+
+def test_get_retry_after_date() -> None:
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+    retry_after = get_retry_after(_make_status_error(503, {"Retry-After": format_datetime(retry_at, usegmt=True)}))
+    assert retry_after is not None
+    assert 50.0 < retry_after <= 60.0
+
+
+@pytest.mark.parametrize(
+    ("exception", "is_transport", "is_connect"),
+    [
+        (httpx.ConnectError("failed"), True, True),
+        (httpx.PoolTimeout("failed"), True, True),
+        (httpx.ReadTimeout("failed"), True, False),
+        (httpx.RemoteProtocolError("failed"), True, False),
+        (httpx.UnsupportedProtocol("failed"), False, False),
+        (ConnectionRefusedError(), True, True),
+        (ConnectionResetError(), True, False),
+        (ValueError(), False, False),
+    ],
+)
+def test_classify(exception: BaseException, is_transport: bool, is_connect: bool) -> None:
+    assert is_transport_error(exception) == is_transport
+    assert is_connect_error(exception) == is_connect
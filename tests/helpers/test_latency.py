@@ -0,0 +1,21 @@
+from combadge._helpers.latency import LatencyWindow
+
+
+def test_percentile() -> None:
+    window = LatencyWindow(100, min_samples=10)
+    for latency in range(9):
+        window.add(float(latency))
+    assert window.percentile(0.5) is None
+
+    for latency in range(9, 100):
+        window.add(float(latency))
+    assert window.percentile(0.5) == 49.0
+    assert window.percentile(0.95) == 94.0
+    assert window.percentile(1.0) == 99.0
+
+
+def test_sliding() -> None:
+    window = LatencyWindow(10, min_samples=1)
+    for latency in range(100):
+        window.add(float(latency))
+    assert window.percentile(0.1) == 90.0
@@ -0,0 +1,102 @@
+from abc import abstractmethod
+from typing import Protocol
+
+import httpx
+import pytest
+
+from combadge.core.concurrency import AimdLimit, ConcurrencyLimiter, FixedLimit
+from combadge.core.deadline import deadline
+from combadge.core.errors import DeadlineExceededError, LimitExceededError
+from combadge.core.response import SuccessfulResponse
+from combadge.support.http.markers import http_method, path
+from combadge.support.httpx.backends.async_ import HttpxBackend
+from combadge.support.httpx.backends.sync import HttpxBackend as SyncHttpxBackend
+
+
+class _Response(SuccessfulResponse):
+    pass
+
+
+class _SupportsService(Protocol):
+    @http_method("GET")
+    @path("/")
+    @abstractmethod
+    async def get(self) -> _Response:
+        raise NotImplementedError
+
+
+async def test_concurrency_limiter() -> None:
+    limiter = ConcurrencyLimiter(AimdLimit(2, backoff_ratio=0.5))
+    backend = HttpxBackend(
+        httpx.AsyncClient(base_url="https://example.com", transport=httpx.MockTransport(lambda _: httpx.Response(503))),
+        raise_for_status=False,
+        concurrency_limiter=limiter,
+    )
+    await backend[_SupportsService].get()
+    assert limiter.limit == 1, "503 should shrink the limit"
+    assert limiter.in_flight == 0
+
+
+async def test_concurrency_limit_exceeded() -> None:
+    limiter = ConcurrencyLimiter(FixedLimit(1), max_queue_size=0)
+    backend = HttpxBackend(
+        httpx.AsyncClient(base_url="https://example.com", transport=httpx.MockTransport(lambda _: httpx.Response(200))),
+        concurrency_limiter=limiter,
+    )
+    async with limiter.acquire():
+        with pytest.raises(LimitExceededError):  # not wrapped into `BackendError`
+            await backend[_SupportsService].get()
+
+
+async def test_deadline() -> None:
+    timeouts: list[dict[str, float | None]] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+    backend = HttpxBackend(
+        httpx.AsyncClient(base_url="https://example.com", transport=httpx.MockTransport(handle), timeout=5.0),
+    )
+    await backend[_SupportsService].get()
+    assert timeouts[-1]["read"] == 5.0
+
+    with deadline(1.0):
+        await backend[_SupportsService].get()
+    read_timeout = timeouts[-1]["read"]
+    assert read_timeout is not None
+    assert 0.0 < read_timeout <= 1.0
+
+    with deadline(0.0), pytest.raises(DeadlineExceededError):
+        await backend[_SupportsService].get()
+
+
+async def test_warm_connections() -> None:
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    backend = HttpxBackend(httpx.AsyncClient(base_url="https://example.com/api", transport=httpx.MockTransport(handle)))
+    assert await backend.warm_connections(3) == 3
+    assert [(request.method, request.url) for request in requests] == [("HEAD", "https://example.com/api/")] * 3
+
+    assert await backend.warm_connections(1, url="health") == 1
+    assert requests[-1].url == "https://example.com/api/health"
+
+
+def test_warm_connections_sync() -> None:
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200)
+
+    backend = SyncHttpxBackend(httpx.Client(base_url="https://example.com", transport=httpx.MockTransport(handle)))
+    assert backend.warm_connections(2) == 2
+    assert backend.warm_connections(2, url="/down") == 0
+
+
+def test_warm_connections_no_base_url() -> None:
+    with pytest.raises(ValueError, match="no base URL"):
+        SyncHttpxBackend(httpx.Client()).warm_connections(1)
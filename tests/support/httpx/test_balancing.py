@@ -0,0 +1,216 @@
+from asyncio import CancelledError, create_task, sleep
+from collections import Counter
+from collections.abc import AsyncIterator
+from os import utime
+from pathlib import Path
+
+import httpx
+import pytest
+
+from combadge.support.httpx.balancing import (
+    AsyncLoadBalancingTransport,
+    ConsistentHash,
+    LeastOutstanding,
+    LoadBalancer,
+    LoadBalancingTransport,
+    PowerOfTwoChoices,
+    Replica,
+    RoundRobin,
+)
+
+
+def _echo_host(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, text=f"{request.url.host}:{request.url.port} {request.headers['Host']}")
+
+
+def _request(path: str = "/") -> httpx.Request:
+    return httpx.Request("GET", f"http://service{path}")
+
+
+def test_round_robin() -> None:
+    transport = LoadBalancingTransport(
+        LoadBalancer(["http://a:8080", "http://b:8081"], policy=RoundRobin()),
+        httpx.MockTransport(_echo_host),
+    )
+    with httpx.Client(base_url="http://service", transport=transport) as client:
+        assert [client.get("/").text for _ in range(3)] == ["a:8080 service", "b:8081 service", "a:8080 service"]
+
+
+def test_keeps_host_and_server_name() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[str(request.url), request.headers["Host"], request.extensions["sni_hostname"]])
+
+    transport = LoadBalancingTransport(LoadBalancer(["https://10.0.0.1:8443"]), httpx.MockTransport(handler))
+    with httpx.Client(base_url="https://my-service.example.com", transport=transport) as client:
+        assert client.get("/items").json() == [
+            "https://10.0.0.1:8443/items",
+            "my-service.example.com",
+            "my-service.example.com",
+        ]
+
+
+def test_outstanding_until_response_closed() -> None:
+    balancer = LoadBalancer(["http://a"])
+    (replica,) = balancer.replicas
+    transport = LoadBalancingTransport(
+        balancer,
+        httpx.MockTransport(lambda _: httpx.Response(200, content=iter([b"body"]))),
+    )
+    with httpx.Client(transport=transport) as client, client.stream("GET", "http://service/") as response:
+        assert replica.outstanding == 1
+        assert response.read() == b"body"
+        assert replica.outstanding == 0
+    assert replica.outstanding == 0  # closing after the body has been read must not release the replica again
+
+
+async def test_outstanding_until_response_closed_async() -> None:
+    async def stream() -> AsyncIterator[bytes]:
+        yield b"body"
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=stream())
+
+    balancer = LoadBalancer(["http://a"])
+    (replica,) = balancer.replicas
+    async with (
+        httpx.AsyncClient(transport=AsyncLoadBalancingTransport(balancer, httpx.MockTransport(handler))) as client,
+        client.stream("GET", "http://service/") as response,
+    ):
+        assert replica.outstanding == 1
+        assert await response.aread() == b"body"
+    assert replica.outstanding == 0
+
+
+def test_least_outstanding() -> None:
+    replicas = [Replica(httpx.URL("http://a"), outstanding=2), Replica(httpx.URL("http://b"), outstanding=1)]
+    assert LeastOutstanding().choose(replicas, _request()) is replicas[1]
+
+
+def test_power_of_two_choices() -> None:
+    replicas = [Replica(httpx.URL("http://a"), outstanding=1), Replica(httpx.URL("http://b"))]
+    assert PowerOfTwoChoices().choose(replicas, _request()) is replicas[1]
+    assert PowerOfTwoChoices().choose(replicas[:1], _request()) is replicas[0]
+
+
+def test_consistent_hash() -> None:
+    policy = ConsistentHash()
+    replicas = [Replica(httpx.URL(f"http://replica-{i}")) for i in range(4)]
+    paths = [f"/items/{i}" for i in range(200)]
+    routes = {path: policy.choose(replicas, _request(path)) for path in paths}
+
+    # The same key always goes to the same replica:
+    assert all(policy.choose(replicas, _request(path)) is routes[path] for path in paths)
+    assert len(set(routes.values())) == 4
+
+    # Only the keys of the removed replica move:
+    moved = [path for path in paths if policy.choose(replicas[:3], _request(path)) is not routes[path]]
+    assert all(routes[path] is replicas[3] for path in moved)
+
+
+def test_ejection() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503 if request.url.host == "bad" else 200)
+
+    balancer = LoadBalancer(["http://bad", "http://good"], failure_threshold=2, ejection_time=60.0)
+    with httpx.Client(transport=LoadBalancingTransport(balancer, httpx.MockTransport(handler))) as client:
+        statuses = Counter(client.get("http://service/").status_code for _ in range(10))
+    assert statuses == {503: 2, 200: 8}
+    assert balancer.replicas[0].ejected_until > 0.0
+    assert all(replica.outstanding == 0 for replica in balancer.replicas)
+
+
+def test_all_ejected() -> None:
+    balancer = LoadBalancer(["http://a"], failure_threshold=1)
+    (replica,) = balancer.replicas
+    balancer.release(balancer.acquire(_request()), failed=True)
+    assert replica.ejected_until > 0.0
+    assert balancer.acquire(_request()) is replica
+
+
+def test_exception_counts_as_failure() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    balancer = LoadBalancer(["http://a"], failure_threshold=2)
+    with (
+        httpx.Client(transport=LoadBalancingTransport(balancer, httpx.MockTransport(handler))) as client,
+        pytest.raises(httpx.ConnectError),
+    ):
+        client.get("http://service/")
+    assert balancer.replicas[0].failures == 1
+    assert balancer.replicas[0].outstanding == 0
+
+
+async def test_cancellation_is_not_failure() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await sleep(1.0)
+        return httpx.Response(200)
+
+    balancer = LoadBalancer(["http://a"], failure_threshold=1)
+    transport = AsyncLoadBalancingTransport(balancer, httpx.MockTransport(handler))
+    async with httpx.AsyncClient(transport=transport) as client:
+        task = create_task(client.get("http://service/"))
+        await sleep(0.01)
+        task.cancel()
+        with pytest.raises(CancelledError):
+            await task
+    (replica,) = balancer.replicas
+    assert replica.outstanding == 0
+    assert replica.failures == 0
+    assert replica.ejected_until == 0.0
+
+
+def test_no_endpoints() -> None:
+    with pytest.raises(LookupError):
+        LoadBalancer().acquire(_request())
+
+
+def test_reload_keeps_statistics() -> None:
+    balancer = LoadBalancer(["http://a", "http://b"])
+    replica = balancer.replicas[0]
+    replica.failures = 3
+    balancer.reload(["http://a", "http://c"])
+    assert balancer.replicas[0] is replica
+    assert [str(replica.url) for replica in balancer.replicas] == ["http://a", "http://c"]
+
+
+def test_from_file(tmp_path: Path) -> None:
+    path = tmp_path / "endpoints.txt"
+    path.write_text("# Replicas:\nhttp://a\n\nhttp://b  # the second one\n")
+    balancer = LoadBalancer.from_file(path, reload_interval=0.0)
+    assert [str(replica.url) for replica in balancer.replicas] == ["http://a", "http://b"]
+
+    path.write_text("http://c\n")
+    utime(path, (0.0, 0.0))  # make sure that the modification time changes
+    assert str(balancer.acquire(_request()).url) == "http://c"
+
+
+async def test_async_transport() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return _echo_host(request)
+
+    transport = AsyncLoadBalancingTransport(
+        LoadBalancer(["https://a", "https://b"]),
+        httpx.MockTransport(handler),
+    )
+    async with httpx.AsyncClient(base_url="http://service", transport=transport) as client:
+        response = await client.get("/")
+    assert response.text == "a:None service"
+    assert response.request.url == "https://a/"
+
+
+def test_from_file_keeps_last_endpoints(tmp_path: Path) -> None:
+    path = tmp_path / "endpoints.txt"
+    path.write_text("http://a\n")
+    balancer = LoadBalancer.from_file(path, reload_interval=0.0)
+
+    path.unlink()
+    assert str(balancer.acquire(_request()).url) == "http://a"
+
+    path.write_text("# No endpoints.\n")
+    assert str(balancer.acquire(_request()).url) == "http://a"
+
+
+def test_from_file_missing(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        LoadBalancer.from_file(tmp_path / "missing.txt")
@@ -0,0 +1,138 @@
+from abc import abstractmethod
+from pathlib import Path
+from typing import Protocol
+
+import httpx
+import pytest
+
+from combadge.core.response import SuccessfulResponse
+from combadge.support.http.markers import http_method, path
+from combadge.support.httpx.backends.async_ import HttpxBackend as AsyncHttpxBackend
+from combadge.support.httpx.backends.sync import HttpxBackend as SyncHttpxBackend
+from combadge.support.httpx.cache import BaseHttpCacheStorage, HttpCache, MemoryStorage, SqliteStorage
+
+
+class _Response(SuccessfulResponse):
+    value: int
+
+
+class _SupportsService(Protocol):
+    @http_method("GET")
+    @path("/value")
+    @abstractmethod
+    def get_value(self) -> _Response:
+        raise NotImplementedError
+
+
+class _SupportsAsyncService(Protocol):
+    @http_method("GET")
+    @path("/value")
+    @abstractmethod
+    async def get_value(self) -> _Response:
+        raise NotImplementedError
+
+
+class _Server:
+    def __init__(self, cache_control: str) -> None:
+        self.cache_control = cache_control
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        headers = {"ETag": '"v1"', "Cache-Control": self.cache_control}
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, json={"value": 42}, headers=headers)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def storage(request: pytest.FixtureRequest, tmp_path: Path) -> BaseHttpCacheStorage:
+    return MemoryStorage() if request.param == "memory" else SqliteStorage(tmp_path / "cache.db")
+
+
+def test_fresh(storage: BaseHttpCacheStorage) -> None:
+    server = _Server("max-age=60")
+    client = httpx.Client(base_url="https://example.com", transport=httpx.MockTransport(server))
+    service = SyncHttpxBackend(client, http_cache=HttpCache(storage))[_SupportsService]
+
+    assert service.get_value() == _Response(value=42)
+    assert service.get_value() == _Response(value=42)
+    assert len(server.requests) == 1
+
+
+def test_revalidate(storage: BaseHttpCacheStorage) -> None:
+    server = _Server("no-cache")
+    client = httpx.Client(base_url="https://example.com", transport=httpx.MockTransport(server))
+    service = SyncHttpxBackend(client, http_cache=HttpCache(storage))[_SupportsService]
+
+    assert service.get_value() == _Response(value=42)
+    assert service.get_value() == _Response(value=42)
+    assert len(server.requests) == 2
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_no_store() -> None:
+    server = _Server("no-store")
+    client = httpx.Client(base_url="https://example.com", transport=httpx.MockTransport(server))
+    service = SyncHttpxBackend(client, http_cache=HttpCache())[_SupportsService]
+
+    service.get_value()
+    service.get_value()
+    assert "If-None-Match" not in server.requests[1].headers
+
+
+async def test_async_revalidate() -> None:
+    server = _Server("max-age=0")
+    client = httpx.AsyncClient(base_url="https://example.com", transport=httpx.MockTransport(server))
+    service = AsyncHttpxBackend(client, http_cache=HttpCache())[_SupportsAsyncService]
+
+    assert await service.get_value() == _Response(value=42)
+    assert await service.get_value() == _Response(value=42)
+    assert len(server.requests) == 2
+
+
+def test_cached_result_not_shared() -> None:
+    server = _Server("max-age=60")
+    client = httpx.Client(base_url="https://example.com", transport=httpx.MockTransport(server))
+    service = SyncHttpxBackend(client, http_cache=HttpCache())[_SupportsService]
+
+    response = service.get_value()
+    response.value = 0
+    cached_response = service.get_value()
+    assert cached_response.value == 42, "the caller must not alter the cached result"
+    assert cached_response is not service.get_value()
+    assert len(server.requests) == 1
+
+
+def test_request_no_cache(storage: BaseHttpCacheStorage) -> None:
+    server = _Server("max-age=60")
+    client = httpx.Client(
+        base_url="https://example.com",
+        headers={"Cache-Control": "no-cache"},
+        transport=httpx.MockTransport(server),
+    )
+    service = SyncHttpxBackend(client, http_cache=HttpCache(storage))[_SupportsService]
+
+    assert service.get_value() == _Response(value=42)
+    assert service.get_value() == _Response(value=42)
+    assert len(server.requests) == 2, "the request forces the revalidation of the fresh response"
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_not_modified_replaces_stored_response() -> None:
+    server = _Server("no-cache")
+    storage = MemoryStorage()
+    client = httpx.Client(base_url="https://example.com", transport=httpx.MockTransport(server))
+    service = SyncHttpxBackend(client, http_cache=HttpCache(storage))[_SupportsService]
+
+    service.get_value()
+    stored = storage.get("GET https://example.com/value")
+    assert stored is not None
+    server.cache_control = "max-age=60"
+    service.get_value()
+
+    assert stored.fresh_until == 0.0, "the stored response must not be altered in place"
+    updated = storage.get("GET https://example.com/value")
+    assert updated is not None
+    assert updated is not stored
+    assert updated.fresh_until > 0.0
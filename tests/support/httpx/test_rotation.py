@@ -0,0 +1,83 @@
+from asyncio import gather
+from asyncio import sleep as async_sleep
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import httpx
+import pytest
+
+from combadge.support.httpx.rotation import AsyncRotatingTransport, RotatingTransport
+
+# The connections are only observable on a real server:
+pytestmark = pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+
+
+class _Server(ThreadingHTTPServer):
+    client_ports: list[int]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.server.client_ports.append(self.client_address[1])
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    with _Server(("127.0.0.1", 0), _Handler) as server:
+        server.client_ports = []
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+
+
+def _get_url(server: _Server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_max_requests(server: _Server) -> None:
+    with httpx.Client(base_url=_get_url(server), transport=RotatingTransport(max_requests=3, jitter=0.0)) as client:
+        for _ in range(7):
+            client.get("/").raise_for_status()
+    ports = server.client_ports
+    assert ports[0] == ports[1] == ports[2] != ports[3] == ports[4] == ports[5] != ports[6]
+
+
+def test_no_limits(server: _Server) -> None:
+    with httpx.Client(base_url=_get_url(server), transport=RotatingTransport()) as client:
+        for _ in range(5):
+            client.get("/").raise_for_status()
+    assert len(set(server.client_ports)) == 1
+
+
+async def test_max_lifetime(server: _Server) -> None:
+    transport = AsyncRotatingTransport(max_lifetime=0.05, jitter=0.0)
+    async with httpx.AsyncClient(base_url=_get_url(server), transport=transport) as client:
+        (await client.get("/")).raise_for_status()
+        (await client.get("/")).raise_for_status()
+        await async_sleep(0.1)
+        (await client.get("/")).raise_for_status()
+    ports = server.client_ports
+    assert ports[0] == ports[1] != ports[2]
+
+
+async def test_in_flight_requests(server: _Server) -> None:
+    transport = AsyncRotatingTransport(max_requests=1, jitter=0.5)
+    async with httpx.AsyncClient(base_url=_get_url(server), transport=transport) as client:
+        responses = await gather(*(client.get("/") for _ in range(10)))
+    assert all(response.status_code == 200 for response in responses)
+
+
+def test_invalid_jitter() -> None:
+    with pytest.raises(ValueError, match="jitter"):
+        RotatingTransport(jitter=1.0)
@@ -0,0 +1,87 @@
+from abc import abstractmethod
+from typing import Protocol
+
+import httpx
+import pytest
+
+from combadge.core.errors import BackendError
+from combadge.core.response import SuccessfulResponse
+from combadge.support.http.markers import http_method, path
+from combadge.support.httpx.backends.sync import HttpxBackend
+from combadge.support.httpx.timeouts import AdaptiveTimeout
+
+
+class _Response(SuccessfulResponse):
+    pass
+
+
+class _SupportsService(Protocol):
+    @http_method("GET")
+    @path("/fast")
+    @abstractmethod
+    def get_fast(self) -> _Response:
+        raise NotImplementedError
+
+    @http_method("GET")
+    @path("/slow")
+    @abstractmethod
+    def get_slow(self) -> _Response:
+        raise NotImplementedError
+
+
+def test_not_enough_samples() -> None:
+    timeout = AdaptiveTimeout(min_samples=2)
+    timeout.observe("method", 1.0)
+    assert timeout.get_timeout("method") is None
+    assert timeout.get_timeout("other") is None
+
+
+def test_bounds() -> None:
+    timeout = AdaptiveTimeout(percentile=1.0, multiplier=2.0, min_timeout=0.5, max_timeout=10.0, min_samples=1)
+    timeout.observe("fast", 0.01)
+    timeout.observe("medium", 1.0)
+    timeout.observe("slow", 60.0)
+    assert timeout.get_timeout("fast") == 0.5
+    assert timeout.get_timeout("medium") == 2.0
+    assert timeout.get_timeout("slow") == 10.0
+
+
+def test_backend() -> None:
+    read_timeouts: dict[str, list[float | None]] = {"/fast": [], "/slow": []}
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        read_timeouts[request.url.path].append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json={})
+
+    adaptive_timeout = AdaptiveTimeout(min_timeout=10.0, min_samples=2)
+    backend = HttpxBackend(
+        httpx.Client(base_url="https://example.com", transport=httpx.MockTransport(handle), timeout=30.0),
+        adaptive_timeout=adaptive_timeout,
+    )
+    service = backend[_SupportsService]
+    for _ in range(3):
+        service.get_fast()
+    service.get_slow()
+    assert read_timeouts == {"/fast": [30.0, 30.0, 10.0], "/slow": [30.0]}
+
+
+def test_backend_ignores_transport_errors() -> None:
+    errors: list[Exception] = [httpx.ConnectError("refused"), httpx.ReadTimeout("timed out")]
+    read_timeouts: list[float | None] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        read_timeouts.append(request.extensions["timeout"]["read"])
+        if errors:
+            raise errors.pop(0)
+        return httpx.Response(200, json={})
+
+    service = HttpxBackend(
+        httpx.Client(base_url="https://example.com", transport=httpx.MockTransport(handle), timeout=30.0),
+        adaptive_timeout=AdaptiveTimeout(min_timeout=0.5, min_samples=1),
+    )[_SupportsService]
+    with pytest.raises(BackendError):
+        service.get_fast()  # the instant failure is not a latency sample
+    with pytest.raises(BackendError):
+        service.get_fast()  # the timeout is
+    service.get_fast()
+    assert read_timeouts == [30.0, 30.0, 0.5]
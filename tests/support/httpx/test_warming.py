@@ -0,0 +1,78 @@
+from asyncio import sleep
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import httpx
+import pytest
+
+from combadge._helpers.httpx import count_idle_connections
+from combadge.support.httpx.backends.async_ import HttpxBackend
+from combadge.support.httpx.backends.sync import HttpxBackend as SyncHttpxBackend
+
+# The pooled connections are only observable on a real server:
+pytestmark = pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+
+
+class _Server(ThreadingHTTPServer):
+    n_requests: int
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self.server.n_requests += 1
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    with _Server(("127.0.0.1", 0), _Handler) as server:
+        server.n_requests = 0
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+
+
+def _get_url(server: _Server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_count_idle_connections(server: _Server) -> None:
+    with httpx.Client(base_url=_get_url(server)) as client:
+        backend = SyncHttpxBackend(client)
+        assert count_idle_connections(client, client.base_url) == 0
+        assert backend.warm_connections(3) == 3
+        assert count_idle_connections(client, client.base_url) == 3
+        assert count_idle_connections(client, "http://127.0.0.1:1") == 0, "another origin"
+
+
+def test_count_idle_connections_unknown_pool() -> None:
+    client = httpx.Client(transport=httpx.MockTransport(lambda _: httpx.Response(200)))
+    assert count_idle_connections(client, "https://example.com") == 0
+
+
+def test_keep_connections_warm_tops_up(server: _Server) -> None:
+    with httpx.Client(base_url=_get_url(server)) as client:
+        backend = SyncHttpxBackend(client)
+        assert backend.warm_connections(2) == 2
+        with backend.keep_connections_warm(3, interval=60.0):
+            pass  # the first warm-up is always performed
+        assert count_idle_connections(client, client.base_url) == 3
+
+
+async def test_keep_connections_warm_skips_async(server: _Server) -> None:
+    async with httpx.AsyncClient(base_url=_get_url(server)) as client:
+        backend = HttpxBackend(client)
+        assert await backend.warm_connections(3) == 3
+        async with backend.keep_connections_warm(3, interval=60.0):
+            await sleep(0.05)
+        assert server.n_requests == 3, "the pool already has enough idle connections"
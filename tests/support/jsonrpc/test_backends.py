@@ -0,0 +1,150 @@
+import json
+from abc import abstractmethod
+from asyncio import CancelledError, all_tasks, gather, sleep, wait_for
+from typing import Annotated, Any, Literal, Protocol
+
+import httpx
+import pytest
+
+from combadge.core.deadline import deadline
+from combadge.core.errors import BackendError
+from combadge.support.http.markers import Field
+from combadge.support.jsonrpc.backends.async_ import JsonRpcBackend as AsyncJsonRpcBackend
+from combadge.support.jsonrpc.backends.sync import JsonRpcBackend as SyncJsonRpcBackend
+from combadge.support.jsonrpc.markers import method_name
+from combadge.support.jsonrpc.response import JsonRpcError
+
+
+class _DivisionByZeroError(JsonRpcError):
+    code: Literal[-1]
+
+
+class _SupportsCalculator(Protocol):
+    @method_name("divide")
+    @abstractmethod
+    def divide(
+        self,
+        dividend: Annotated[int, Field("dividend")],
+        divisor: Annotated[int, Field("divisor")],
+    ) -> float | _DivisionByZeroError | JsonRpcError:
+        raise NotImplementedError
+
+
+class _SupportsAsyncCalculator(Protocol):
+    @method_name("divide")
+    @abstractmethod
+    async def divide(
+        self,
+        dividend: Annotated[int, Field("dividend")],
+        divisor: Annotated[int, Field("divisor")],
+    ) -> float | _DivisionByZeroError | JsonRpcError:
+        raise NotImplementedError
+
+
+def _call(envelope: dict[str, Any]) -> dict[str, Any]:
+    assert envelope["jsonrpc"] == "2.0"
+    if envelope["method"] != "divide":
+        return {"jsonrpc": "2.0", "id": envelope["id"], "error": {"code": -32601, "message": "Method not found"}}
+    params = envelope["params"]
+    if params["divisor"] == 0:
+        return {"jsonrpc": "2.0", "id": envelope["id"], "error": {"code": -1, "message": "Division by zero"}}
+    return {"jsonrpc": "2.0", "id": envelope["id"], "result": params["dividend"] / params["divisor"]}
+
+
+class _Server:
+    def __init__(self) -> None:
+        self.requests: list[Any] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/rpc"
+        body = json.loads(request.content)
+        self.requests.append(body)
+        if isinstance(body, list):
+            return httpx.Response(200, json=[_call(envelope) for envelope in reversed(body)])
+        return httpx.Response(200, json=_call(body))
+
+
+def test_sync_result() -> None:
+    server = _Server()
+    client = httpx.Client(base_url="https://example.com", transport=httpx.MockTransport(server))
+    service = SyncJsonRpcBackend(client, endpoint="/rpc")[_SupportsCalculator]
+
+    assert service.divide(42, 2) == 21.0
+    assert server.requests == [
+        {"jsonrpc": "2.0", "method": "divide", "params": {"dividend": 42, "divisor": 2}, "id": 1},
+    ]
+
+
+def test_sync_error() -> None:
+    client = httpx.Client(base_url="https://example.com", transport=httpx.MockTransport(_Server()))
+    service = SyncJsonRpcBackend(client, endpoint="/rpc")[_SupportsCalculator]
+
+    assert service.divide(42, 0) == _DivisionByZeroError(code=-1, message="Division by zero")
+
+
+def test_invalid_response() -> None:
+    client = httpx.Client(transport=httpx.MockTransport(lambda _: httpx.Response(200, json={"result": 42})))
+    service = SyncJsonRpcBackend(client)[_SupportsCalculator]
+
+    with pytest.raises(BackendError):
+        service.divide(42, 2)
+
+
+async def test_async_batch() -> None:
+    server = _Server()
+    client = httpx.AsyncClient(base_url="https://example.com", transport=httpx.MockTransport(server))
+    service = AsyncJsonRpcBackend(client, endpoint="/rpc", batch_window=0.0)[_SupportsAsyncCalculator]
+
+    results = await gather(service.divide(42, 2), service.divide(42, 0), service.divide(9, 3))
+    assert results == [21.0, _DivisionByZeroError(code=-1, message="Division by zero"), 3.0]
+    assert len(server.requests) == 1
+    assert len(server.requests[0]) == 3
+
+
+async def test_async_unbatched() -> None:
+    server = _Server()
+    client = httpx.AsyncClient(base_url="https://example.com", transport=httpx.MockTransport(server))
+    service = AsyncJsonRpcBackend(client, endpoint="/rpc")[_SupportsAsyncCalculator]
+
+    assert await gather(service.divide(42, 2), service.divide(9, 3)) == [21.0, 3.0]
+    assert len(server.requests) == 2
+
+
+async def test_async_batch_timeout() -> None:
+    timeouts: list[dict[str, float | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return _Server()(request)
+
+    client = httpx.AsyncClient(base_url="https://example.com", transport=httpx.MockTransport(handler), timeout=30.0)
+    service = AsyncJsonRpcBackend(client, endpoint="/rpc", batch_window=0.0)[_SupportsAsyncCalculator]
+
+    async def divide_with_deadline(timeout: float) -> Any:
+        with deadline(timeout):
+            return await service.divide(42, 2)
+
+    assert await gather(divide_with_deadline(1.0), divide_with_deadline(2.0)) == [21.0, 21.0]
+    assert len(timeouts) == 1
+    read_timeout = timeouts[0]["read"]
+    assert read_timeout is not None
+    assert 1.0 < read_timeout <= 2.0, "the batch request should get the longest of the calls' timeouts"
+
+
+async def test_async_batch_cancelled() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await sleep(10.0)
+        raise NotImplementedError
+
+    client = httpx.AsyncClient(base_url="https://example.com", transport=httpx.MockTransport(handler))
+    service = AsyncJsonRpcBackend(client, endpoint="/rpc", batch_window=0.0)[_SupportsAsyncCalculator]
+
+    callers = gather(service.divide(42, 2), service.divide(9, 3), return_exceptions=True)
+    await sleep(0.01)
+    (batch,) = (
+        task for task in all_tasks() if getattr(task.get_coro(), "__qualname__", None) == "JsonRpcBackend._send_batch"
+    )
+    batch.cancel()
+
+    results = await wait_for(callers, 1.0)
+    assert all(isinstance(result, CancelledError) for result in results), "the callers must not hang"
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import Literal, Union
 
 import pytest
 
 from combadge.support.soap.response import BaseSoapFault
-from combadge.support.zeep.backends.base import BaseZeepBackend
+from combadge.support.zeep.backends.base import BaseZeepBackend, SoapFaultIndex
 
 
 class _TestFault1(BaseSoapFault): ...
@@ -14,22 +14,95 @@ class _TestFault1(BaseSoapFault): ...
 class _TestFault2(BaseSoapFault): ...
 
 
+class _ClientFault(BaseSoapFault):
+    code: Literal["SOAP-ENV:Client"]
+
+
+class _ServerFault(BaseSoapFault):
+    code: Literal["SOAP-ENV:Server"]
+    message: Literal["Server Fault"]
+
+
+class _AnotherServerFault(BaseSoapFault):
+    code: Literal["SOAP-ENV:Server"]
+    message: Literal["Another Server Fault"]
+
+
+class _CodeFault(BaseSoapFault):
+    code: str
+
+
 @pytest.mark.parametrize(
-    ("response_type", "expected_response_type", "expected_fault_type"),
+    ("response_type", "expected_response_type", "expected_fault_types"),
     [
-        (int, int, BaseSoapFault),
-        (None, None, BaseSoapFault),
+        (int, int, (BaseSoapFault,)),
+        (None, None, (BaseSoapFault,)),
         (
             Union[int, _TestFault1, _TestFault2],  # noqa: UP007
             int,
-            Union[_TestFault1, _TestFault2, BaseSoapFault],  # noqa: UP007
+            (_TestFault1, _TestFault2),
         ),
         (
             int | _TestFault1 | _TestFault2,
             int,
-            Union[_TestFault1, _TestFault2, BaseSoapFault],  # noqa: UP007
+            (_TestFault1, _TestFault2),
         ),
     ],
 )
-def test_split_response_type(response_type: type, expected_response_type: type, expected_fault_type: type) -> None:
-    assert BaseZeepBackend._split_response_type(response_type) == (expected_response_type, expected_fault_type)
+def test_split_response_type(
+    response_type: type,
+    expected_response_type: type,
+    expected_fault_types: tuple[type[BaseSoapFault], ...],
+) -> None:
+    actual_response_type, fault_index = BaseZeepBackend._split_response_type(response_type)
+    assert actual_response_type == expected_response_type
+    assert type(fault_index.parse({"code": "SOAP-ENV:Client", "message": "whatever"})) in expected_fault_types
+
+
+@pytest.mark.parametrize(
+    ("fault", "expected_type"),
+    [
+        ({"code": "SOAP-ENV:Client", "message": "whatever"}, _ClientFault),
+        ({"code": "SOAP-ENV:Server", "message": "Server Fault"}, _ServerFault),
+        ({"code": "SOAP-ENV:Server", "message": "Another Server Fault"}, _AnotherServerFault),
+        ({"code": "SOAP-ENV:Server", "message": "Unknown"}, BaseSoapFault),
+    ],
+)
+def test_split_response_type_indexed(fault: dict, expected_type: type[BaseSoapFault]) -> None:
+    _, fault_index = BaseZeepBackend._split_response_type(
+        int | _ClientFault | _ServerFault | _AnotherServerFault | BaseSoapFault,
+    )
+    assert type(fault_index.parse(fault)) is expected_type
+
+
+@pytest.mark.parametrize(
+    ("fault", "expected_type"),
+    [
+        ({"code": "SOAP-ENV:Client", "message": "whatever"}, _ClientFault),
+        ({"code": "SOAP-ENV:Server", "message": "Server Fault"}, _ServerFault),
+        ({"code": "SOAP-ENV:Server", "message": "Another Server Fault"}, _AnotherServerFault),
+        ({"code": "SOAP-ENV:Server", "message": "Unknown"}, _TestFault1),
+        ({"code": "Unknown", "message": "Unknown"}, _TestFault1),
+    ],
+)
+def test_parse_indexed(fault: dict, expected_type: type[BaseSoapFault]) -> None:
+    fault_index = SoapFaultIndex.from_types([_ClientFault, _ServerFault, _AnotherServerFault, _TestFault1])
+    assert type(fault_index.parse(fault)) is expected_type
+
+
+def test_parse_fallback() -> None:
+    fault_index = SoapFaultIndex.from_types([_ClientFault])
+    assert type(fault_index.parse({"code": "SOAP-ENV:Server", "message": "Server Fault"})) is BaseSoapFault
+
+
+@pytest.mark.parametrize(
+    ("fault", "expected_type"),
+    [
+        ({"code": "SOAP-ENV:Client", "message": "whatever"}, _ClientFault),
+        ({"code": "SOAP-ENV:Server", "message": "Server Fault"}, _CodeFault),
+    ],
+)
+def test_parse_non_literal_code(fault: dict, expected_type: type[BaseSoapFault]) -> None:
+    """A code without a `Literal` annotation is not indexed, and matches any fault."""
+    fault_index = SoapFaultIndex.from_types([_CodeFault, _ClientFault])
+    assert type(fault_index.parse(fault)) is expected_type
@@ -0,0 +1,222 @@
+from abc import abstractmethod
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+from typing import Annotated, Protocol
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import requests
+from zeep import AsyncClient, Client, Transport
+from zeep.transports import AsyncTransport
+
+from combadge.core.concurrency import ConcurrencyLimiter, FixedLimit
+from combadge.core.deadline import deadline
+from combadge.core.errors import LimitExceededError
+from combadge.support.http.markers import Field
+from combadge.support.soap.markers import operation_name
+from combadge.support.zeep.backends.async_ import ZeepBackend as AsyncZeepBackend
+from combadge.support.zeep.backends.base import ByServiceName
+from combadge.support.zeep.backends.sync import ZeepBackend as SyncZeepBackend
+from combadge.support.zeep.transports import AsyncHttpxTransport, HttpxTransport
+
+_WSDL_PATH = Path(__file__).parent.parent.parent / "integration" / "wsdl" / "NumberConversion.wsdl"
+
+_RESPONSE = """<?xml version="1.0" encoding="utf-8"?>
+<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
+  <soap:Body>
+    <m:NumberToWordsResponse xmlns:m="http://www.dataaccess.com/webservicesserver/">
+      <m:NumberToWordsResult>forty two </m:NumberToWordsResult>
+    </m:NumberToWordsResponse>
+  </soap:Body>
+</soap:Envelope>"""
+
+
+class SupportsNumberConversion(Protocol):
+    @operation_name("NumberToWords")
+    @abstractmethod
+    def number_to_words(self, number: Annotated[int, Field("ubiNum")]) -> str:
+        raise NotImplementedError
+
+
+def _handle(request: httpx.Request) -> httpx.Response:
+    assert request.headers["User-Agent"].startswith("Zeep/")
+    return httpx.Response(200, text=_RESPONSE, headers={"Content-Type": "text/xml; charset=utf-8"})
+
+
+def test_httpx_transport() -> None:
+    transport = HttpxTransport(httpx.Client(transport=httpx.MockTransport(_handle)))
+    client = Client(str(_WSDL_PATH), transport=transport, port_name="NumberConversionSoap")
+    service = SyncZeepBackend(client.service)[SupportsNumberConversion]
+    assert service.number_to_words(42) == "forty two "
+
+
+def test_sync_with_limits() -> None:
+    backend = SyncZeepBackend.with_params(_WSDL_PATH, limits=httpx.Limits(max_connections=42))
+    assert isinstance(backend._service._client.transport, HttpxTransport)
+
+
+def test_sync_shared_transport() -> None:
+    transport = HttpxTransport(httpx.Client())
+    backend_1 = SyncZeepBackend.with_params(_WSDL_PATH, transport=transport)
+    backend_2 = SyncZeepBackend.with_params(_WSDL_PATH, transport=transport)
+    assert backend_1._service._client.transport is backend_2._service._client.transport
+
+
+def test_shared_transport_stays_open() -> None:
+    transport = HttpxTransport(httpx.Client(transport=httpx.MockTransport(_handle)))
+    with Client(str(_WSDL_PATH), transport=transport, port_name="NumberConversionSoap"):
+        pass
+    assert not transport.client.is_closed, "exiting a Zeep client must not close the shared HTTPX client"
+
+    backend = SyncZeepBackend.with_params(_WSDL_PATH, limits=httpx.Limits(max_connections=42))
+    owned_transport = backend._service._client.transport
+    owned_transport.close()
+    assert owned_transport.client.is_closed, "the transport created by the backend owns its clients"
+
+
+def test_async_shared_transport() -> None:
+    backend_1 = AsyncZeepBackend.with_params(_WSDL_PATH, limits=httpx.Limits(max_keepalive_connections=10))
+    transport = backend_1._service._client.transport
+    backend_2 = AsyncZeepBackend.with_params(_WSDL_PATH, transport=transport)
+    assert backend_2._service._client.transport is transport
+
+
+async def test_async_shared_transport_stays_open() -> None:
+    transport = AsyncHttpxTransport(httpx.AsyncClient(transport=httpx.MockTransport(_handle)))
+    service = ByServiceName(port_name="NumberConversionSoap")
+    backend_1 = AsyncZeepBackend.with_params(_WSDL_PATH, service=service, transport=transport)
+    backend_2 = AsyncZeepBackend.with_params(_WSDL_PATH, service=service, transport=transport)
+
+    client_1: AsyncClient = backend_1._service._client
+    async with client_1:
+        pass
+    assert not transport.client.is_closed, "exiting a Zeep client must not close the shared HTTPX client"
+    assert await backend_2[_SupportsAsyncNumberConversion].number_to_words(42) == "forty two "
+
+    owned_transport = AsyncZeepBackend.with_params(_WSDL_PATH)._service._client.transport
+    await owned_transport.aclose()
+    assert owned_transport.client.is_closed, "the transport created by the backend owns its clients"
+    assert owned_transport.wsdl_client.is_closed
+
+
+def test_httpx_transport_deadline() -> None:
+    timeouts: list[dict[str, float | None]] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return _handle(request)
+
+    transport = HttpxTransport(httpx.Client(transport=httpx.MockTransport(handle)), operation_timeout=5.0)
+    client = Client(str(_WSDL_PATH), transport=transport, port_name="NumberConversionSoap")
+    service = SyncZeepBackend(client.service)[SupportsNumberConversion]
+    with deadline(1.0):
+        service.number_to_words(42)
+    read_timeout = timeouts[-1]["read"]
+    assert read_timeout is not None
+    assert 0.0 < read_timeout <= 1.0
+
+
+def test_requests_transport_deadline() -> None:
+    backend = SyncZeepBackend.with_params(
+        _WSDL_PATH,
+        service=ByServiceName(port_name="NumberConversionSoap"),
+        operation_timeout=5.0,
+    )
+    transport = backend._service._client.transport
+    response = requests.Response()
+    response._content = _RESPONSE.encode()
+    response.status_code = 200
+    response.headers["Content-Type"] = "text/xml; charset=utf-8"
+    transport.session.post = Mock(return_value=response)
+
+    service = backend[SupportsNumberConversion]
+    assert service.number_to_words(42) == "forty two "
+    assert transport.session.post.call_args.kwargs["timeout"] == 5.0
+    with deadline(1.0):
+        assert service.number_to_words(42) == "forty two "
+    assert 0.0 < transport.session.post.call_args.kwargs["timeout"] <= 1.0
+    assert transport.operation_timeout == 5.0, "the deadline must not alter the transport"
+
+
+def test_warm_connections() -> None:
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(405)
+
+    transport = HttpxTransport(httpx.Client(transport=httpx.MockTransport(handle)))
+    client = Client(str(_WSDL_PATH), transport=transport, port_name="NumberConversionSoap")
+    assert SyncZeepBackend(client.service).warm_connections(2) == 2
+    assert [(request.method, request.url) for request in requests] == [
+        ("HEAD", "https://www.dataaccess.com/webservicesserver/NumberConversion.wso"),
+    ] * 2
+
+
+async def test_warm_connections_async() -> None:
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    backend = AsyncZeepBackend.with_params(
+        _WSDL_PATH,
+        transport=AsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handle))),
+    )
+    assert await backend.warm_connections(2, address="https://example.com/soap") == 2
+    assert [request.url for request in requests] == ["https://example.com/soap"] * 2
+
+
+class _SupportsAsyncNumberConversion(Protocol):
+    @operation_name("NumberToWords")
+    @abstractmethod
+    async def number_to_words(self, number: Annotated[int, Field("ubiNum")]) -> str:
+        raise NotImplementedError
+
+
+async def test_async_concurrency_limit_exceeded() -> None:
+    limiter = ConcurrencyLimiter(FixedLimit(1), max_queue_size=0)
+    backend = AsyncZeepBackend.with_params(
+        _WSDL_PATH,
+        service=ByServiceName(port_name="NumberConversionSoap"),
+        transport=AsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(_handle))),
+        concurrency_limiter=limiter,
+    )
+    service = backend[_SupportsAsyncNumberConversion]
+    assert await service.number_to_words(42) == "forty two "
+    async with limiter.acquire():
+        with pytest.raises(LimitExceededError):  # not wrapped into `BackendError`
+            await service.number_to_words(42)
+
+
+class _HeadHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    with ThreadingHTTPServer(("127.0.0.1", 0), _HeadHandler) as server:
+        Thread(target=server.serve_forever, daemon=True).start()
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+        server.shutdown()
+
+
+@pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+def test_count_idle_connections_requests(server_url: str) -> None:
+    client = Client(str(_WSDL_PATH), transport=Transport(), port_name="NumberConversionSoap")
+    backend = SyncZeepBackend(client.service)
+    assert backend._count_idle_connections(server_url) == 0
+    assert backend.warm_connections(3, address=server_url) == 3
+    assert backend._count_idle_connections(server_url) == 3